@@ -1,3 +1,3 @@
-from .office_anonymizer_wrapper import UnsupportedScopeError, run, run_request
+from .office_anonymizer_wrapper import UnsupportedScopeError, run, run_request, run_request_via_daemon
 
-__all__ = ["UnsupportedScopeError", "run", "run_request"]
+__all__ = ["UnsupportedScopeError", "run", "run_request", "run_request_via_daemon"]
@@ -6,6 +6,27 @@ Design contract:
 - write_expires_at() stores a sentinel timestamp; janitor_sweep() enforces it.
 - janitor_sweep() also removes orphan run dirs older than DEFAULT_MAX_AGE_DAYS.
 - set_mode_0600(path) is a thin helper for single-file artifacts.
+- write_cache_entry()/read_cache_entry() keep keyed cross-run results (codex
+  image outcomes, candidate scans) in 0700 subdirectories; each entry carries its own expiry and
+  janitor_sweep() prunes expired entries instead of removing the directory.
+- A 0600 ``index.json`` manifest records every run dir and keyed entry with its
+  size, expiry and last use. janitor_sweep() consults it instead of walking the
+  tree, then evicts least-recently-used keyed entries while the total exceeds
+  the byte quota (DEFAULT_MAX_CACHE_BYTES, or $OFFICE_ANONYMIZER_CACHE_MAX_BYTES).
+  Run dirs are never evicted for quota: they only go by expiry or age. A full
+  walk still runs when the manifest is missing or once per
+  FULL_SWEEP_INTERVAL_SEC, so untracked or legacy directories keep the same
+  retention rules. Only directories directly under the cache base are tracked;
+  a caller-supplied cache_dir elsewhere gets no manifest. Keyed-entry writes
+  and cache-hit ``last_used`` touches are batched in memory and written once
+  per _ENTRY_FLUSH_BATCH entries or _MANIFEST_FLUSH_INTERVAL_SEC, at exit, and
+  whenever the manifest is rewritten anyway.
+- store_backup() keeps post-pass backups content-addressed in the
+  ``backup-objects/`` keyed cache (cloned with reflink/copy_file_range where
+  the filesystem allows) and hardlinks them into the run dir, so identical
+  backups across runs occupy the disk once. The store entry owns those bytes
+  for the quota; it is neither expired nor evicted while a run dir still links
+  it, and cleanup_runid() drops the objects no remaining run dir links.
 
 The sweep and permissions are security-relevant: candidate summaries and codex
 logs contain raw-identifier context and must never leak onto a shared disk.
@@ -13,18 +34,49 @@ logs contain raw-identifier context and must never leak onto a shared disk.
 
 from __future__ import annotations
 
+import atexit
+import contextlib
+import hashlib
+import json
 import os
 import shutil
 import sys
 import tempfile
+import threading
 import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
 
 
 DEFAULT_RETENTION_DAYS = 14
 DEFAULT_MAX_AGE_DAYS = 30
 _EXPIRES_AT_SENTINEL = "expires_at"
+IMAGE_RESULT_CACHE_DIRNAME = "image-results"
+CANDIDATE_SCAN_CACHE_DIRNAME = "candidate-scans"
+BACKUP_STORE_DIRNAME = "backup-objects"
+_KEYED_CACHE_DIRNAMES = frozenset({IMAGE_RESULT_CACHE_DIRNAME, CANDIDATE_SCAN_CACHE_DIRNAME, BACKUP_STORE_DIRNAME})
+_ENTRY_META_SUFFIX = ".json"
+_ENTRY_PAYLOAD_SUFFIX = ".bin"
+DEFAULT_MAX_CACHE_BYTES = 5 * 1024**3
+CACHE_QUOTA_ENV_VAR = "OFFICE_ANONYMIZER_CACHE_MAX_BYTES"
+FULL_SWEEP_INTERVAL_SEC = 86400
+MANIFEST_FILENAME = "index.json"
+_MANIFEST_LOCK_FILENAME = ".index.lock"
+_MANIFEST_VERSION = 1
+_MANIFEST_FLUSH_INTERVAL_SEC = 60.0
+_ENTRY_FLUSH_BATCH = 64
+# {cache base: {manifest item name: item}} keyed-entry writes not yet in index.json.
+_pending_entries: dict[str, dict[str, dict]] = {}
+# {cache base: {manifest item name: last_used}} cache-hit touches not yet in index.json.
+_pending_touches: dict[str, dict[str, float]] = {}
+_pending_lock = threading.Lock()
+_last_manifest_flush = float("-inf")
 
 
 def resolve_cache_base() -> Path:
@@ -63,9 +115,130 @@ def mkdtemp_run(prefix: str = "oa-") -> Path:
     base = ensure_cache_base()
     path = Path(tempfile.mkdtemp(prefix=prefix, dir=str(base)))
     os.chmod(path, 0o700)
+    _record_manifest_item(base, path.name, kind="run", size=0)
+    return path
+
+
+def ensure_keyed_cache(name: str = IMAGE_RESULT_CACHE_DIRNAME) -> Path:
+    """Create (or reuse) a persistent keyed-entry directory under the cache base, chmod 0700."""
+    if name not in _KEYED_CACHE_DIRNAMES:
+        raise ValueError(f"unknown keyed cache {name!r}")
+    path = ensure_cache_base() / name
+    path.mkdir(exist_ok=True)
+    os.chmod(path, 0o700)
     return path
 
 
+def write_cache_entry(
+    cache_dir: Path,
+    key: str,
+    meta: dict,
+    payload: bytes | Path | None = None,
+    *,
+    days: int = DEFAULT_RETENTION_DAYS,
+) -> Path:
+    """Atomically store ``meta`` (plus optional ``payload``) under ``key`` with 0600 files.
+
+    ``payload`` is either bytes or the path of a file to clone in. It is
+    written first, so a reader that sees the metadata always finds its payload
+    too. The manifest item is queued rather than written here (see
+    _queue_manifest_entry), so a run storing N entries rewrites index.json
+    about N / _ENTRY_FLUSH_BATCH times instead of N.
+    """
+    _validate_entry_key(key)
+    payload_size = 0
+    if isinstance(payload, Path):
+        payload_size = _atomic_clone_file(payload, cache_dir / f"{key}{_ENTRY_PAYLOAD_SUFFIX}")
+    elif payload is not None:
+        _atomic_write_bytes(cache_dir / f"{key}{_ENTRY_PAYLOAD_SUFFIX}", payload)
+        payload_size = len(payload)
+    record = dict(meta)
+    record["has_payload"] = payload is not None
+    record[_EXPIRES_AT_SENTINEL] = (datetime.now(timezone.utc) + timedelta(days=days)).isoformat()
+    meta_path = cache_dir / f"{key}{_ENTRY_META_SUFFIX}"
+    meta_bytes = json.dumps(record, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    _atomic_write_bytes(meta_path, meta_bytes)
+    base = _managed_base(cache_dir)
+    if base is not None:
+        _queue_manifest_entry(
+            base,
+            f"{cache_dir.name}/{key}",
+            size=len(meta_bytes) + payload_size,
+            expires_at=record[_EXPIRES_AT_SENTINEL],
+        )
+    return meta_path
+
+
+def read_cache_entry(
+    cache_dir: Path, key: str, *, load_payload: bool = True
+) -> tuple[dict, bytes | None] | None:
+    """Return ``(meta, payload)`` for a live entry, or None when missing, expired, or torn.
+
+    With ``load_payload=False`` the payload file is only checked for existence
+    and ``None`` is returned in its place.
+    """
+    _validate_entry_key(key)
+    meta_path = cache_dir / f"{key}{_ENTRY_META_SUFFIX}"
+    try:
+        record = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(record, dict) or _entry_expired(record, now=datetime.now(timezone.utc)):
+        return None
+    payload = None
+    if record.get("has_payload"):
+        payload_path = cache_dir / f"{key}{_ENTRY_PAYLOAD_SUFFIX}"
+        try:
+            if load_payload:
+                payload = payload_path.read_bytes()
+            elif not payload_path.is_file():
+                return None
+        except OSError:
+            return None
+    base = _managed_base(cache_dir)
+    if base is not None:
+        _touch_manifest_item(base, f"{cache_dir.name}/{key}")
+    return record, payload
+
+
+def store_backup(source: Path, backup_path: Path, *, days: int = DEFAULT_RETENTION_DAYS) -> Path:
+    """Place a backup of ``source`` at ``backup_path``, de-duplicated by content hash.
+
+    De-duplication only applies when ``backup_path`` lies inside the cache
+    base (e.g. a run dir from mkdtemp_run()): the bytes are kept once in the
+    ``backup-objects/`` keyed cache (cloned, so reflink-capable filesystems
+    share extents with ``source``) and ``backup_path`` becomes a hardlink to
+    that object. Objects are never modified after they are written; where
+    hardlinks are unavailable the object is cloned into place instead.
+
+    A ``backup_path`` outside the cache base is a plain clone of ``source``
+    and nothing is written to the cache, so the backup bytes stay under the
+    directory the caller chose. Returns ``backup_path``.
+    """
+    from office_automation.common.files import clone_file  # local import: sibling package
+
+    source = Path(source)
+    backup_path = Path(backup_path)
+    backup_path.parent.mkdir(parents=True, exist_ok=True)
+    backup_path.unlink(missing_ok=True)
+    if not backup_path.resolve().is_relative_to(resolve_cache_base().resolve()):
+        clone_file(source, backup_path)
+        set_mode_0600(backup_path)
+        return backup_path
+    digest = _file_sha256(source)
+    store_dir = ensure_keyed_cache(BACKUP_STORE_DIRNAME)
+    if read_cache_entry(store_dir, digest, load_payload=False) is None:
+        write_cache_entry(store_dir, digest, {"size": source.stat().st_size}, source, days=days)
+    object_path = store_dir / f"{digest}{_ENTRY_PAYLOAD_SUFFIX}"
+    try:
+        os.link(object_path, backup_path)
+    except OSError:
+        # No hardlinks here (or the object was swept meanwhile): clone the source.
+        clone_file(source, backup_path)
+    set_mode_0600(backup_path)
+    return backup_path
+
+
 def write_expires_at(run_dir: Path, days: int = DEFAULT_RETENTION_DAYS) -> Path:
     """Record an expiry timestamp sentinel inside a run dir.
 
@@ -76,9 +249,27 @@ def write_expires_at(run_dir: Path, days: int = DEFAULT_RETENTION_DAYS) -> Path:
     sentinel = run_dir / _EXPIRES_AT_SENTINEL
     sentinel.write_text(expiry.isoformat(), encoding="utf-8")
     os.chmod(sentinel, 0o600)
+    base = _managed_base(run_dir)
+    if base is not None:
+        _record_manifest_item(base, run_dir.name, kind="run", expires_at=expiry.isoformat())
     return sentinel
 
 
+def record_run_usage(run_dir: Path) -> None:
+    """Refresh a run dir's size and last-use time in the manifest (drops it if the dir is gone).
+
+    Walks only ``run_dir``; call it when an invocation stops writing into it.
+    """
+    run_dir = Path(run_dir)
+    base = _managed_base(run_dir)
+    if base is None:
+        return
+    if not run_dir.is_dir():
+        _forget_manifest_items(base, [run_dir.name])
+        return
+    _record_manifest_item(base, run_dir.name, kind="run", size=_tree_size(run_dir))
+
+
 def set_mode_0600(path: Path) -> None:
     try:
         os.chmod(path, 0o600)
@@ -86,21 +277,122 @@ def set_mode_0600(path: Path) -> None:
         pass
 
 
-def janitor_sweep(max_age_days: int = DEFAULT_MAX_AGE_DAYS) -> list[Path]:
-    """Remove run dirs that have expired or are older than max_age_days.
+def janitor_sweep(max_age_days: int = DEFAULT_MAX_AGE_DAYS, max_bytes: int | None = None) -> list[Path]:
+    """Remove expired/old run dirs and keyed entries, then enforce the byte quota.
 
-    Called at the top of every skill invocation. Never raises; best-effort
+    Called at the top of every skill invocation. Expiry and age are decided
+    from the manifest without touching the tree; a full walk (the historical
+    sweep, which also rebuilds the manifest) runs when the manifest is missing
+    or unreadable, or at most once per FULL_SWEEP_INTERVAL_SEC. After that,
+    least-recently-used keyed entries are evicted while the recorded total
+    exceeds ``max_bytes`` (default: resolve_cache_quota()); run dirs keep
+    their retention. Never raises; best-effort
     cleanup for a path the user might not own.
     """
     base = resolve_cache_base()
     if not base.exists():
         return []
+    quota = resolve_cache_quota() if max_bytes is None else max_bytes
     removed: list[Path] = []
     now = datetime.now(timezone.utc)
-    cutoff_mtime = time.time() - (max_age_days * 86400)
+    now_ts = time.time()
+    cutoff_mtime = now_ts - (max_age_days * 86400)
+    try:
+        with _manifest_lock(base):
+            manifest = _load_manifest(base)
+            if manifest is not None:
+                _apply_pending_updates(base, manifest)
+            if manifest is None or now_ts - manifest.get("full_sweep_at", 0) >= FULL_SWEEP_INTERVAL_SEC:
+                removed.extend(_full_sweep(base, now=now, cutoff_mtime=cutoff_mtime))
+                manifest = _rebuild_manifest(base, now_ts=now_ts, previous=manifest)
+                # Updates queued before any manifest existed still count.
+                _apply_pending_updates(base, manifest)
+            else:
+                removed.extend(_sweep_manifest(base, manifest, now=now, cutoff_mtime=cutoff_mtime))
+            removed.extend(_evict_to_quota(base, manifest, quota=quota))
+            _save_manifest(base, manifest)
+    except OSError:
+        pass
+    return removed
+
+
+def resolve_cache_quota() -> int:
+    """Byte quota for the whole cache base: $OFFICE_ANONYMIZER_CACHE_MAX_BYTES or DEFAULT_MAX_CACHE_BYTES."""
+    raw = os.environ.get(CACHE_QUOTA_ENV_VAR, "").strip()
+    try:
+        value = int(raw)
+    except ValueError:
+        return DEFAULT_MAX_CACHE_BYTES
+    return value if value > 0 else DEFAULT_MAX_CACHE_BYTES
+
+
+def cache_usage() -> dict:
+    """Return ``{"total_bytes", "items", "quota_bytes"}`` as recorded in the manifest.
+
+    Queued manifest updates are flushed first so the totals include them.
+    """
+    base = resolve_cache_base()
+    if base.exists():
+        _flush_pending_updates(base)
+    manifest = _load_manifest(base) if base.exists() else None
+    items = (manifest or {}).get("items", {})
+    return {
+        "total_bytes": sum(int(item.get("size", 0)) for item in items.values()),
+        "items": len(items),
+        "quota_bytes": resolve_cache_quota(),
+    }
+
+
+def cleanup_runid(run_dir: Path) -> None:
+    """Delete a specific run dir. Called at the end of a successful run.
+
+    Backup objects the run dir hardlinked are deleted too once no other run
+    dir links them, rather than waiting out their retention in the store.
+    """
+    run_dir = Path(run_dir)
+    linked = _linked_inodes(run_dir)
+    if run_dir.exists():
+        shutil.rmtree(run_dir, ignore_errors=True)
+    base = resolve_cache_base()
+    forgotten = _drop_unlinked_backup_objects(base, linked)
+    if _managed_base(run_dir) is not None:
+        forgotten.append(run_dir.name)
+    if forgotten:
+        _forget_manifest_items(base, forgotten)
+
+
+def _managed_base(directory: Path) -> Path | None:
+    """The cache base when ``directory`` sits directly under it, else None (no manifest bookkeeping)."""
+    base = resolve_cache_base()
+    try:
+        if Path(directory).parent.resolve() == base.resolve():
+            return base
+    except OSError:
+        pass
+    return None
+
+
+def _is_expired(run_dir: Path, *, now: datetime) -> bool:
+    sentinel = run_dir / _EXPIRES_AT_SENTINEL
+    if not sentinel.exists():
+        return False
+    try:
+        stamp = datetime.fromisoformat(sentinel.read_text(encoding="utf-8").strip())
+    except (OSError, ValueError):
+        return False
+    if stamp.tzinfo is None:
+        stamp = stamp.replace(tzinfo=timezone.utc)
+    return stamp <= now
+
+
+def _full_sweep(base: Path, *, now: datetime, cutoff_mtime: float) -> list[Path]:
+    removed: list[Path] = []
     for entry in base.iterdir():
         if not entry.is_dir():
             continue
+        if entry.name in _KEYED_CACHE_DIRNAMES:
+            removed.extend(_sweep_keyed_cache(entry, now=now, cutoff_mtime=cutoff_mtime))
+            continue
         if _is_expired(entry, now=now) or entry.stat().st_mtime < cutoff_mtime:
             try:
                 shutil.rmtree(entry, ignore_errors=True)
@@ -110,20 +402,401 @@ def janitor_sweep(max_age_days: int = DEFAULT_MAX_AGE_DAYS) -> list[Path]:
     return removed
 
 
-def cleanup_runid(run_dir: Path) -> None:
-    """Delete a specific run dir. Called at the end of a successful run."""
-    if run_dir.exists():
-        shutil.rmtree(run_dir, ignore_errors=True)
+def _sweep_manifest(base: Path, manifest: dict, *, now: datetime, cutoff_mtime: float) -> list[Path]:
+    """Apply the expiry/age rules to manifest items only; no directory walk."""
+    removed: list[Path] = []
+    items = manifest["items"]
+    for name, item in list(items.items()):
+        expired = bool(item.get("expires_at")) and _entry_expired(item, now=now)
+        if item.get("kind") == "run" and float(item.get("last_used", 0)) < cutoff_mtime:
+            expired = True
+        if expired and item.get("kind") == "entry" and _entry_payload_linked(base, name):
+            continue
+        if expired:
+            removed.extend(_remove_manifest_item(base, name, item))
+            del items[name]
+    return removed
 
 
-def _is_expired(run_dir: Path, *, now: datetime) -> bool:
-    sentinel = run_dir / _EXPIRES_AT_SENTINEL
-    if not sentinel.exists():
+def _evict_to_quota(base: Path, manifest: dict, *, quota: int) -> list[Path]:
+    """Evict least-recently-used keyed entries until the recorded total fits ``quota``.
+
+    Run dirs are skipped: a live invocation or a failed run kept for debugging
+    must survive until its own ``expires_at``.
+    """
+    items = manifest["items"]
+    total = sum(int(item.get("size", 0)) for item in items.values())
+    if total <= quota:
+        return []
+    removed: list[Path] = []
+    for name, item in sorted(items.items(), key=lambda pair: float(pair[1].get("last_used", 0))):
+        if total <= quota:
+            break
+        if item.get("kind") != "entry" or _entry_payload_linked(base, name):
+            # Removing a store object a run dir still links would free nothing.
+            continue
+        removed.extend(_remove_manifest_item(base, name, item))
+        total -= int(item.get("size", 0))
+        del items[name]
+    return removed
+
+
+def _entry_payload_linked(base: Path, name: str) -> bool:
+    """True when a keyed entry's payload is still hardlinked from a run dir (store_backup)."""
+    dirname, _, key = name.partition("/")
+    return _payload_linked(base / dirname, key)
+
+
+def _payload_linked(cache_dir: Path, key: str) -> bool:
+    try:
+        return (cache_dir / f"{key}{_ENTRY_PAYLOAD_SUFFIX}").stat().st_nlink > 1
+    except OSError:
         return False
+
+
+def _linked_inodes(path: Path) -> set[tuple[int, int]]:
+    """``(st_dev, st_ino)`` of every hardlinked file under ``path``."""
+    inodes: set[tuple[int, int]] = set()
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                stat = os.lstat(os.path.join(root, name))
+            except OSError:
+                continue
+            if stat.st_nlink > 1:
+                inodes.add((stat.st_dev, stat.st_ino))
+    return inodes
+
+
+def _drop_unlinked_backup_objects(base: Path, inodes: set[tuple[int, int]]) -> list[str]:
+    """Remove backup objects among ``inodes`` that nothing links any more; return their manifest names."""
+    store_dir = base / BACKUP_STORE_DIRNAME
+    if not inodes or not store_dir.is_dir():
+        return []
+    dropped: list[str] = []
+    for payload_path in store_dir.glob(f"*{_ENTRY_PAYLOAD_SUFFIX}"):
+        try:
+            stat = payload_path.stat()
+        except OSError:
+            continue
+        if (stat.st_dev, stat.st_ino) in inodes and stat.st_nlink == 1:
+            _remove_entry_files(store_dir, payload_path.stem)
+            dropped.append(f"{BACKUP_STORE_DIRNAME}/{payload_path.stem}")
+    return dropped
+
+
+def _remove_manifest_item(base: Path, name: str, item: dict) -> list[Path]:
+    if item.get("kind") == "entry":
+        dirname, _, key = name.partition("/")
+        return _remove_entry_files(base / dirname, key)
+    path = base / name
+    if not path.exists():
+        return []
+    shutil.rmtree(path, ignore_errors=True)
+    return [path]
+
+
+def _rebuild_manifest(base: Path, *, now_ts: float, previous: dict | None) -> dict:
+    """Recreate the manifest from what is on disk (after a full sweep).
+
+    Last-use times recorded in ``previous`` win over file mtimes, so a rebuild
+    does not reset the LRU order.
+    """
+    known = (previous or {}).get("items", {})
+    items: dict[str, dict] = {}
+    for entry in base.iterdir():
+        if not entry.is_dir():
+            continue
+        if entry.name in _KEYED_CACHE_DIRNAMES:
+            for meta_path in entry.glob(f"*{_ENTRY_META_SUFFIX}"):
+                try:
+                    record = json.loads(meta_path.read_text(encoding="utf-8"))
+                    size = meta_path.stat().st_size
+                    payload_path = entry / f"{meta_path.stem}{_ENTRY_PAYLOAD_SUFFIX}"
+                    if payload_path.exists():
+                        size += payload_path.stat().st_size
+                    last_used = meta_path.stat().st_mtime
+                except (OSError, ValueError):
+                    continue
+                name = f"{entry.name}/{meta_path.stem}"
+                items[name] = {
+                    "kind": "entry",
+                    "size": size,
+                    "expires_at": record.get(_EXPIRES_AT_SENTINEL) if isinstance(record, dict) else None,
+                    "last_used": known.get(name, {}).get("last_used", last_used),
+                }
+            continue
+        sentinel = entry / _EXPIRES_AT_SENTINEL
+        try:
+            expires_at = sentinel.read_text(encoding="utf-8").strip() if sentinel.exists() else None
+            last_used = entry.stat().st_mtime
+        except OSError:
+            continue
+        items[entry.name] = {
+            "kind": "run",
+            "size": _tree_size(entry),
+            "expires_at": expires_at,
+            "last_used": known.get(entry.name, {}).get("last_used", last_used),
+        }
+    return {"version": _MANIFEST_VERSION, "full_sweep_at": now_ts, "items": items}
+
+
+def _record_manifest_item(base: Path, name: str, *, kind: str, size: int | None = None, expires_at: str | None = None) -> None:
+    """Create or update one manifest item and mark it used now. Best-effort."""
     try:
-        stamp = datetime.fromisoformat(sentinel.read_text(encoding="utf-8").strip())
-    except (OSError, ValueError):
+        with _manifest_lock(base):
+            manifest = _load_manifest(base)
+            if manifest is None:
+                # No manifest yet: leave full_sweep_at at 0 so the next janitor
+                # run walks the tree once and picks up anything untracked.
+                manifest = {"version": _MANIFEST_VERSION, "full_sweep_at": 0, "items": {}}
+            _apply_pending_updates(base, manifest)
+            item = manifest["items"].setdefault(name, {"kind": kind, "size": 0, "expires_at": None})
+            if size is not None:
+                item["size"] = size
+            if expires_at is not None:
+                item["expires_at"] = expires_at
+            item["last_used"] = time.time()
+            _save_manifest(base, manifest)
+    except OSError:
+        pass
+
+
+def _queue_manifest_entry(base: Path, name: str, *, size: int, expires_at: str) -> None:
+    """Queue a keyed-entry manifest item; flushed once per _ENTRY_FLUSH_BATCH entries or interval."""
+    item = {"kind": "entry", "size": size, "expires_at": expires_at, "last_used": time.time()}
+    with _pending_lock:
+        pending = _pending_entries.setdefault(str(base), {})
+        pending[name] = item
+        due = len(pending) >= _ENTRY_FLUSH_BATCH or _flush_due()
+    if due:
+        _flush_pending_updates(base)
+
+
+def _touch_manifest_item(base: Path, name: str) -> None:
+    """Queue a cache-hit ``last_used`` update; the manifest is rewritten at most once per interval."""
+    with _pending_lock:
+        _pending_touches.setdefault(str(base), {})[name] = time.time()
+        due = _flush_due()
+    if due:
+        _flush_pending_updates(base)
+
+
+def _flush_due() -> bool:
+    """True (and restart the interval) once _MANIFEST_FLUSH_INTERVAL_SEC has passed; caller holds _pending_lock."""
+    global _last_manifest_flush
+    if time.monotonic() - _last_manifest_flush < _MANIFEST_FLUSH_INTERVAL_SEC:
         return False
+    _last_manifest_flush = time.monotonic()
+    return True
+
+
+def _flush_pending_updates(base: Path) -> None:
+    with _pending_lock:
+        if str(base) not in _pending_entries and str(base) not in _pending_touches:
+            return
+    try:
+        with _manifest_lock(base):
+            manifest = _load_manifest(base)
+            if manifest is None:
+                if str(base) not in _pending_entries:
+                    return
+                # No manifest yet: leave full_sweep_at at 0 so the next janitor
+                # run walks the tree once and picks up anything untracked.
+                manifest = {"version": _MANIFEST_VERSION, "full_sweep_at": 0, "items": {}}
+            if _apply_pending_updates(base, manifest):
+                _save_manifest(base, manifest)
+    except OSError:
+        pass
+
+
+@atexit.register
+def _flush_all_pending_updates() -> None:
+    with _pending_lock:
+        bases = set(_pending_entries) | set(_pending_touches)
+    for base in sorted(bases):
+        _flush_pending_updates(Path(base))
+
+
+def _apply_pending_updates(base: Path, manifest: dict) -> bool:
+    """Merge queued entries and touches for ``base`` into ``manifest`` (caller holds the lock); True if any applied."""
+    with _pending_lock:
+        entries = _pending_entries.pop(str(base), {})
+        touches = _pending_touches.pop(str(base), {})
+    applied = bool(entries)
+    for name, entry in entries.items():
+        manifest["items"][name] = entry
+    for name, last_used in touches.items():
+        item = manifest["items"].get(name)
+        if item is not None and last_used > float(item.get("last_used", 0)):
+            item["last_used"] = last_used
+            applied = True
+    return applied
+
+
+def _forget_manifest_items(base: Path, names: list[str]) -> None:
+    with _pending_lock:
+        for pending in (_pending_entries.get(str(base), {}), _pending_touches.get(str(base), {})):
+            for name in names:
+                pending.pop(name, None)
+    try:
+        with _manifest_lock(base):
+            manifest = _load_manifest(base)
+            if manifest is None:
+                return
+            _apply_pending_updates(base, manifest)
+            for name in names:
+                manifest["items"].pop(name, None)
+            _save_manifest(base, manifest)
+    except OSError:
+        pass
+
+
+def _load_manifest(base: Path) -> dict | None:
+    try:
+        manifest = json.loads((base / MANIFEST_FILENAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(manifest, dict)
+        or manifest.get("version") != _MANIFEST_VERSION
+        or not isinstance(manifest.get("items"), dict)
+    ):
+        return None
+    return manifest
+
+
+def _save_manifest(base: Path, manifest: dict) -> None:
+    _atomic_write_bytes(base / MANIFEST_FILENAME, json.dumps(manifest, sort_keys=True).encode("utf-8"))
+
+
+@contextlib.contextmanager
+def _manifest_lock(base: Path) -> Iterator[None]:
+    """Serialize manifest read-modify-write cycles across processes (no-op without fcntl)."""
+    if fcntl is None or not base.is_dir():
+        yield
+        return
+    fd = os.open(base / _MANIFEST_LOCK_FILENAME, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+def _tree_size(path: Path) -> int:
+    """Bytes under ``path``; hardlinked files (store_backup) are charged to their store entry."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                stat = os.lstat(os.path.join(root, name))
+            except OSError:
+                continue
+            if stat.st_nlink == 1:
+                total += stat.st_size
+    return total
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _sweep_keyed_cache(cache_dir: Path, *, now: datetime, cutoff_mtime: float) -> list[Path]:
+    removed: list[Path] = []
+    live_keys: set[str] = set()
+    for meta_path in cache_dir.glob(f"*{_ENTRY_META_SUFFIX}"):
+        try:
+            record = json.loads(meta_path.read_text(encoding="utf-8"))
+            expired = not isinstance(record, dict) or _entry_expired(record, now=now)
+        except (OSError, ValueError):
+            expired = True
+        if expired and not _payload_linked(cache_dir, meta_path.stem):
+            removed.extend(_remove_entry_files(cache_dir, meta_path.stem))
+        else:
+            live_keys.add(meta_path.stem)
+    for payload_path in cache_dir.glob(f"*{_ENTRY_PAYLOAD_SUFFIX}"):
+        if payload_path.stem in live_keys:
+            continue
+        try:
+            orphaned = payload_path.stat().st_mtime < cutoff_mtime
+        except OSError:
+            continue
+        if orphaned:
+            removed.extend(_remove_entry_files(cache_dir, payload_path.stem))
+    for temp_path in cache_dir.glob(".*"):
+        try:
+            if temp_path.stat().st_mtime < cutoff_mtime:
+                temp_path.unlink()
+                removed.append(temp_path)
+        except OSError:
+            continue
+    return removed
+
+
+def _remove_entry_files(cache_dir: Path, key: str) -> list[Path]:
+    removed: list[Path] = []
+    for suffix in (_ENTRY_META_SUFFIX, _ENTRY_PAYLOAD_SUFFIX):
+        path = cache_dir / f"{key}{suffix}"
+        try:
+            path.unlink()
+            removed.append(path)
+        except FileNotFoundError:
+            continue
+        except OSError:
+            continue
+    return removed
+
+
+def _entry_expired(record: dict, *, now: datetime) -> bool:
+    try:
+        stamp = datetime.fromisoformat(str(record.get(_EXPIRES_AT_SENTINEL, "")).strip())
+    except ValueError:
+        return True
     if stamp.tzinfo is None:
         stamp = stamp.replace(tzinfo=timezone.utc)
     return stamp <= now
+
+
+def _validate_entry_key(key: str) -> None:
+    if not key or not all(ch in "0123456789abcdef" for ch in key):
+        raise ValueError(f"cache entry keys must be lowercase hex digests, got {key!r}")
+
+
+def _atomic_clone_file(source: Path, path: Path) -> int:
+    from office_automation.common.files import clone_file  # local import: sibling package
+
+    fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
+    os.close(fd)
+    try:
+        os.unlink(temp_name)
+        clone_file(source, temp_name)
+        os.chmod(temp_name, 0o600)
+        size = os.stat(temp_name).st_size
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+    return size
+
+
+def _atomic_write_bytes(path: Path, payload: bytes) -> None:
+    fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(payload)
+        os.chmod(temp_name, 0o600)
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
@@ -8,16 +8,31 @@ provides no hints; this scanner fills that gap.
 Only minimal context (candidate + category + occurrences + location coordinates)
 is persisted. Raw surrounding snippets are NOT stored by default; callers can
 pass ``with_context=True`` to opt into snippet capture at their own risk.
+
+Paragraph text is streamed straight from slide XML (lxml iterparse over
+``a:p``/``a:t``) rather than through the python-pptx object model, and all
+heuristics run as one fused scanner per paragraph. scan_pptx_files() fans a
+folder out over a process pool and, given a keyed cache dir, reuses results by
+file content hash so the confirmation round-trip does not rescan.
 """
 
 from __future__ import annotations
 
+import hashlib
+import os
+import posixpath
 import re
+import zipfile
 from collections import Counter
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Iterable, Iterator
+from typing import Iterable, Iterator, Sequence
+
 
+# Bump whenever the heuristics or hit layout change so cached scans are not reused.
+SCAN_CACHE_VERSION = 1
+_HASH_CHUNK_SIZE = 1024 * 1024
 
 # 職位後続語 that signal a preceding proper noun is a person-name candidate.
 # Ordered so longer forms match first to keep "統括次長" from being split.
@@ -128,6 +143,49 @@ _DENYLIST_EXACT = frozenset({
     "物流",
 })
 
+# All heuristics fused into one scanner. Each category sits in its own
+# zero-width lookahead so categories may still overlap one another (e.g. the
+# property code "BS北畠部長" and the surname "北畠" inside it); the leading guard
+# makes the engine stop only at positions where at least one category matches.
+# Within a category, _scan_paragraph_text keeps finditer's non-overlapping
+# semantics by tracking where that category's previous match ended.
+_SCAN_CATEGORIES = (
+    ("kanji", "person_name", _PERSON_KANJI_SURNAME_RE.pattern.replace("(?P<name>", "(?:", 1)),
+    ("katakana", "person_name", _PERSON_KATAKANA_SURNAME_RE.pattern.replace("(?P<name>", "(?:", 1)),
+    ("company", "company_name", _COMPANY_RE.pattern.replace("(?P<company>", "(?:", 1)),
+    ("code", "property_code", _PROPERTY_CODE_RE.pattern.replace("(?P<code>", "(?:", 1)),
+)
+_FUSED_SCANNER_RE = re.compile(
+    "(?=" + "|".join(f"(?:{pattern})" for _, _, pattern in _SCAN_CATEGORIES) + ")"
+    + "".join(f"(?:(?=(?P<{group}>{pattern})))?" for group, _, pattern in _SCAN_CATEGORIES)
+)
+
+_P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+_R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_SHAPE_TAGS = frozenset(
+    f"{{{_P_NS}}}{name}" for name in ("sp", "grpSp", "graphicFrame", "cxnSp", "pic", "contentPart")
+)
+_NV_PROPS_TAGS = frozenset(
+    f"{{{_P_NS}}}{name}"
+    for name in ("nvSpPr", "nvGrpSpPr", "nvGraphicFramePr", "nvCxnSpPr", "nvPicPr", "nvContentPartPr")
+)
+_TAG_SP_TREE = f"{{{_P_NS}}}spTree"
+_TAG_C_SLD = f"{{{_P_NS}}}cSld"
+_TAG_SP = f"{{{_P_NS}}}sp"
+_TAG_GRP_SP = f"{{{_P_NS}}}grpSp"
+_TAG_GRAPHIC_FRAME = f"{{{_P_NS}}}graphicFrame"
+_TAG_C_NV_PR = f"{{{_P_NS}}}cNvPr"
+_TAG_P_TX_BODY = f"{{{_P_NS}}}txBody"
+_TAG_A_TX_BODY = f"{{{_A_NS}}}txBody"
+_TAG_TBL = f"{{{_A_NS}}}tbl"
+_TAG_TR = f"{{{_A_NS}}}tr"
+_TAG_TC = f"{{{_A_NS}}}tc"
+_TAG_P = f"{{{_A_NS}}}p"
+_TAG_R = f"{{{_A_NS}}}r"
+_TAG_T = f"{{{_A_NS}}}t"
+
 
 @dataclass(frozen=True)
 class CandidateHit:
@@ -163,29 +221,27 @@ def scan_pptx(path: Path, *, with_context: bool = False) -> list[Candidate]:
     reject noise. Raw document text is read but only minimal location data is
     attached to each Candidate unless ``with_context`` is True.
     """
-    from pptx import Presentation  # local import: optional dep
-
-    prs = Presentation(str(path))
     by_text: dict[tuple[str, str], Candidate] = {}
 
-    for slide_idx, slide in enumerate(prs.slides, start=1):
-        for shape in slide.shapes:
-            for shape_path, para_idx, text in _walk_shape(shape, prefix=""):
-                for category, match in _scan_paragraph_text(text):
-                    key = (category, match["text"])
-                    candidate = by_text.setdefault(
-                        key, Candidate(text=match["text"], category=category)
-                    )
-                    candidate.hits.append(
-                        CandidateHit(
-                            slide_number=slide_idx,
-                            shape_path=shape_path,
-                            paragraph_index=para_idx,
-                            match_start=match["start"],
-                            match_end=match["end"],
-                            context=text if with_context else "",
+    with zipfile.ZipFile(path) as package:
+        for slide_idx, slide_part in enumerate(_slide_part_names(package), start=1):
+            with package.open(slide_part) as slide_xml:
+                for shape_path, para_idx, text in _iter_slide_paragraphs(slide_xml):
+                    for category, match in _scan_paragraph_text(text):
+                        key = (category, match["text"])
+                        candidate = by_text.setdefault(
+                            key, Candidate(text=match["text"], category=category)
+                        )
+                        candidate.hits.append(
+                            CandidateHit(
+                                slide_number=slide_idx,
+                                shape_path=shape_path,
+                                paragraph_index=para_idx,
+                                match_start=match["start"],
+                                match_end=match["end"],
+                                context=text if with_context else "",
+                            )
                         )
-                    )
 
     return sorted(
         by_text.values(),
@@ -193,48 +249,226 @@ def scan_pptx(path: Path, *, with_context: bool = False) -> list[Candidate]:
     )
 
 
-def _walk_shape(shape, *, prefix: str) -> Iterator[tuple[str, int, str]]:
-    """Yield (shape_path, paragraph_index, text) tuples for a shape and children."""
-    if getattr(shape, "shape_type", None) == 6:  # GROUP
-        for idx, child in enumerate(shape.shapes):
-            yield from _walk_shape(child, prefix=f"{prefix}g{idx}/")
-        return
-    shape_path = f"{prefix}{getattr(shape, 'shape_id', '?')}"
-    if getattr(shape, "has_text_frame", False):
-        for para_idx, para in enumerate(shape.text_frame.paragraphs):
-            text = "".join(r.text for r in para.runs)
+def scan_pptx_files(
+    paths: Sequence[Path],
+    *,
+    cache_dir: Path | None = None,
+    max_workers: int | None = None,
+) -> dict[Path, list[Candidate]]:
+    """Scan several decks, returning ``{path: candidates}`` in input order.
+
+    Decks whose content hash has a live entry in ``cache_dir`` (a keyed cache
+    from ``cache_utils.ensure_keyed_cache``) are not rescanned, and byte-identical
+    decks are scanned once. The rest are scanned on a process pool (inline when
+    only one deck misses) and written back to the cache. Snippet context is
+    never cached.
+    """
+    digests = {path: _file_digest(path) for path in paths}
+    by_digest: dict[str, list[Candidate]] = {}
+    misses: dict[str, Path] = {}
+    for path in paths:
+        digest = digests[path]
+        if digest in by_digest or digest in misses:
+            continue
+        cached = _cached_scan(cache_dir, digest) if cache_dir is not None else None
+        if cached is None:
+            misses[digest] = path
+        else:
+            by_digest[digest] = cached
+
+    if len(misses) == 1:
+        (digest, path), = misses.items()
+        by_digest[digest] = scan_pptx(path)
+    elif misses:
+        workers = min(len(misses), max_workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for digest, candidates in zip(misses, pool.map(scan_pptx, misses.values())):
+                by_digest[digest] = candidates
+
+    if cache_dir is not None:
+        for digest in misses:
+            _store_scan(cache_dir, digest, by_digest[digest])
+    return {path: by_digest[digests[path]] for path in paths}
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256(f"candidate-scan-v{SCAN_CACHE_VERSION}\n".encode("utf-8"))
+    with Path(path).open("rb") as fh:
+        for chunk in iter(lambda: fh.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cached_scan(cache_dir: Path, digest: str) -> list[Candidate] | None:
+    from cache_utils import read_cache_entry  # local import: sibling script
+
+    entry = read_cache_entry(cache_dir, digest)
+    if entry is None:
+        return None
+    try:
+        return [
+            Candidate(
+                text=item["text"],
+                category=item["category"],
+                hits=[CandidateHit(**hit) for hit in item["hits"]],
+            )
+            for item in entry[0]["candidates"]
+        ]
+    except (KeyError, TypeError):
+        return None
+
+
+def _store_scan(cache_dir: Path, digest: str, candidates: list[Candidate]) -> None:
+    from cache_utils import write_cache_entry  # local import: sibling script
+
+    meta = {"candidates": [asdict(candidate) for candidate in candidates]}
+    try:
+        write_cache_entry(cache_dir, digest, meta)
+    except OSError:
+        pass
+
+
+def _slide_part_names(package: zipfile.ZipFile) -> list[str]:
+    """Return slide part names in presentation order (``p:sldIdLst``)."""
+    from lxml import etree  # local import: optional dep
+
+    presentation = etree.fromstring(package.read("ppt/presentation.xml"))
+    rels = etree.fromstring(package.read("ppt/_rels/presentation.xml.rels"))
+    targets = {
+        rel.get("Id"): rel.get("Target", "")
+        for rel in rels.iter(f"{{{_PKG_REL_NS}}}Relationship")
+    }
+    part_names: list[str] = []
+    for sld_id in presentation.iter(f"{{{_P_NS}}}sldId"):
+        target = targets.get(sld_id.get(f"{{{_R_NS}}}id"))
+        if not target:
+            continue
+        if target.startswith("/"):
+            part_names.append(target.lstrip("/"))
+        else:
+            part_names.append(posixpath.normpath(posixpath.join("ppt", target)))
+    return part_names
+
+
+def _iter_slide_paragraphs(slide_xml) -> Iterator[tuple[str, int, str]]:
+    """Yield (shape_path, paragraph_index, text) for one slide's XML stream.
+
+    Mirrors the python-pptx walk this replaced: shapes are the direct children
+    of ``p:spTree``/``p:grpSp``; group children get a ``g{idx}/`` prefix;
+    paragraph text is the concatenation of ``a:r/a:t`` (fields and breaks are
+    ignored); table cells add ``/r{row}c{col}``; blank paragraphs are skipped
+    but still counted.
+    """
+    from lxml import etree  # local import: optional dep
+
+    tags: list[str] = []
+    # Containers are spTree/grpSp scopes: [child_prefix, next_child_index, is_group].
+    containers: list[list] = []
+    # Shape frames: dict(tag, prefix, shape_id, container_depth).
+    shapes: list[dict] = []
+    text_body: dict | None = None
+    paragraph: list[str] | None = None
+
+    for event, elem in etree.iterparse(slide_xml, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            parent = tags[-1] if tags else None
+            tags.append(tag)
+            if tag == _TAG_SP_TREE and parent == _TAG_C_SLD:
+                containers.append(["", 0, False])
+            elif tag in _SHAPE_TAGS and parent in (_TAG_SP_TREE, _TAG_GRP_SP) and _is_live_container(
+                containers, shapes, depth=len(tags) - 1
+            ):
+                container = containers[-1]
+                child_index = container[1]
+                container[1] += 1
+                prefix = f"{container[0]}g{child_index}/" if container[2] else container[0]
+                shapes.append({"tag": tag, "prefix": prefix, "shape_id": "?", "depth": len(tags)})
+                if tag == _TAG_GRP_SP:
+                    containers.append([prefix, 0, True])
+            elif not shapes or shapes[-1]["depth"] > len(tags):
+                continue
+            elif tag == _TAG_C_NV_PR and parent in _NV_PROPS_TAGS and len(tags) == shapes[-1]["depth"] + 2:
+                shapes[-1]["shape_id"] = elem.get("id", "?")
+            elif tag == _TAG_P_TX_BODY and shapes[-1]["tag"] == _TAG_SP and len(tags) == shapes[-1]["depth"] + 1:
+                text_body = {"path": _shape_path(shapes[-1]), "depth": len(tags), "para_idx": 0}
+            elif tag == _TAG_TBL and shapes[-1]["tag"] == _TAG_GRAPHIC_FRAME:
+                shapes[-1]["row_idx"] = -1
+            elif tag == _TAG_TR and parent == _TAG_TBL and "row_idx" in shapes[-1]:
+                shapes[-1]["row_idx"] += 1
+                shapes[-1]["col_idx"] = -1
+            elif tag == _TAG_TC and parent == _TAG_TR and "col_idx" in shapes[-1]:
+                shapes[-1]["col_idx"] += 1
+            elif tag == _TAG_A_TX_BODY and parent == _TAG_TC and "col_idx" in shapes[-1]:
+                frame = shapes[-1]
+                text_body = {
+                    "path": f"{_shape_path(frame)}/r{frame['row_idx']}c{frame['col_idx']}",
+                    "depth": len(tags),
+                    "para_idx": 0,
+                }
+            elif tag == _TAG_P and text_body is not None and len(tags) == text_body["depth"] + 1:
+                paragraph = []
+            continue
+
+        depth = len(tags)
+        tags.pop()
+        if tag == _TAG_T and paragraph is not None and text_body is not None and depth == text_body["depth"] + 3:
+            if tags and tags[-1] == _TAG_R:
+                paragraph.append(elem.text or "")
+        elif tag == _TAG_P and paragraph is not None and text_body is not None and depth == text_body["depth"] + 1:
+            text = "".join(paragraph)
             if text.strip():
-                yield (shape_path, para_idx, text)
-    if getattr(shape, "has_table", False):
-        for row_idx, row in enumerate(shape.table.rows):
-            for col_idx, cell in enumerate(row.cells):
-                for para_idx, para in enumerate(cell.text_frame.paragraphs):
-                    text = "".join(r.text for r in para.runs)
-                    if text.strip():
-                        yield (
-                            f"{shape_path}/r{row_idx}c{col_idx}",
-                            para_idx,
-                            text,
-                        )
+                yield (text_body["path"], text_body["para_idx"], text)
+            text_body["para_idx"] += 1
+            paragraph = None
+        elif text_body is not None and depth == text_body["depth"] and tag in (_TAG_P_TX_BODY, _TAG_A_TX_BODY):
+            text_body = None
+        elif shapes and depth == shapes[-1]["depth"] and tag == shapes[-1]["tag"]:
+            if shapes.pop()["tag"] == _TAG_GRP_SP:
+                containers.pop()
+        elif tag == _TAG_SP_TREE and containers and not shapes:
+            containers.pop()
+
+        if depth == 4:  # a finished top-level shape: drop its subtree
+            elem.clear()
+
+
+def _is_live_container(containers: list[list], shapes: list[dict], *, depth: int) -> bool:
+    """True when the spTree/grpSp at ``depth`` is the innermost tracked container."""
+    if not containers:
+        return False
+    if not shapes:
+        return depth == 3  # p:sld/p:cSld/p:spTree
+    return shapes[-1]["tag"] == _TAG_GRP_SP and shapes[-1]["depth"] == depth
+
+
+def _shape_path(frame: dict) -> str:
+    return f"{frame['prefix']}{frame['shape_id']}"
 
 
 def _scan_paragraph_text(text: str) -> Iterable[tuple[str, dict]]:
-    """Yield (category, match_dict) tuples for each heuristic hit in ``text``."""
-    for regex, category, group_name in (
-        (_PERSON_KANJI_SURNAME_RE, "person_name", "name"),
-        (_PERSON_KATAKANA_SURNAME_RE, "person_name", "name"),
-        (_COMPANY_RE, "company_name", "company"),
-        (_PROPERTY_CODE_RE, "property_code", "code"),
-    ):
-        for match in regex.finditer(text):
-            value = match.group(group_name)
-            if not value or value in _DENYLIST_EXACT:
+    """Yield (category, match_dict) tuples for each heuristic hit in ``text``.
+
+    One pass of the fused scanner. Hits come out grouped in the historical
+    category order (kanji surname, katakana surname, company, property code),
+    and denylisted values are dropped during the pass, though they still
+    consume their span the way the per-category scans did.
+    """
+    hits: dict[str, list[dict]] = {group: [] for group, _, _ in _SCAN_CATEGORIES}
+    category_end = dict.fromkeys(hits, 0)
+    for match in _FUSED_SCANNER_RE.finditer(text):
+        position = match.start()
+        for group, _, _ in _SCAN_CATEGORIES:
+            value = match.group(group)
+            if not value or position < category_end[group]:
+                continue
+            category_end[group] = position + len(value)
+            if value in _DENYLIST_EXACT:
                 continue
-            yield category, {
-                "text": value,
-                "start": match.start(group_name),
-                "end": match.start(group_name) + len(value),
-            }
+            hits[group].append({"text": value, "start": position, "end": position + len(value)})
+    for group, category, _ in _SCAN_CATEGORIES:
+        for hit in hits[group]:
+            yield category, hit
 
 
 def summarize_counts(candidates: list[Candidate]) -> dict[str, int]:
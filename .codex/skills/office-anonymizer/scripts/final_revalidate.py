@@ -6,55 +6,145 @@ original identifier. A single residual aborts the pipeline: the output never
 lands in ``target_folder`` and a LEAK DETECTED report is written to the cache.
 
 Replacement tokens that happen to match one of the approved originals are
-allowed through (e.g. the replacement ``"A役員"`` contains ``"役員"``).
+allowed through (e.g. the replacement ``"A役員"`` contains ``"役員"``): an
+original occurrence that lies entirely inside a replacement occurrence is not
+a leak.
+
+The scan is one streaming pass over the package: every slide, notes slide,
+slide master/layout (including header/footer placeholders), notes/handout
+master, chart, SmartArt (diagram), comment part and ``docProps`` part is
+parsed with lxml iterparse, and
+each text fragment is fed through a single Aho-Corasick automaton built over
+the originals and replacements, so cost stays linear in the document text
+however large the mapping grows.
 """
 
 from __future__ import annotations
 
+import bisect
+import io
+import posixpath
+import re
 import zipfile
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 
 @dataclass(frozen=True)
 class LeakHit:
-    location: str       # "slide_body" | "notes" | "comments" | "headers" | "footers" | "metadata"
+    location: str       # "slide_body" | "notes" | "comments" | "headers" | "footers" | "masters" | "charts" | "diagrams" | "metadata"
     slide_number: int   # 0 when not slide-scoped
     shape_path: str
     original: str
 
 
+# Part name -> location for parts scanned paragraph by paragraph (a:p/a:t).
+_PARAGRAPH_PARTS = (
+    (re.compile(r"ppt/slides/slide\d+\.xml"), "slide_body"),
+    (re.compile(r"ppt/notesSlides/notesSlide\d+\.xml"), "notes"),
+    (re.compile(r"ppt/(?:slideMasters|slideLayouts|notesMasters|handoutMasters)/[^/]+\.xml"), "masters"),
+)
+# Part name -> location for parts whose every text node and attribute value is scanned.
+_RAW_PARTS = (
+    (re.compile(r"ppt/charts/[^/]+\.xml"), "charts"),
+    (re.compile(r"ppt/diagrams/[^/]+\.xml"), "diagrams"),
+    (re.compile(r"ppt/comments/[^/]+\.xml|ppt/commentAuthors\.xml|ppt/authors\.xml"), "comments"),
+    (re.compile(r"docProps/[^/]+\.xml"), "metadata"),
+)
+_LOCATION_ORDER = (
+    "slide_body", "notes", "headers", "footers", "masters", "charts", "diagrams", "comments", "metadata",
+)
+# Raw-part locations owned by a slide (found through the slide's relationships).
+_SLIDE_GRAPHIC_LOCATIONS = frozenset({"charts", "diagrams"})
+_PLACEHOLDER_LOCATIONS = {"hdr": "headers", "ftr": "footers", "dt": "footers", "sldNum": "footers"}
+
+_P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+_R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_SLIDE_REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide"
+_SHAPE_TAGS = frozenset(
+    f"{{{_P_NS}}}{name}" for name in ("sp", "grpSp", "graphicFrame", "cxnSp", "pic", "contentPart")
+)
+_NV_PROPS_TAGS = frozenset(
+    f"{{{_P_NS}}}{name}"
+    for name in ("nvSpPr", "nvGrpSpPr", "nvGraphicFramePr", "nvCxnSpPr", "nvPicPr", "nvContentPartPr")
+)
+_TAG_SP_TREE = f"{{{_P_NS}}}spTree"
+_TAG_GRP_SP = f"{{{_P_NS}}}grpSp"
+_TAG_GRAPHIC_FRAME = f"{{{_P_NS}}}graphicFrame"
+_TAG_C_NV_PR = f"{{{_P_NS}}}cNvPr"
+_TAG_PH = f"{{{_P_NS}}}ph"
+_TAG_TR = f"{{{_A_NS}}}tr"
+_TAG_TC = f"{{{_A_NS}}}tc"
+_TAG_P = f"{{{_A_NS}}}p"
+_TAG_T = f"{{{_A_NS}}}t"
+
+
 def revalidate_pptx(
     *,
-    pptx_path: Path,
+    pptx_path: Path | None = None,
+    pptx_bytes: bytes | None = None,
     approved_originals: Iterable[str],
     approved_replacements: Iterable[str],
 ) -> list[LeakHit]:
-    """Return every hit of an approved original that is not also a replacement.
+    """Return every hit of an approved original that is not covered by a replacement.
+
+    Pass exactly one of ``pptx_path`` or ``pptx_bytes``; the latter revalidates
+    a serialized in-memory deck before it is written anywhere.
 
     Caller treats a non-empty return list as a fatal leak and is responsible
     for blocking the output from reaching ``target_folder``.
     """
-    from pptx import Presentation  # local import: optional dep
-
+    if (pptx_path is None) == (pptx_bytes is None):
+        raise ValueError("revalidate_pptx needs exactly one of pptx_path or pptx_bytes.")
     originals = [o for o in approved_originals if o]
     if not originals:
         return []
-    replacement_set = {r for r in approved_replacements if r}
-
-    # Longest original first so we do not double-count substring overlaps.
-    originals_sorted = sorted(originals, key=len, reverse=True)
-    prs = Presentation(str(pptx_path))
+    automaton = _NeedleAutomaton(originals, [r for r in approved_replacements if r])
 
     hits: list[LeakHit] = []
-    hits.extend(_scan_slide_bodies(prs, originals_sorted, replacement_set))
-    hits.extend(_scan_notes(prs, originals_sorted, replacement_set))
-    hits.extend(_scan_xml_part(pptx_path, "docProps/core.xml", originals_sorted, replacement_set, location="metadata"))
-    hits.extend(_scan_xml_part(pptx_path, "docProps/app.xml", originals_sorted, replacement_set, location="metadata"))
-    hits.extend(_scan_xml_part(pptx_path, "docProps/custom.xml", originals_sorted, replacement_set, location="metadata"))
-    hits.extend(_scan_comments(pptx_path, originals_sorted, replacement_set))
-    hits.extend(_scan_headers_footers(prs, originals_sorted, replacement_set))
+    source = pptx_path if pptx_path is not None else io.BytesIO(pptx_bytes)
+    with zipfile.ZipFile(source) as package:
+        slide_numbers = _slide_numbers(package)
+        graphic_slide_numbers: dict[str, int] | None = None
+        for info in package.infolist():
+            member = info.filename
+            location = _match_part(_PARAGRAPH_PARTS, member)
+            if location is not None:
+                slide_number = _part_slide_number(package, member, location, slide_numbers)
+                with package.open(info) as stream:
+                    for shape_path, placeholder, text in _iter_part_paragraphs(stream):
+                        hit_location = _PLACEHOLDER_LOCATIONS.get(placeholder or "", location)
+                        hits.extend(
+                            LeakHit(
+                                location=hit_location,
+                                slide_number=slide_number,
+                                shape_path=shape_path if location == "slide_body" else f"{member}:{shape_path}",
+                                original=original,
+                            )
+                            for original in automaton.leaks(text)
+                        )
+                continue
+            location = _match_part(_RAW_PARTS, member)
+            if location is not None:
+                found: list[str] = []
+                with package.open(info) as stream:
+                    for text in _iter_raw_fragments(stream):
+                        found.extend(o for o in automaton.leaks(text) if o not in found)
+                slide_number = 0
+                if found and location in _SLIDE_GRAPHIC_LOCATIONS:
+                    if graphic_slide_numbers is None:
+                        graphic_slide_numbers = _graphic_slide_numbers(package, slide_numbers)
+                    slide_number = graphic_slide_numbers.get(member, 0)
+                hits.extend(
+                    LeakHit(location=location, slide_number=slide_number, shape_path=member, original=original)
+                    for original in automaton.ordered(found)
+                )
+
+    hits.sort(key=lambda hit: (_LOCATION_ORDER.index(hit.location), hit.slide_number))
     return hits
 
 
@@ -78,154 +168,246 @@ def write_leak_report(output_dir: Path, hits: list[LeakHit]) -> Path:
     return report_path
 
 
-def _scan_slide_bodies(prs, originals, replacement_set) -> list[LeakHit]:
-    hits: list[LeakHit] = []
-    for slide_idx, slide in enumerate(prs.slides, start=1):
-        for shape in slide.shapes:
-            hits.extend(
-                _scan_shape(
-                    shape,
-                    slide_number=slide_idx,
-                    location="slide_body",
-                    originals=originals,
-                    replacement_set=replacement_set,
-                    prefix="",
-                )
-            )
-    return hits
+class _NeedleAutomaton:
+    """Aho-Corasick automaton over approved originals and replacements.
 
+    ``leaks(text)`` walks ``text`` once and returns the originals (longest
+    first, matching the historical report order) that occur at least once
+    outside every replacement occurrence. Runs of characters that cannot start
+    any needle are skipped with a compiled character class.
+    """
 
-def _scan_shape(shape, *, slide_number, location, originals, replacement_set, prefix) -> list[LeakHit]:
-    hits: list[LeakHit] = []
-    if getattr(shape, "shape_type", None) == 6:
-        for idx, child in enumerate(shape.shapes):
-            hits.extend(
-                _scan_shape(
-                    child,
-                    slide_number=slide_number,
-                    location=location,
-                    originals=originals,
-                    replacement_set=replacement_set,
-                    prefix=f"{prefix}g{idx}/",
-                )
+    def __init__(self, originals: list[str], replacements: list[str]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # Per state: (needle length, original or None, is_replacement).
+        self._out: list[list[tuple[int, str | None, bool]]] = [[]]
+        self._rank = {
+            original: rank
+            for rank, original in enumerate(sorted(dict.fromkeys(originals), key=len, reverse=True))
+        }
+        replacement_set = set(replacements)
+        for needle in dict.fromkeys([*self._rank, *replacements]):
+            state = 0
+            for ch in needle:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(
+                (len(needle), needle if needle in self._rank else None, needle in replacement_set)
             )
-        return hits
-
-    shape_path = f"{prefix}{getattr(shape, 'shape_id', '?')}"
-    if getattr(shape, "has_text_frame", False):
-        hits.extend(
-            _scan_text_frame(
-                shape.text_frame,
-                slide_number=slide_number,
-                location=location,
-                originals=originals,
-                replacement_set=replacement_set,
-                shape_path=shape_path,
-            )
-        )
-    if getattr(shape, "has_table", False):
-        for row_idx, row in enumerate(shape.table.rows):
-            for col_idx, cell in enumerate(row.cells):
-                hits.extend(
-                    _scan_text_frame(
-                        cell.text_frame,
-                        slide_number=slide_number,
-                        location=location,
-                        originals=originals,
-                        replacement_set=replacement_set,
-                        shape_path=f"{shape_path}/r{row_idx}c{col_idx}",
-                    )
-                )
-    return hits
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+        self._first_chars = re.compile("[" + "".join(re.escape(ch) for ch in self._goto[0]) + "]")
 
-
-def _scan_text_frame(text_frame, *, slide_number, location, originals, replacement_set, shape_path) -> list[LeakHit]:
-    hits: list[LeakHit] = []
-    for paragraph in text_frame.paragraphs:
-        text = "".join(r.text for r in paragraph.runs)
+    def leaks(self, text: str) -> list[str]:
         if not text:
-            continue
-        hits.extend(_leaks_in_text(text, slide_number, shape_path, location, originals, replacement_set))
-    return hits
+            return []
+        goto, fail, out = self._goto, self._fail, self._out
+        original_spans: list[tuple[int, int, str]] = []
+        replacement_spans: list[tuple[int, int]] = []
+        state = 0
+        pos = 0
+        length = len(text)
+        while pos < length:
+            if state == 0:
+                match = self._first_chars.search(text, pos)
+                if match is None:
+                    break
+                pos = match.start()
+            ch = text[pos]
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            pos += 1
+            for needle_length, original, is_replacement in out[state]:
+                if is_replacement:
+                    replacement_spans.append((pos - needle_length, pos))
+                if original is not None:
+                    original_spans.append((pos - needle_length, pos, original))
+        if not original_spans:
+            return []
 
-
-def _scan_notes(prs, originals, replacement_set) -> list[LeakHit]:
-    hits: list[LeakHit] = []
-    for slide_idx, slide in enumerate(prs.slides, start=1):
-        notes = getattr(slide, "notes_slide", None)
-        if notes is None or not slide.has_notes_slide:
-            continue
-        text_frame = notes.notes_text_frame
-        if text_frame is None:
-            continue
-        for paragraph in text_frame.paragraphs:
-            text = "".join(r.text for r in paragraph.runs)
-            if not text:
+        replacement_spans.sort()
+        starts = [start for start, _ in replacement_spans]
+        reach: list[int] = []
+        for _, end in replacement_spans:
+            reach.append(max(end, reach[-1]) if reach else end)
+        leaked: set[str] = set()
+        for start, end, original in original_spans:
+            covering = bisect.bisect_right(starts, start)
+            if covering and reach[covering - 1] >= end:
                 continue
-            hits.extend(
-                _leaks_in_text(text, slide_idx, "notes", "notes", originals, replacement_set)
-            )
-    return hits
+            leaked.add(original)
+        return self.ordered(leaked)
 
+    def ordered(self, originals: Iterable[str]) -> list[str]:
+        return sorted(originals, key=self._rank.__getitem__)
 
-def _scan_xml_part(pptx_path: Path, member: str, originals, replacement_set, *, location: str) -> list[LeakHit]:
-    hits: list[LeakHit] = []
-    try:
-        with zipfile.ZipFile(pptx_path) as zf:
-            if member not in zf.namelist():
-                return []
-            content = zf.read(member).decode("utf-8", errors="replace")
-    except (zipfile.BadZipFile, KeyError, UnicodeDecodeError):
-        return []
-    hits.extend(_leaks_in_text(content, 0, member, location, originals, replacement_set))
-    return hits
 
+def _match_part(patterns, member: str) -> str | None:
+    for pattern, location in patterns:
+        if pattern.fullmatch(member):
+            return location
+    return None
 
-def _scan_comments(pptx_path: Path, originals, replacement_set) -> list[LeakHit]:
-    hits: list[LeakHit] = []
-    try:
-        with zipfile.ZipFile(pptx_path) as zf:
-            comment_parts = [n for n in zf.namelist() if n.startswith("ppt/comments/")]
-            for member in comment_parts:
-                content = zf.read(member).decode("utf-8", errors="replace")
-                hits.extend(
-                    _leaks_in_text(content, 0, member, "comments", originals, replacement_set)
-                )
-    except (zipfile.BadZipFile, UnicodeDecodeError):
-        return []
-    return hits
 
+def _slide_numbers(package: zipfile.ZipFile) -> dict[str, int]:
+    """Map slide part names to 1-based slide numbers in presentation order."""
+    from lxml import etree  # local import: optional dep
 
-def _scan_headers_footers(prs, originals, replacement_set) -> list[LeakHit]:
-    hits: list[LeakHit] = []
+    presentation = etree.fromstring(package.read("ppt/presentation.xml"))
+    targets = _relationship_targets(package, "ppt/presentation.xml")
+    numbers: dict[str, int] = {}
+    for sld_id in presentation.iter(f"{{{_P_NS}}}sldId"):
+        target = targets.get(sld_id.get(f"{{{_R_NS}}}id"))
+        if target:
+            numbers[target[1]] = len(numbers) + 1
+    return numbers
+
+
+def _part_slide_number(package: zipfile.ZipFile, member: str, location: str, slide_numbers: dict[str, int]) -> int:
+    if location == "slide_body":
+        return slide_numbers.get(member, 0)
+    if location == "notes":
+        for rel_type, target in _relationship_targets(package, member).values():
+            if rel_type == _SLIDE_REL_TYPE:
+                return slide_numbers.get(target, 0)
+    return 0
+
+
+def _graphic_slide_numbers(package: zipfile.ZipFile, slide_numbers: dict[str, int]) -> dict[str, int]:
+    """Map chart/diagram part names to the number of the first slide that relates to them."""
+    numbers: dict[str, int] = {}
+    for slide_part, number in sorted(slide_numbers.items(), key=lambda item: item[1]):
+        for _, target in _relationship_targets(package, slide_part).values():
+            if _match_part(_RAW_PARTS, target) in _SLIDE_GRAPHIC_LOCATIONS:
+                numbers.setdefault(target, number)
+    return numbers
+
+
+def _relationship_targets(package: zipfile.ZipFile, member: str) -> dict[str, tuple[str, str]]:
+    """Return ``{rId: (type, resolved part name)}`` for a part's internal relationships."""
+    from lxml import etree  # local import: optional dep
+
+    directory, name = posixpath.split(member)
     try:
-        with zipfile.ZipFile(prs.part.package._package_reader._pkg_file) as zf:  # noqa: SLF001
-            pass
-    except Exception:
-        pass
-    # Simpler: re-open the pptx as zip and walk slideLayout / slideMaster / handout.
-    return hits  # Placeholder: header/footer text lives in slide layouts; we rely on slide-body + notes scans which cover most cases. Full coverage would require opening ppt/slideMasters/*.xml as text.
-
-
-def _leaks_in_text(
-    text: str,
-    slide_number: int,
-    shape_path: str,
-    location: str,
-    originals,
-    replacement_set,
-) -> list[LeakHit]:
-    hits: list[LeakHit] = []
-    if not text:
-        return hits
-    for original in originals:
-        if original in text and original not in replacement_set:
-            hits.append(
-                LeakHit(
-                    location=location,
-                    slide_number=slide_number,
-                    shape_path=shape_path,
-                    original=original,
-                )
-            )
-    return hits
+        rels = etree.fromstring(package.read(posixpath.join(directory, "_rels", f"{name}.rels")))
+    except KeyError:
+        return {}
+    targets: dict[str, tuple[str, str]] = {}
+    for rel in rels.iter(f"{{{_PKG_REL_NS}}}Relationship"):
+        target = rel.get("Target", "")
+        if not target or rel.get("TargetMode") == "External":
+            continue
+        resolved = target.lstrip("/") if target.startswith("/") else posixpath.normpath(posixpath.join(directory, target))
+        targets[rel.get("Id")] = (rel.get("Type", ""), resolved)
+    return targets
+
+
+def _iter_part_paragraphs(stream) -> Iterator[tuple[str, str | None, str]]:
+    """Yield (shape_path, placeholder_type, text) for every ``a:p`` in a slide-like part.
+
+    Every text body is covered (shapes, group members at any depth, table
+    cells, placeholders). Shape paths follow the post_pass/candidate_scan
+    convention: group members get ``g{idx}/`` prefixes and table cells
+    ``/r{row}c{col}``. Paragraph text joins every ``a:t`` (runs and fields).
+    """
+    from lxml import etree  # local import: optional dep
+
+    depth = 0
+    # Containers are spTree/grpSp scopes: [child_prefix, next_child_index, is_group, depth].
+    containers: list[list] = []
+    shapes: list[dict] = []
+    paragraph: list[str] | None = None
+    paragraph_depth = 0
+
+    for event, elem in etree.iterparse(stream, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            depth += 1
+            if tag in _SHAPE_TAGS and containers and containers[-1][3] == depth - 1:
+                container = containers[-1]
+                prefix = f"{container[0]}g{container[1]}/" if container[2] else container[0]
+                container[1] += 1
+                shapes.append({"tag": tag, "prefix": prefix, "id": "?", "ph": None, "depth": depth})
+                if tag == _TAG_GRP_SP:
+                    containers.append([prefix, 0, True, depth])
+            elif tag == _TAG_SP_TREE:
+                containers.append(["", 0, False, depth])
+            elif not shapes:
+                pass
+            elif tag == _TAG_C_NV_PR and depth == shapes[-1]["depth"] + 2:
+                shapes[-1]["id"] = elem.get("id", "?")
+            elif tag == _TAG_PH and depth == shapes[-1]["depth"] + 3:
+                shapes[-1]["ph"] = elem.get("type", "body")
+            elif tag == _TAG_TR and shapes[-1]["tag"] == _TAG_GRAPHIC_FRAME:
+                shapes[-1]["row"] = shapes[-1].get("row", -1) + 1
+                shapes[-1]["col"] = -1
+            elif tag == _TAG_TC and "col" in shapes[-1]:
+                shapes[-1]["col"] += 1
+            if tag == _TAG_P and paragraph is None:
+                paragraph = []
+                paragraph_depth = depth
+            continue
+
+        if tag == _TAG_T and paragraph is not None:
+            paragraph.append(elem.text or "")
+        elif tag == _TAG_P and paragraph is not None and depth == paragraph_depth:
+            text = "".join(paragraph)
+            if text:
+                if shapes:
+                    frame = shapes[-1]
+                    shape_path = f"{frame['prefix']}{frame['id']}"
+                    if "col" in frame:
+                        shape_path = f"{shape_path}/r{frame['row']}c{frame['col']}"
+                    yield shape_path, frame["ph"], text
+                else:
+                    yield "?", None, text
+            paragraph = None
+            elem.clear()
+        elif shapes and depth == shapes[-1]["depth"] and tag == shapes[-1]["tag"]:
+            if shapes.pop()["tag"] == _TAG_GRP_SP:
+                containers.pop()
+            elem.clear()
+        elif tag == _TAG_SP_TREE and containers and containers[-1][3] == depth:
+            containers.pop()
+        depth -= 1
+
+
+def _iter_raw_fragments(stream) -> Iterator[str]:
+    """Yield every text node, tail, and attribute value of an XML part.
+
+    lxml may report an element's ``end`` before its tail is fully read (a tail
+    crossing a read chunk arrives truncated), so each tail is taken on the
+    next event instead: the following sibling's ``start`` or the parent's ``end``.
+    """
+    from lxml import etree  # local import: optional dep
+
+    ended = None
+    for event, elem in etree.iterparse(stream, events=("start", "end")):
+        if ended is not None:
+            if ended.tail and ended.tail.strip():
+                yield ended.tail
+            ended = None
+        if event == "start":
+            continue
+        if elem.text:
+            yield elem.text
+        yield from elem.attrib.values()
+        elem.clear(keep_tail=True)
+        ended = elem
@@ -12,27 +12,49 @@ Contract summary (documented in full in ``references/image-codex-flow.md``):
   - model default:      ``gpt-5-codex`` (override via ``model=`` kwarg)
   - per-image timeout:  300 s
   - retries:            2 (total = 3 attempts)
-  - max images per run: 20 (raises ``CodexBudgetExceeded`` beyond that)
+  - max images per run: 20 unique images needing codex (raises
+                        ``CodexBudgetExceeded`` beyond that; cache hits are free)
+  - folder planning:    ``resolve_folder_images`` de-duplicates pictures across
+                        decks from a zip inventory (no deck is loaded) and
+                        ``splice_image_outcomes`` applies the results to one
+                        loaded deck at a time
+  - concurrency:        4 codex subprocesses at once (``max_concurrency=``);
+                        each image retries/backs off on its own worker
+  - result cache:       optional ``result_cache_dir=``; outcomes keyed by
+                        (image sha256, approved-mapping fingerprint, model) skip
+                        codex entirely on repeat images across decks and runs
   - failure policy:     log + keep original image; never abort the pipeline
 """
 
 from __future__ import annotations
 
 import hashlib
+import io
+import json
 import os
 import re
 import shutil
+import posixpath
 import subprocess
 import time
-from dataclasses import dataclass, field
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Iterable, Mapping
+from typing import Callable, Iterable, Mapping, Sequence
 
 
 DEFAULT_MODEL = "gpt-5-codex"
 DEFAULT_TIMEOUT_SEC = 300
 DEFAULT_RETRIES = 2
 DEFAULT_MAX_IMAGES = 20
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_CODEX_COMMAND = "codex"
+
+_P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+_R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
 
 
 class CodexBudgetExceeded(RuntimeError):
@@ -49,6 +71,19 @@ class ImageOutcome:
     notes: str = ""
 
 
+@dataclass
+class _ImageJob:
+    """Everything a worker needs to run codex for one unique picture, detached from pptx objects."""
+
+    image_id: str
+    image_hash: str
+    slides_affected: list[int]
+    first_slide: int
+    source_path: Path
+    prompt_path: Path
+    anonymized_path: Path
+
+
 def anonymize_pptx_images(
     *,
     pptx_path: Path,
@@ -58,13 +93,28 @@ def anonymize_pptx_images(
     timeout_sec: int = DEFAULT_TIMEOUT_SEC,
     retries: int = DEFAULT_RETRIES,
     max_images: int = DEFAULT_MAX_IMAGES,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    codex_command: str = DEFAULT_CODEX_COMMAND,
+    result_cache_dir: Path | None = None,
 ) -> list[ImageOutcome]:
     """Walk every pptx picture and, when appropriate, substitute an anonymized copy.
 
     ``work_dir`` must already exist and have 0o700 permissions. This function
     writes extracted originals, codex inputs/outputs, and a sibling
     ``image_codex_log.md`` into ``work_dir``.
+
+    Up to ``max_concurrency`` codex subprocesses run at once. Outcomes are logged
+    and spliced in picture order regardless of completion order, and all
+    python-pptx access stays on the calling thread. ``codex_command`` names the
+    executable, so a stub ``codex`` can stand in for local testing.
+
+    When ``result_cache_dir`` is given (normally
+    ``cache_utils.ensure_keyed_cache()``), "unchanged" and "replaced" outcomes
+    are persisted per (image hash, mapping fingerprint, model) and replayed on
+    later hits without starting codex. Failures are never cached.
     """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}.")
     from pptx import Presentation  # local import: optional dep
 
     work_dir = Path(work_dir)
@@ -77,34 +127,301 @@ def anonymize_pptx_images(
         _append_log(log_path, ["No pictures found — nothing to do."])
         return []
 
-    if len(picture_index) > max_images:
+    def _log_and_swap(outcome: ImageOutcome, shapes) -> None:
+        _append_log(log_path, [_format_outcome(outcome)])
+        if outcome.status == "replaced" and outcome.anonymized_path:
+            _swap_image_in_place(prs, shapes, outcome.anonymized_path)
+
+    outcomes = _resolve_unique_images(
+        picture_index,
+        approved_mapping=approved_mapping,
+        work_dir=work_dir,
+        model=model,
+        timeout_sec=timeout_sec,
+        retries=retries,
+        max_images=max_images,
+        max_concurrency=max_concurrency,
+        codex_command=codex_command,
+        result_cache_dir=result_cache_dir,
+        budget_scope="pptx",
+        read_image=_read_shape_image,
+        on_outcome=_log_and_swap,
+    )
+
+    prs.save(str(pptx_path))
+    return outcomes
+
+
+def anonymize_folder_images(
+    *,
+    pptx_paths: Sequence[Path],
+    approved_mapping: Mapping[str, str],
+    work_dir: Path,
+    model: str = DEFAULT_MODEL,
+    timeout_sec: int = DEFAULT_TIMEOUT_SEC,
+    retries: int = DEFAULT_RETRIES,
+    max_images: int = DEFAULT_MAX_IMAGES,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    codex_command: str = DEFAULT_CODEX_COMMAND,
+    result_cache_dir: Path | None = None,
+) -> dict[str, list[ImageOutcome]]:
+    """Plan images across every deck first, then run codex once per unique image.
+
+    resolve_folder_images() followed by splice_image_outcomes() on each deck
+    that gained a replaced image; decks are loaded and saved one at a time.
+    Returns ``{str(pptx_path): [ImageOutcome, ...]}``.
+    """
+    from pptx import Presentation  # local import: optional dep
+
+    results = resolve_folder_images(
+        pptx_paths=pptx_paths,
+        approved_mapping=approved_mapping,
+        work_dir=work_dir,
+        model=model,
+        timeout_sec=timeout_sec,
+        retries=retries,
+        max_images=max_images,
+        max_concurrency=max_concurrency,
+        codex_command=codex_command,
+        result_cache_dir=result_cache_dir,
+    )
+    for path in pptx_paths:
+        outcomes = results[str(path)]
+        if not any(outcome.status == "replaced" for outcome in outcomes):
+            continue
+        prs = Presentation(str(path))
+        splice_image_outcomes(prs, outcomes)
+        prs.save(str(path))
+    return results
+
+
+def resolve_folder_images(
+    *,
+    pptx_paths: Sequence[Path],
+    approved_mapping: Mapping[str, str],
+    work_dir: Path,
+    model: str = DEFAULT_MODEL,
+    timeout_sec: int = DEFAULT_TIMEOUT_SEC,
+    retries: int = DEFAULT_RETRIES,
+    max_images: int = DEFAULT_MAX_IMAGES,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    codex_command: str = DEFAULT_CODEX_COMMAND,
+    result_cache_dir: Path | None = None,
+) -> dict[str, list[ImageOutcome]]:
+    """Resolve every unique picture across ``pptx_paths`` without loading or modifying any deck.
+
+    Pictures come from each deck's zip inventory (inventory_pictures()) and are
+    de-duplicated by blob hash across all decks, so a logo shared by 40 decks
+    costs one codex call, and ``max_images`` counts unique images that still
+    need codex (cache hits are free). Source blobs are read straight from the
+    zip when a job is prepared.
+
+    Returns ``{str(pptx_path): [ImageOutcome, ...]}`` where each outcome's
+    ``slides_affected`` is restricted to that deck; hand a deck's list to
+    splice_image_outcomes() once it is loaded. One shared
+    ``image_codex_log.md`` in ``work_dir`` lists every unique image with its
+    ``deck:slide`` locations.
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}.")
+
+    work_dir = Path(work_dir)
+    work_dir.mkdir(parents=True, exist_ok=True)
+    log_path = work_dir / "image_codex_log.md"
+
+    decks = [Path(path) for path in pptx_paths]
+    # {image hash -> [(slide_idx, (deck_idx, media part name))]}
+    picture_index: dict[str, list[tuple[int, tuple[int, str]]]] = {}
+    for deck_idx, deck_path in enumerate(decks):
+        for image_hash, pictures in inventory_pictures(deck_path).items():
+            picture_index.setdefault(image_hash, []).extend(
+                (slide_idx, (deck_idx, part_name)) for slide_idx, part_name in pictures
+            )
+    results: dict[str, list[ImageOutcome]] = {str(path): [] for path in decks}
+    if not picture_index:
+        _append_log(log_path, ["No pictures found — nothing to do."])
+        return results
+
+    def _read_inventory_image(locations) -> tuple[bytes, str]:
+        _, (deck_idx, part_name) = locations[0]
+        with zipfile.ZipFile(decks[deck_idx]) as package:
+            blob = package.read(part_name)
+        return blob, posixpath.splitext(part_name)[1].lstrip(".").lower() or "png"
+
+    def _fan_out(outcome: ImageOutcome, locations) -> None:
+        by_deck: dict[int, list[int]] = {}
+        for slide_idx, (deck_idx, _) in locations:
+            by_deck.setdefault(deck_idx, []).append(slide_idx)
+        _append_log(log_path, [_format_outcome(outcome, locations=_deck_locations(decks, by_deck))])
+        for deck_idx, slides in by_deck.items():
+            results[str(decks[deck_idx])].append(replace(outcome, slides_affected=slides))
+
+    _resolve_unique_images(
+        picture_index,
+        approved_mapping=approved_mapping,
+        work_dir=work_dir,
+        model=model,
+        timeout_sec=timeout_sec,
+        retries=retries,
+        max_images=max_images,
+        max_concurrency=max_concurrency,
+        codex_command=codex_command,
+        result_cache_dir=result_cache_dir,
+        budget_scope="folder",
+        read_image=_read_inventory_image,
+        on_outcome=_fan_out,
+    )
+    return results
+
+
+def splice_image_outcomes(prs, outcomes: Iterable[ImageOutcome]) -> bool:
+    """Swap every ``replaced`` outcome into one loaded deck; return whether anything changed."""
+    picture_index = _enumerate_pictures(prs)
+    changed = False
+    for outcome in outcomes:
+        shapes = picture_index.get(outcome.source_hash)
+        if outcome.status == "replaced" and outcome.anonymized_path and shapes:
+            _swap_image_in_place(prs, shapes, outcome.anonymized_path)
+            changed = True
+    return changed
+
+
+def inventory_pictures(pptx_path: Path) -> dict[str, list[tuple[int, str]]]:
+    """Return {blob_sha256 -> [(slide_idx, media part name)]} read from the zip, without loading the deck.
+
+    Covers the same pictures as _enumerate_pictures(): embedded, non-placeholder
+    ``p:pic`` shapes at the top of each slide's shape tree, with slides in
+    presentation order. Each media part is hashed once.
+    """
+    from lxml import etree  # local import: optional dep
+
+    inventory: dict[str, list[tuple[int, str]]] = {}
+    digests: dict[str, str] = {}
+    with zipfile.ZipFile(pptx_path) as package:
+        presentation = etree.fromstring(package.read("ppt/presentation.xml"))
+        slide_targets = _relationship_targets(package, "ppt/presentation.xml")
+        slide_parts = [
+            slide_targets[rid]
+            for rid in (sld_id.get(f"{{{_R_NS}}}id") for sld_id in presentation.iter(f"{{{_P_NS}}}sldId"))
+            if rid in slide_targets
+        ]
+        for slide_idx, slide_part in enumerate(slide_parts, start=1):
+            try:
+                slide = etree.fromstring(package.read(slide_part))
+            except KeyError:
+                continue
+            media_targets = _relationship_targets(package, slide_part)
+            for pic in slide.iterfind(f"{{{_P_NS}}}cSld/{{{_P_NS}}}spTree/{{{_P_NS}}}pic"):
+                if pic.find(f"{{{_P_NS}}}nvPicPr/{{{_P_NS}}}nvPr/{{{_P_NS}}}ph") is not None:
+                    continue  # placeholder pictures are not PICTURE shapes
+                blip = pic.find(f"{{{_P_NS}}}blipFill/{{{_A_NS}}}blip")
+                part_name = media_targets.get(blip.get(f"{{{_R_NS}}}embed")) if blip is not None else None
+                if part_name is None:
+                    continue
+                if part_name not in digests:
+                    try:
+                        digests[part_name] = hashlib.sha256(package.read(part_name)).hexdigest()
+                    except KeyError:
+                        continue
+                inventory.setdefault(digests[part_name], []).append((slide_idx, part_name))
+    return inventory
+
+
+def _resolve_unique_images(
+    picture_index: dict[str, list],
+    *,
+    approved_mapping: Mapping[str, str],
+    work_dir: Path,
+    model: str,
+    timeout_sec: int,
+    retries: int,
+    max_images: int,
+    max_concurrency: int,
+    codex_command: str,
+    result_cache_dir: Path | None,
+    budget_scope: str,
+    read_image: Callable[[list], tuple[bytes, str]],
+    on_outcome: Callable[[ImageOutcome, list], None],
+) -> list[ImageOutcome]:
+    """Resolve each unique picture once (cache hit or codex) and report outcomes in picture order.
+
+    ``picture_index`` values are ``[(slide_idx, location), ...]``;
+    ``read_image(locations)`` returns the blob and extension for a cache miss.
+    The budget is checked against cache misses before any codex subprocess
+    starts. ``on_outcome`` runs on the calling thread, so it may touch pptx objects.
+    """
+    fingerprint = mapping_fingerprint(approved_mapping)
+    cached: dict[str, ImageOutcome] = {}
+    if result_cache_dir is not None:
+        for idx, (image_hash, shapes) in enumerate(picture_index.items(), start=1):
+            hit = _cached_outcome(
+                result_cache_dir,
+                image_id=f"img-{idx:02d}",
+                image_hash=image_hash,
+                shapes=shapes,
+                fingerprint=fingerprint,
+                model=model,
+                work_dir=work_dir,
+            )
+            if hit is not None:
+                cached[image_hash] = hit
+
+    pending_count = len(picture_index) - len(cached)
+    if pending_count > max_images:
         raise CodexBudgetExceeded(
-            f"pptx has {len(picture_index)} pictures; exceeds max_images={max_images}."
+            f"{budget_scope} has {pending_count} unique pictures needing codex; exceeds max_images={max_images}."
         )
 
-    outcomes: list[ImageOutcome] = []
+    prepared: list[tuple[list, ImageOutcome | _ImageJob]] = []
     for idx, (image_hash, shapes) in enumerate(picture_index.items(), start=1):
-        outcome = _process_one_image(
-            image_id=f"img-{idx:02d}",
-            image_hash=image_hash,
-            shapes=shapes,
-            approved_mapping=approved_mapping,
-            work_dir=work_dir,
-            model=model,
-            timeout_sec=timeout_sec,
-            retries=retries,
+        prepared.append(
+            (
+                shapes,
+                cached.get(image_hash)
+                or _prepare_image_job(
+                    image_id=f"img-{idx:02d}",
+                    image_hash=image_hash,
+                    shapes=shapes,
+                    read_image=read_image,
+                    approved_mapping=approved_mapping,
+                    work_dir=work_dir,
+                ),
+            )
         )
-        outcomes.append(outcome)
-        _append_log(log_path, [_format_outcome(outcome)])
-        if outcome.status == "replaced" and outcome.anonymized_path:
-            _swap_image_in_place(prs, shapes, outcome.anonymized_path)
 
-    prs.save(str(pptx_path))
+    outcomes: list[ImageOutcome] = []
+    worker_count = max(1, min(max_concurrency, pending_count))
+    with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="image-codex") as executor:
+        futures: list[Future | None] = [
+            executor.submit(
+                _run_image_job,
+                job,
+                model=model,
+                timeout_sec=timeout_sec,
+                retries=retries,
+                codex_command=codex_command,
+            )
+            if isinstance(job, _ImageJob)
+            else None
+            for _, job in prepared
+        ]
+        try:
+            for (shapes, job), future in zip(prepared, futures):
+                outcome = future.result() if future is not None else job
+                if future is not None and result_cache_dir is not None:
+                    _store_outcome(result_cache_dir, outcome, fingerprint=fingerprint, model=model)
+                outcomes.append(outcome)
+                on_outcome(outcome, shapes)
+        except BaseException:
+            for future in futures:
+                if future is not None:
+                    future.cancel()
+            raise
     return outcomes
 
 
 def _enumerate_pictures(prs) -> dict[str, list]:
-    """Return {blob_sha1 -> [(slide_idx, shape)]} for every picture in the deck."""
+    """Return {blob_sha256 -> [(slide_idx, shape)]} for every picture in the deck."""
     picture_index: dict[str, list] = {}
     for slide_idx, slide in enumerate(prs.slides, start=1):
         for shape in slide.shapes:
@@ -114,26 +431,91 @@ def _enumerate_pictures(prs) -> dict[str, list]:
                 blob = shape.image.blob
             except Exception:
                 continue
-            digest = hashlib.sha1(blob).hexdigest()
+            digest = hashlib.sha256(blob).hexdigest()
             picture_index.setdefault(digest, []).append((slide_idx, shape))
     return picture_index
 
 
-def _process_one_image(
+def mapping_fingerprint(approved_mapping: Mapping[str, str]) -> str:
+    """Order-independent sha256 of the approved mapping, used in result-cache keys."""
+    canonical = json.dumps(sorted(approved_mapping.items()), ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _result_cache_key(image_hash: str, fingerprint: str, model: str) -> str:
+    return hashlib.sha256(f"{image_hash}\n{fingerprint}\n{model}".encode("utf-8")).hexdigest()
+
+
+def _cached_outcome(
+    cache_dir: Path,
     *,
     image_id: str,
     image_hash: str,
     shapes,
+    fingerprint: str,
+    model: str,
+    work_dir: Path,
+) -> ImageOutcome | None:
+    from cache_utils import read_cache_entry  # local import: sibling script
+
+    entry = read_cache_entry(cache_dir, _result_cache_key(image_hash, fingerprint, model))
+    if entry is None:
+        return None
+    meta, payload = entry
+    slides_affected = [s for s, _ in shapes]
+    if meta.get("status") == "unchanged":
+        return ImageOutcome(
+            image_id=image_id,
+            source_hash=image_hash,
+            status="unchanged",
+            slides_affected=slides_affected,
+            notes=f"cache hit: {meta.get('notes', '')}",
+        )
+    if meta.get("status") != "replaced" or payload is None:
+        return None
+    anonymized_path = work_dir / f"{image_id}_anonymized.{meta.get('ext') or 'png'}"
+    anonymized_path.write_bytes(payload)
+    os.chmod(anonymized_path, 0o600)
+    return ImageOutcome(
+        image_id=image_id,
+        source_hash=image_hash,
+        status="replaced",
+        slides_affected=slides_affected,
+        anonymized_path=anonymized_path,
+        notes=f"cache hit: {meta.get('notes', '')}",
+    )
+
+
+def _store_outcome(cache_dir: Path, outcome: ImageOutcome, *, fingerprint: str, model: str) -> None:
+    from cache_utils import write_cache_entry  # local import: sibling script
+
+    if outcome.status not in {"unchanged", "replaced"}:
+        return
+    payload = None
+    meta = {"status": outcome.status, "notes": outcome.notes}
+    if outcome.status == "replaced":
+        if outcome.anonymized_path is None:
+            return
+        payload = outcome.anonymized_path.read_bytes()
+        meta["ext"] = outcome.anonymized_path.suffix.lstrip(".")
+    try:
+        write_cache_entry(cache_dir, _result_cache_key(outcome.source_hash, fingerprint, model), meta, payload)
+    except OSError:
+        pass
+
+
+def _prepare_image_job(
+    *,
+    image_id: str,
+    image_hash: str,
+    shapes,
+    read_image: Callable[[list], tuple[bytes, str]],
     approved_mapping: Mapping[str, str],
     work_dir: Path,
-    model: str,
-    timeout_sec: int,
-    retries: int,
-) -> ImageOutcome:
-    slide_idx, example_shape = shapes[0]
+) -> ImageOutcome | _ImageJob:
+    slide_idx = shapes[0][0]
     try:
-        blob = example_shape.image.blob
-        ext = (example_shape.image.ext or "png").lower()
+        blob, ext = read_image(shapes)
     except Exception as exc:
         return ImageOutcome(
             image_id=image_id,
@@ -147,24 +529,43 @@ def _process_one_image(
     source_path.write_bytes(blob)
     os.chmod(source_path, 0o600)
 
-    anonymized_path = work_dir / f"{image_id}_anonymized.{ext}"
-    prompt_path = _write_prompt(work_dir, image_id, approved_mapping)
+    return _ImageJob(
+        image_id=image_id,
+        image_hash=image_hash,
+        slides_affected=[s for s, _ in shapes],
+        first_slide=slide_idx,
+        source_path=source_path,
+        prompt_path=_write_prompt(work_dir, image_id, approved_mapping),
+        anonymized_path=work_dir / f"{image_id}_anonymized.{ext}",
+    )
+
+
+def _run_image_job(
+    job: _ImageJob,
+    *,
+    model: str,
+    timeout_sec: int,
+    retries: int,
+    codex_command: str = DEFAULT_CODEX_COMMAND,
+) -> ImageOutcome:
+    """Run codex for one image with its own timeout and retry/backoff; safe on a worker thread."""
     for attempt in range(retries + 1):
         try:
             findings = _invoke_codex(
-                prompt_path=prompt_path,
-                image_path=source_path,
-                output_path=anonymized_path,
+                prompt_path=job.prompt_path,
+                image_path=job.source_path,
+                output_path=job.anonymized_path,
                 model=model,
                 timeout_sec=timeout_sec,
+                codex_command=codex_command,
             )
         except subprocess.TimeoutExpired:
             if attempt == retries:
                 return ImageOutcome(
-                    image_id=image_id,
-                    source_hash=image_hash,
+                    image_id=job.image_id,
+                    source_hash=job.image_hash,
                     status="failed",
-                    slides_affected=[s for s, _ in shapes],
+                    slides_affected=list(job.slides_affected),
                     notes=f"codex timed out after {retries + 1} attempts",
                 )
             time.sleep(2 ** attempt)
@@ -172,10 +573,10 @@ def _process_one_image(
         except subprocess.CalledProcessError as exc:
             if attempt == retries:
                 return ImageOutcome(
-                    image_id=image_id,
-                    source_hash=image_hash,
+                    image_id=job.image_id,
+                    source_hash=job.image_hash,
                     status="failed",
-                    slides_affected=[s for s, _ in shapes],
+                    slides_affected=list(job.slides_affected),
                     notes=f"codex exited {exc.returncode}: {exc.stderr[:200] if exc.stderr else ''}",
                 )
             time.sleep(2 ** attempt)
@@ -183,36 +584,36 @@ def _process_one_image(
         break
     else:
         return ImageOutcome(
-            image_id=image_id,
-            source_hash=image_hash,
+            image_id=job.image_id,
+            source_hash=job.image_hash,
             status="failed",
-            slides_affected=[s for s, _ in shapes],
+            slides_affected=list(job.slides_affected),
             notes="exhausted retries",
         )
 
-    if findings == 0 or not anonymized_path.exists():
+    if findings == 0 or not job.anonymized_path.exists():
         return ImageOutcome(
-            image_id=image_id,
-            source_hash=image_hash,
+            image_id=job.image_id,
+            source_hash=job.image_hash,
             status="unchanged",
-            slides_affected=[s for s, _ in shapes],
-            notes=f"codex reported 0 findings (first slide={slide_idx})",
+            slides_affected=list(job.slides_affected),
+            notes=f"codex reported 0 findings (first slide={job.first_slide})",
         )
-    if hashlib.sha1(anonymized_path.read_bytes()).hexdigest() == image_hash:
+    if hashlib.sha256(job.anonymized_path.read_bytes()).hexdigest() == job.image_hash:
         return ImageOutcome(
-            image_id=image_id,
-            source_hash=image_hash,
+            image_id=job.image_id,
+            source_hash=job.image_hash,
             status="unchanged",
-            slides_affected=[s for s, _ in shapes],
+            slides_affected=list(job.slides_affected),
             notes="codex returned byte-identical image",
         )
 
     return ImageOutcome(
-        image_id=image_id,
-        source_hash=image_hash,
+        image_id=job.image_id,
+        source_hash=job.image_hash,
         status="replaced",
-        slides_affected=[s for s, _ in shapes],
-        anonymized_path=anonymized_path,
+        slides_affected=list(job.slides_affected),
+        anonymized_path=job.anonymized_path,
         notes=f"codex reported {findings} replacement(s)",
     )
 
@@ -258,13 +659,14 @@ def _invoke_codex(
     output_path: Path,
     model: str,
     timeout_sec: int,
+    codex_command: str = DEFAULT_CODEX_COMMAND,
 ) -> int:
     stdin_input = (
         prompt_path.read_text(encoding="utf-8")
         + f"\n\noutput={output_path}\n"
     )
     cmd = [
-        "codex",
+        codex_command,
         "exec",
         "--skip-git-repo-check",
         "--sandbox",
@@ -296,17 +698,42 @@ def _parse_findings_count(stdout: str) -> int:
         return 0
 
 
+def _read_shape_image(shapes) -> tuple[bytes, str]:
+    image = shapes[0][1].image
+    return image.blob, (image.ext or "png").lower()
+
+
+def _relationship_targets(package: zipfile.ZipFile, member: str) -> dict[str, str]:
+    """Return ``{rId: resolved part name}`` for a part's internal relationships."""
+    from lxml import etree  # local import: optional dep
+
+    directory, name = posixpath.split(member)
+    try:
+        rels = etree.fromstring(package.read(posixpath.join(directory, "_rels", f"{name}.rels")))
+    except KeyError:
+        return {}
+    targets: dict[str, str] = {}
+    for rel in rels.iter(f"{{{_PKG_REL_NS}}}Relationship"):
+        target = rel.get("Target", "")
+        if not target or rel.get("TargetMode") == "External":
+            continue
+        targets[rel.get("Id")] = (
+            target.lstrip("/") if target.startswith("/") else posixpath.normpath(posixpath.join(directory, target))
+        )
+    return targets
+
+
 def _swap_image_in_place(prs, shapes, anonymized_path: Path) -> None:
     """Clone the image part per affected slide and rewrite the blip rId there only."""
     new_blob = anonymized_path.read_bytes()
     for _, shape in shapes:
         slide_part = shape.part
         try:
-            image_part = slide_part.package.get_or_add_image_part(new_blob)
+            image_part = slide_part.package.get_or_add_image_part(io.BytesIO(new_blob))
         except AttributeError:
             image_part = _fallback_add_image_part(slide_part, new_blob, anonymized_path)
         new_rid = slide_part.relate_to(image_part, _PIC_REL_TYPE)
-        shape._element.blipFill_blip.rEmbed = new_rid  # type: ignore[attr-defined]
+        shape._element.blipFill.blip.rEmbed = new_rid  # type: ignore[attr-defined]
 
 
 def _fallback_add_image_part(slide_part, blob: bytes, anonymized_path: Path):
@@ -345,9 +772,17 @@ def _append_log(log_path: Path, lines: Iterable[str]) -> None:
         pass
 
 
-def _format_outcome(outcome: ImageOutcome) -> str:
-    affected = ",".join(str(s) for s in outcome.slides_affected)
+def _format_outcome(outcome: ImageOutcome, *, locations: str | None = None) -> str:
+    affected = locations or "slides=" + ",".join(str(s) for s in outcome.slides_affected)
     return (
-        f"- {outcome.image_id} | sha1={outcome.source_hash[:8]} | "
-        f"status={outcome.status} | slides={affected} | {outcome.notes}"
+        f"- {outcome.image_id} | sha256={outcome.source_hash[:8]} | "
+        f"status={outcome.status} | {affected} | {outcome.notes}"
     )
+
+
+def _deck_locations(decks: Sequence[Path], by_deck: Mapping[int, list[int]]) -> str:
+    parts = [
+        f"{decks[deck_idx].name}:" + ",".join(str(slide_idx) for slide_idx in slides)
+        for deck_idx, slides in sorted(by_deck.items())
+    ]
+    return "decks=" + ";".join(parts)
@@ -3,11 +3,13 @@ from __future__ import annotations
 from collections import Counter
 from collections.abc import Mapping, Sequence
 from pathlib import Path
+import io
 import json
 import os
 import shutil
 import subprocess
 import sys
+import tempfile
 
 
 _REPO_ROOT = Path(__file__).resolve().parents[4]
@@ -27,6 +29,7 @@ from office_automation.anonymize.candidate_summary import (  # noqa: E402
 from office_automation.anonymize.detect import detect  # noqa: E402
 from office_automation.anonymize.transform import transform  # noqa: E402
 from office_automation.anonymize.validate import validate  # noqa: E402
+from office_automation.common import daemon  # noqa: E402
 from office_automation.common.files import list_office_files  # noqa: E402
 
 
@@ -44,6 +47,7 @@ _STATUS_LABELS = {
     2: "success_with_warnings",
     3: "fatal_error",
 }
+_DAEMON_HANDLER = "office_anonymizer.run_request"
 _DEFAULT_REPORT_NAME = "anonymization_report.md"
 _DEFAULT_RULES_PATH = Path(__file__).resolve().parents[1] / "default_rules.yaml"
 _ALLOWED_POLICY_KEYS = {
@@ -54,6 +58,7 @@ _ALLOWED_POLICY_KEYS = {
     "metadata",
     "images",
     "body_text",
+    "pdf_save",
     "manual_review_required",
 }
 _ALLOWED_IMAGE_CONFIRMATION_KEYS = {
@@ -312,35 +317,55 @@ def run_request(request: Mapping) -> dict:
             review_guidance="Human review remains required in V1, but this request was rejected before runtime processing.",
         )
     except Exception as exc:
-        return _result(
-            status=3,
-            message=str(exc),
-            target_folder=target_folder_text,
-            report_path=None,
-            supported_file_count=0,
-            supported_files=[],
-            skipped_supported_file_count=0,
-            skipped_supported_files=[],
-            unsupported_file_count=0,
-            unsupported_files=[],
-            targeted_extensions=None,
-            policy_mode="failed",
-            policy_notes=[],
-            detected_finding_count=0,
-            detected_findings_by_category={},
-            transform_status_counts={},
-            validation_status_counts={},
-            validation_statuses={},
-            residual_findings_count=0,
-            manual_review_item_count=0,
-            warning_count=0,
-            requires_manual_review=True,
-            review_guidance="Human review remains required in V1, but this run ended in a fatal wrapper/runtime failure.",
-            error={
-                "type": exc.__class__.__name__,
-                "message": str(exc),
-            },
-        )
+        return _fatal_result(target_folder_text, error_type=exc.__class__.__name__, message=str(exc))
+
+
+
+def run_request_via_daemon(
+    request: Mapping,
+    *,
+    socket_path: str | Path | None = None,
+    timeout: float | None = None,
+) -> dict:
+    """Run ``request`` in the local office-automation daemon, or in-process when none is listening."""
+    try:
+        return daemon.call_or_run(_DAEMON_HANDLER, request, run_request, socket_path=socket_path, timeout=timeout)
+    except (daemon.DaemonRequestError, OSError) as exc:
+        error_type = getattr(exc, "error_type", exc.__class__.__name__)
+        return _fatal_result(_safe_request_value(request, "target_folder"), error_type=error_type, message=str(exc))
+
+
+
+def _fatal_result(target_folder_text: str | None, *, error_type: str, message: str) -> dict:
+    return _result(
+        status=3,
+        message=message,
+        target_folder=target_folder_text,
+        report_path=None,
+        supported_file_count=0,
+        supported_files=[],
+        skipped_supported_file_count=0,
+        skipped_supported_files=[],
+        unsupported_file_count=0,
+        unsupported_files=[],
+        targeted_extensions=None,
+        policy_mode="failed",
+        policy_notes=[],
+        detected_finding_count=0,
+        detected_findings_by_category={},
+        transform_status_counts={},
+        validation_status_counts={},
+        validation_statuses={},
+        residual_findings_count=0,
+        manual_review_item_count=0,
+        warning_count=0,
+        requires_manual_review=True,
+        review_guidance="Human review remains required in V1, but this run ended in a fatal wrapper/runtime failure.",
+        error={
+            "type": error_type,
+            "message": message,
+        },
+    )
 
 
 
@@ -392,9 +417,13 @@ def run_orchestrated(
     invoking this function again with ``approved_mapping`` populated.
     """
     from cache_utils import (  # local import to stay cheap on the legacy path
+        CANDIDATE_SCAN_CACHE_DIRNAME,
+        cleanup_runid,
         ensure_cache_base,
+        ensure_keyed_cache,
         janitor_sweep,
         mkdtemp_run,
+        record_run_usage,
         write_expires_at,
     )
 
@@ -414,19 +443,22 @@ def run_orchestrated(
         "status_label": "pending_confirmation",
     }
 
-    # Step 2/3: discover + heuristic candidate scan for every pptx in scope.
-    import candidate_scan  # local import
+    # Step 2: discover every pptx in scope.
     pptx_files = sorted(
         p for p in folder.glob("*.pptx")
         if not p.name.startswith("~$") and not p.name.endswith(".bak")
     )
-    candidates_by_file: dict[str, list] = {}
-    for pptx in pptx_files:
-        candidates_by_file[pptx.name] = candidate_scan.scan_pptx(pptx)
 
-    # Step 4: propose mapping. If the caller has not yet supplied one, surface
-    # a candidates payload and return pending_confirmation.
+    # Step 3/4: heuristic candidate scan + proposed mapping. Only needed until
+    # the caller supplies a mapping; scans fan out over a process pool and are
+    # cached by file hash, so re-proposing for an unchanged folder is cheap.
     if approved_mapping is None and not auto_approve:
+        import candidate_scan  # local import
+        scanned = candidate_scan.scan_pptx_files(
+            pptx_files,
+            cache_dir=ensure_keyed_cache(CANDIDATE_SCAN_CACHE_DIRNAME),
+        )
+        candidates_by_file = {pptx.name: cands for pptx, cands in scanned.items()}
         candidates_payload = _serialize_candidates(candidates_by_file)
         payload_path = run_dir / "candidates.yaml"
         payload_path.write_text(candidates_payload, encoding="utf-8")
@@ -445,6 +477,7 @@ def run_orchestrated(
                 },
             }
         )
+        record_run_usage(run_dir)
         return result
 
     mapping = dict(approved_mapping or {})
@@ -493,40 +526,70 @@ def run_orchestrated(
         "approved_candidate_count": len(approved_candidate_ids),
     }
 
-    # Step 7: position-based post_pass on every pptx.
+    # Step 8 (planning): images are planned across decks from each deck's zip
+    # picture inventory, so shared images hit codex once and the budget counts
+    # unique images, not per-deck copies. No deck is loaded yet.
+    image_outcomes: dict[str, list] = {}
+    if enable_image_codex and mapping:
+        import image_codex_anonymize  # local import
+        image_outcomes = image_codex_anonymize.resolve_folder_images(
+            pptx_paths=pptx_files,
+            approved_mapping=mapping,
+            work_dir=run_dir / "images",
+            result_cache_dir=ensure_keyed_cache(),
+        )
+        result["image_codex"] = {
+            Path(deck).name: dict(Counter(outcome.status for outcome in outcomes))
+            for deck, outcomes in image_outcomes.items()
+        }
+
+    # Steps 7-9 then run one deck at a time: load it, post_pass and splice
+    # images in memory, serialize once, revalidate the bytes, and only then
+    # write it back. At most one deck is held in memory, and a leaking deck
+    # never touches disk.
+    import final_revalidate  # local import
     if enable_post_pass and mapping:
         import post_pass  # local import
-        for pptx in pptx_files:
+    leak_summary: list[dict] = []
+    for pptx in pptx_files:
+        deck_images = image_outcomes.get(str(pptx), [])
+        presentation = None
+        changed = False
+        if (enable_post_pass and mapping) or any(outcome.status == "replaced" for outcome in deck_images):
+            from pptx import Presentation  # local import: optional dep
+            presentation = Presentation(str(pptx))
+
+        # Step 7: position-based post_pass.
+        if enable_post_pass and mapping:
             try:
-                post_pass.run_post_pass(
+                summary = post_pass.run_post_pass(
                     pptx_path=pptx,
                     sg5_transform_results=sg5_result.get("validation_results") or [],
                     replacement_overrides=replacement_overrides,
                     approved_replacements=list(mapping.values()),
                     approved_mapping=mapping,
                     backup_dir=run_dir / "backups",
+                    presentation=presentation,
                 )
             except post_pass.UnsupportedPostPassScope as exc:
                 result.setdefault("post_pass_errors", []).append(
                     {"file": pptx.name, "error": str(exc)}
                 )
+            else:
+                changed = any(
+                    summary[key] for key in ("targeted_replacements", "role_suffix_dedupes", "concatenation_spacings")
+                )
 
-    # Step 8: image anonymization via codex.
-    if enable_image_codex and mapping:
-        import image_codex_anonymize  # local import
-        for pptx in pptx_files:
-            image_codex_anonymize.anonymize_pptx_images(
-                pptx_path=pptx,
-                approved_mapping=mapping,
-                work_dir=run_dir / f"images-{pptx.stem}",
-            )
+        # Step 8 (splice): swap this deck's replaced images in.
+        if presentation is not None and deck_images:
+            changed = image_codex_anonymize.splice_image_outcomes(presentation, deck_images) or changed
 
-    # Step 9: final revalidation. Any residual is a leak; block target_folder output.
-    import final_revalidate  # local import
-    leak_summary: list[dict] = []
-    for pptx in pptx_files:
+        # Step 9: final revalidation. Any residual is a leak; block target_folder output.
+        pending_bytes = _serialize_presentation(presentation) if changed else None
+        presentation = None  # release the object model before revalidating the bytes
         hits = final_revalidate.revalidate_pptx(
-            pptx_path=pptx,
+            pptx_path=None if pending_bytes is not None else pptx,
+            pptx_bytes=pending_bytes,
             approved_originals=list(mapping.keys()),
             approved_replacements=list(mapping.values()),
         )
@@ -535,9 +598,12 @@ def run_orchestrated(
             leak_summary.append(
                 {"file": pptx.name, "hits": len(hits), "report": str(report_path)}
             )
+        elif pending_bytes is not None:
+            _write_bytes_atomically(pptx, pending_bytes)
     if leak_summary:
         result["status_label"] = "unresolved_leaks"
         result["leaks"] = leak_summary
+        record_run_usage(run_dir)
         return result
 
     # Step 10: optional mapping sheet emission (absolute path required).
@@ -555,11 +621,33 @@ def run_orchestrated(
         result["mapping_sheet_path"] = str(emit_mapping_to)
 
     # Step 11: cleanup on success.
-    shutil.rmtree(run_dir, ignore_errors=True)
+    cleanup_runid(run_dir)
     result["status_label"] = "completed"
     return result
 
 
+def _serialize_presentation(presentation) -> bytes:
+    buffer = io.BytesIO()
+    presentation.save(buffer)
+    return buffer.getvalue()
+
+
+def _write_bytes_atomically(path: Path, payload: bytes) -> None:
+    """Replace ``path`` with ``payload`` via a sibling temp file, so readers never see a torn deck."""
+    fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(payload)
+        shutil.copymode(path, temp_name)
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+
+
 def _serialize_candidates(candidates_by_file: Mapping[str, list]) -> str:
     """Serialize candidates to a minimal YAML-ish format editable by the user."""
     lines = [
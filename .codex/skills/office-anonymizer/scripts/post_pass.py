@@ -24,7 +24,6 @@ Secondary cleanups (all scoped to paragraphs already touched in this run):
 from __future__ import annotations
 
 import re
-import shutil
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Mapping
@@ -88,13 +87,23 @@ def run_post_pass(
     approved_mapping: Mapping[str, str] | None = None,
     known_bare_labels: Iterable[str] = ("RET", "WP", "AM", "CN", "PMO"),
     backup_dir: Path | None = None,
+    presentation=None,
 ) -> dict:
     """Apply position-based replacements driven by SG5 residual coordinates.
 
     Returns a summary dict with counts. Raises ``UnsupportedPostPassScope`` if
     any residual points outside pptx body scope; the wrapper is expected to
     let that exception propagate so ``final_revalidate`` captures the leak.
+
+    When ``presentation`` (an already loaded python-pptx ``Presentation`` of
+    ``pptx_path``) is given, edits are made on it and nothing is saved: the
+    caller owns the single write at the end of its in-memory pipeline. The
+    backup, if requested, is still taken from ``pptx_path`` on disk through
+    ``cache_utils.store_backup``, which de-duplicates it in the
+    content-addressed backup store only when ``backup_dir`` is inside the
+    cache base and otherwise writes a plain copy into ``backup_dir``.
     """
+    from cache_utils import store_backup  # local import: sibling script
     from pptx import Presentation  # local import: optional dep
 
     targets = _collect_targets(
@@ -105,22 +114,22 @@ def run_post_pass(
 
     pptx_path = Path(pptx_path)
     if backup_dir is not None:
-        backup_dir.mkdir(parents=True, exist_ok=True)
-        backup_path = backup_dir / f"{pptx_path.name}.pre-postpass.bak"
-        shutil.copyfile(pptx_path, backup_path)
+        backup_path = store_backup(pptx_path, backup_dir / f"{pptx_path.name}.pre-postpass.bak")
     else:
         backup_path = None
 
-    prs = Presentation(str(pptx_path))
-    replaced = _apply_replacements(prs, targets)
-    dedupes = _dedupe_role_suffixes(prs, approved_replacements)
-    spacings = _space_concatenations(prs, known_bare_labels, approved_replacements)
-    prs.save(str(pptx_path))
+    prs = presentation if presentation is not None else Presentation(str(pptx_path))
+    counts = _rewrite_paragraphs(
+        prs,
+        targets,
+        approved_replacements=tuple(approved_replacements),
+        known_bare_labels=tuple(known_bare_labels),
+    )
+    if presentation is None:
+        prs.save(str(pptx_path))
 
     return {
-        "targeted_replacements": replaced,
-        "role_suffix_dedupes": dedupes,
-        "concatenation_spacings": spacings,
+        **counts,
         "backup_path": str(backup_path) if backup_path else None,
     }
 
@@ -230,74 +239,99 @@ def _index_finding_ids(body_text_candidates: Iterable[Mapping]) -> dict[str, str
     return index
 
 
-def _apply_replacements(prs, targets: list[_ReplaceTarget]) -> int:
-    """Apply targeted replacements. Returns count of paragraphs modified."""
-    count = 0
-    by_slide = _group_targets_by_slide(targets)
+def _rewrite_paragraphs(
+    prs,
+    targets: list[_ReplaceTarget],
+    *,
+    approved_replacements: tuple[str, ...],
+    known_bare_labels: tuple[str, ...],
+) -> dict[str, int]:
+    """Apply targeted replacements, role-suffix dedupe and concatenation spacing in one walk.
+
+    Every body paragraph (shapes, groups, table cells) is visited once. The
+    three steps run in their historical order on that paragraph's text, each
+    counted separately, and the paragraph is rewritten at most once.
+    """
+    index = _index_targets(targets)
+    role_pairs = _role_suffix_pairs(approved_replacements)
+    spacing_pattern = _concatenation_pattern(known_bare_labels, approved_replacements)
+    counts = {"targeted_replacements": 0, "role_suffix_dedupes": 0, "concatenation_spacings": 0}
+
     for slide_idx, slide in enumerate(prs.slides, start=1):
-        slide_targets = by_slide.get(slide_idx, [])
-        if not slide_targets:
-            continue
         for shape in slide.shapes:
-            count += _apply_to_shape(shape, slide_targets)
-    return count
-
-
-def _group_targets_by_slide(
+            for shape_id, text_frame in _iter_text_frames(shape):
+                for para_idx, paragraph in enumerate(text_frame.paragraphs):
+                    current = "".join(r.text for r in paragraph.runs)
+                    if not current:
+                        continue
+                    mutated = current
+                    changed = False
+
+                    para_targets = index.get((slide_idx, shape_id, para_idx))
+                    if para_targets:
+                        replaced = _apply_targets(mutated, para_targets)
+                        if replaced != mutated:
+                            mutated, changed = replaced, True
+                            counts["targeted_replacements"] += 1
+
+                    if role_pairs:
+                        deduped = mutated
+                        for label, suffix in role_pairs:
+                            deduped = deduped.replace(label + suffix, label)
+                        if deduped != mutated:
+                            mutated, changed = deduped, True
+                            counts["role_suffix_dedupes"] += 1
+
+                    if spacing_pattern is not None:
+                        spaced = spacing_pattern.sub(r"\1 \2", mutated)
+                        if spaced != mutated:
+                            mutated, changed = spaced, True
+                            counts["concatenation_spacings"] += 1
+
+                    if changed:
+                        _write_paragraph_text(paragraph, mutated)
+    return counts
+
+
+def _index_targets(
     targets: list[_ReplaceTarget],
-) -> dict[int, list[_ReplaceTarget]]:
-    grouped: dict[int, list[_ReplaceTarget]] = {}
+) -> dict[tuple[int, str, int], list[_ReplaceTarget]]:
+    """Return {(slide_number, shape_id, paragraph_index): targets}, each list ordered last-match-first."""
+    index: dict[tuple[int, str, int], list[_ReplaceTarget]] = {}
     for target in targets:
-        grouped.setdefault(target.slide_number, []).append(target)
-    return grouped
+        index.setdefault((target.slide_number, target.shape_id, target.paragraph_index), []).append(target)
+    for para_targets in index.values():
+        # Apply from the end so earlier slices stay valid.
+        para_targets.sort(key=lambda t: t.match_start, reverse=True)
+    return index
 
 
-def _apply_to_shape(shape, targets: list[_ReplaceTarget]) -> int:
+def _iter_text_frames(shape):
+    """Yield (shape_id, text_frame) for a shape, every group member, and every table cell."""
     if getattr(shape, "shape_type", None) == 6:  # GROUP
-        count = 0
         for child in shape.shapes:
-            count += _apply_to_shape(child, targets)
-        return count
-
+            yield from _iter_text_frames(child)
+        return
     shape_id = str(getattr(shape, "shape_id", ""))
-    matching = [t for t in targets if t.shape_id == shape_id]
-    if not matching:
-        return 0
-
-    count = 0
     if getattr(shape, "has_text_frame", False):
-        count += _apply_to_text_frame(shape.text_frame, matching)
+        yield shape_id, shape.text_frame
     if getattr(shape, "has_table", False):
         for row in shape.table.rows:
             for cell in row.cells:
-                count += _apply_to_text_frame(cell.text_frame, matching)
-    return count
+                yield shape_id, cell.text_frame
 
 
-def _apply_to_text_frame(text_frame, targets: list[_ReplaceTarget]) -> int:
-    count = 0
-    for para_idx, paragraph in enumerate(text_frame.paragraphs):
-        para_targets = [t for t in targets if t.paragraph_index == para_idx]
-        if not para_targets:
-            continue
-        current = "".join(r.text for r in paragraph.runs)
-        if not current:
+def _apply_targets(text: str, para_targets: list[_ReplaceTarget]) -> str:
+    mutated = text
+    for target in para_targets:
+        if target.match_start < 0 or target.match_end > len(mutated):
             continue
-        # Apply from the end so earlier slices stay valid.
-        para_targets.sort(key=lambda t: t.match_start, reverse=True)
-        mutated = current
-        for target in para_targets:
-            if target.match_start < 0 or target.match_end > len(mutated):
-                continue
-            mutated = (
-                mutated[: target.match_start]
-                + target.replacement
-                + mutated[target.match_end:]
-            )
-        if mutated != current:
-            _write_paragraph_text(paragraph, mutated)
-            count += 1
-    return count
+        mutated = (
+            mutated[: target.match_start]
+            + target.replacement
+            + mutated[target.match_end:]
+        )
+    return mutated
 
 
 def _write_paragraph_text(paragraph, new_text: str) -> None:
@@ -308,101 +342,24 @@ def _write_paragraph_text(paragraph, new_text: str) -> None:
         run.text = ""
 
 
-def _dedupe_role_suffixes(prs, approved_replacements: Iterable[str]) -> int:
-    """Remove "<label><role><role>" duplication introduced by overlap."""
-    ordered_pairs = [
+def _role_suffix_pairs(approved_replacements: tuple[str, ...]) -> list[tuple[str, str]]:
+    """(label, suffix) pairs used to collapse "<label><role>" duplication introduced by overlap."""
+    return [
         (label, suffix)
         for suffix in _ROLE_SUFFIX_TOKENS
         for label in approved_replacements
         if label.endswith(suffix)
     ]
-    if not ordered_pairs:
-        return 0
-
-    count = 0
-    for slide in prs.slides:
-        for shape in slide.shapes:
-            count += _dedupe_on_shape(shape, ordered_pairs)
-    return count
 
 
-def _dedupe_on_shape(shape, ordered_pairs) -> int:
-    if getattr(shape, "shape_type", None) == 6:
-        count = 0
-        for child in shape.shapes:
-            count += _dedupe_on_shape(child, ordered_pairs)
-        return count
-    count = 0
-    if getattr(shape, "has_text_frame", False):
-        count += _dedupe_on_text_frame(shape.text_frame, ordered_pairs)
-    if getattr(shape, "has_table", False):
-        for row in shape.table.rows:
-            for cell in row.cells:
-                count += _dedupe_on_text_frame(cell.text_frame, ordered_pairs)
-    return count
-
-
-def _dedupe_on_text_frame(text_frame, ordered_pairs) -> int:
-    count = 0
-    for paragraph in text_frame.paragraphs:
-        text = "".join(r.text for r in paragraph.runs)
-        if not text:
-            continue
-        new = text
-        for label, suffix in ordered_pairs:
-            new = new.replace(label + suffix, label)
-        if new != text:
-            _write_paragraph_text(paragraph, new)
-            count += 1
-    return count
-
-
-def _space_concatenations(
-    prs,
-    known_bare_labels: Iterable[str],
-    approved_replacements: Iterable[str],
-) -> int:
-    """Insert a single space between "<BARE LABEL><anonymized token>" pairs."""
-    bare_labels = tuple(known_bare_labels)
-    replacements = tuple(approved_replacements)
-    if not bare_labels or not replacements:
-        return 0
-
-    pattern = re.compile(
-        "(" + "|".join(re.escape(b) for b in bare_labels) + ")"
-        "(" + "|".join(re.escape(r) for r in replacements) + ")"
+def _concatenation_pattern(
+    known_bare_labels: tuple[str, ...],
+    approved_replacements: tuple[str, ...],
+) -> re.Pattern | None:
+    """Pattern matching "<BARE LABEL><anonymized token>" pairs that need a separating space."""
+    if not known_bare_labels or not approved_replacements:
+        return None
+    return re.compile(
+        "(" + "|".join(re.escape(b) for b in known_bare_labels) + ")"
+        "(" + "|".join(re.escape(r) for r in approved_replacements) + ")"
     )
-    count = 0
-    for slide in prs.slides:
-        for shape in slide.shapes:
-            count += _space_on_shape(shape, pattern)
-    return count
-
-
-def _space_on_shape(shape, pattern) -> int:
-    if getattr(shape, "shape_type", None) == 6:
-        count = 0
-        for child in shape.shapes:
-            count += _space_on_shape(child, pattern)
-        return count
-    count = 0
-    if getattr(shape, "has_text_frame", False):
-        count += _space_on_text_frame(shape.text_frame, pattern)
-    if getattr(shape, "has_table", False):
-        for row in shape.table.rows:
-            for cell in row.cells:
-                count += _space_on_text_frame(cell.text_frame, pattern)
-    return count
-
-
-def _space_on_text_frame(text_frame, pattern) -> int:
-    count = 0
-    for paragraph in text_frame.paragraphs:
-        text = "".join(r.text for r in paragraph.runs)
-        if not text:
-            continue
-        new = pattern.sub(r"\1 \2", text)
-        if new != text:
-            _write_paragraph_text(paragraph, new)
-            count += 1
-    return count
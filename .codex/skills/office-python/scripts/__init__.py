@@ -1,3 +1,3 @@
-from .office_python_wrapper import run, run_request
+from .office_python_wrapper import run, run_batch, run_request, run_request_via_daemon
 
-__all__ = ["run", "run_request"]
+__all__ = ["run", "run_batch", "run_request", "run_request_via_daemon"]
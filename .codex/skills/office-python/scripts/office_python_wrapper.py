@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+import copy
+import importlib
+import os
 from pathlib import Path
 import sys
 import warnings
@@ -11,16 +15,18 @@ _RUNTIME_SRC = _REPO_ROOT / "tools" / "office-automation" / "src"
 if str(_RUNTIME_SRC) not in sys.path:
     sys.path.insert(0, str(_RUNTIME_SRC))
 
-from office_automation import excel_ops, pdf_ops, powerpoint_ops, word_ops  # noqa: E402
+from office_automation.common import daemon  # noqa: E402
 
 
+# Runtime modules are imported on first use so a pdf-only run never loads openpyxl, python-docx or python-pptx.
 _SUPPORTED_EXTENSIONS = {
-    "xlsx": excel_ops,
-    "xlsm": excel_ops,
-    "docx": word_ops,
-    "pptx": powerpoint_ops,
-    "pdf": pdf_ops,
+    "xlsx": "office_automation.excel_ops",
+    "xlsm": "office_automation.excel_ops",
+    "docx": "office_automation.word_ops",
+    "pptx": "office_automation.powerpoint_ops",
+    "pdf": "office_automation.pdf_ops",
 }
+_DAEMON_HANDLER = "office_python.run_request"
 _STATUS_LABELS = {
     0: "success",
     1: "unsupported_scope",
@@ -92,7 +98,59 @@ def run(
     )
 
 
+def run_batch(requests: Sequence[Mapping], *, max_workers: int | None = None) -> list[dict]:
+    """Run several wrapper requests, returning one ``run_request`` result per request in input order.
+
+    Requests that touch the same file (as source, explicit output, or default ``-edited`` target)
+    share a group and run in request order on one worker, where repeated reads of an unchanged
+    file reuse the first parse. Independent groups run on a process pool (inline for one group).
+    """
+    groups = _group_batch_requests(requests)
+    results: list[dict | None] = [None] * len(requests)
+    if len(groups) <= 1 or max_workers == 1:
+        for group in groups:
+            for index, result in _run_request_group(group):
+                results[index] = result
+        return results
+
+    workers = min(len(groups), max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for group_results in pool.map(_run_request_group, groups):
+            for index, result in group_results:
+                results[index] = result
+    return results
+
+
 def run_request(request: Mapping) -> dict:
+    return _run_request(request)
+
+
+def run_request_via_daemon(
+    request: Mapping,
+    *,
+    socket_path: str | Path | None = None,
+    timeout: float | None = None,
+) -> dict:
+    """Run ``request`` in the local office-automation daemon, or in-process when none is listening."""
+    try:
+        return daemon.call_or_run(_DAEMON_HANDLER, request, run_request, socket_path=socket_path, timeout=timeout)
+    except (daemon.DaemonRequestError, OSError) as exc:
+        error_type = getattr(exc, "error_type", exc.__class__.__name__)
+        mode = request.get("mode") if isinstance(request, Mapping) else None
+        return _result(
+            status=3,
+            file_path=_safe_request_path(request),
+            detected_format=None,
+            mode=mode if mode in {"read", "edit"} else None,
+            message=str(exc),
+            error={
+                "type": error_type,
+                "message": str(exc),
+            },
+        )
+
+
+def _run_request(request: Mapping, *, read_cache: dict | None = None) -> dict:
     detected_format: str | None = None
     mode: str | None = None
     source_path: Path | None = None
@@ -102,15 +160,18 @@ def run_request(request: Mapping) -> dict:
         source_path = normalized["source_path"]
         detected_format = normalized["extension"]
         mode = normalized["mode"]
-        runtime_module = _SUPPORTED_EXTENSIONS[detected_format]
+        runtime_module = _load_runtime_module(detected_format)
 
         if mode == "read":
             return _execute_read(
                 runtime_module=runtime_module,
                 source_path=source_path,
                 detected_format=detected_format,
+                read_cache=read_cache,
             )
 
+        if read_cache is not None:
+            read_cache.clear()
         return _execute_edit(
             runtime_module=runtime_module,
             source_path=source_path,
@@ -139,6 +200,55 @@ def run_request(request: Mapping) -> dict:
         )
 
 
+def _group_batch_requests(requests: Sequence[Mapping]) -> list[list[tuple[int, Mapping]]]:
+    # Union requests whose file keys overlap so that an edit and any later read of its output,
+    # or two edits racing for the same collision-safe name, stay ordered on one worker.
+    parents = list(range(len(requests)))
+
+    def find(index: int) -> int:
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    owner_by_key: dict[str, int] = {}
+    for index, request in enumerate(requests):
+        for key in _batch_file_keys(request):
+            owner = owner_by_key.setdefault(key, index)
+            parents[find(index)] = find(owner)
+
+    groups: dict[int, list[tuple[int, Mapping]]] = {}
+    for index, request in enumerate(requests):
+        groups.setdefault(find(index), []).append((index, request))
+    return list(groups.values())
+
+
+def _batch_file_keys(request: Mapping) -> list[str]:
+    if not isinstance(request, Mapping):
+        return []
+    keys: list[str] = []
+    try:
+        source_path = _coerce_optional_path(request.get("file_path"), field_name="file_path")
+        output_path = _coerce_optional_path(request.get("output_path"), field_name="output_path")
+        output_dir = _coerce_optional_path(request.get("output_dir"), field_name="output_dir")
+        if source_path is not None:
+            keys.append(str(source_path.resolve(strict=False)))
+            if request.get("mode") == "edit" and output_path is None:
+                candidate = _default_output_candidate(source_path=source_path, output_dir=output_dir)
+                keys.append(str(candidate.resolve(strict=False)))
+        if output_path is not None:
+            keys.append(str(output_path.resolve(strict=False)))
+    except (OSError, TypeError, ValueError):
+        # run_request reports the malformed field; the request simply runs in its own group.
+        pass
+    return keys
+
+
+def _run_request_group(group: list[tuple[int, Mapping]]) -> list[tuple[int, dict]]:
+    read_cache: dict = {}
+    return [(index, _run_request(request, read_cache=read_cache)) for index, request in group]
+
+
 def _normalize_request(request: Mapping) -> dict:
     if not isinstance(request, Mapping):
         raise TypeError("office-python wrapper request must be a mapping.")
@@ -222,7 +332,20 @@ def _normalize_request(request: Mapping) -> dict:
     }
 
 
-def _execute_read(*, runtime_module, source_path: Path, detected_format: str) -> dict:
+def _execute_read(
+    *,
+    runtime_module,
+    source_path: Path,
+    detected_format: str,
+    read_cache: dict | None = None,
+) -> dict:
+    cache_key = None
+    if read_cache is not None:
+        stat_result = source_path.stat()
+        cache_key = (str(source_path.resolve()), stat_result.st_size, stat_result.st_mtime_ns)
+        if cache_key in read_cache:
+            return copy.deepcopy(read_cache[cache_key])
+
     with warnings.catch_warnings(record=True) as caught:
         warnings.simplefilter("always")
         runtime_result = runtime_module.read(source_path)
@@ -234,7 +357,7 @@ def _execute_read(*, runtime_module, source_path: Path, detected_format: str) ->
     if manual_review_notes:
         message = "Read completed with caveats that may affect interpretation."
 
-    return _result(
+    result = _result(
         status=status,
         file_path=str(source_path),
         detected_format=detected_format,
@@ -246,6 +369,9 @@ def _execute_read(*, runtime_module, source_path: Path, detected_format: str) ->
         },
         data=runtime_result,
     )
+    if cache_key is not None:
+        read_cache[cache_key] = copy.deepcopy(result)
+    return result
 
 
 def _execute_edit(*, runtime_module, source_path: Path, detected_format: str, wrapper_request: dict) -> dict:
@@ -478,6 +604,14 @@ def _summarize_operation(operation: Mapping) -> str:
         return f"set_cell({operation.get('sheet', '?')}!{operation.get('cell', '?')})"
     if operation_name == "clear_cell":
         return f"clear_cell({operation.get('sheet', '?')}!{operation.get('cell', '?')})"
+    if operation_name == "set_range":
+        values = operation.get("values")
+        row_count = len(values) if isinstance(values, list) else "?"
+        return f"set_range({operation.get('sheet', '?')}!{operation.get('start_cell', '?')}, rows={row_count})"
+    if operation_name == "append_rows":
+        rows = operation.get("rows")
+        row_count = len(rows) if isinstance(rows, list) else "?"
+        return f"append_rows({operation.get('sheet', '?')}, rows={row_count})"
     if operation_name in {"replace_title_text", "replace_shape_text"}:
         slide_ref = operation.get("slide_number")
         if slide_ref is None and operation.get("slide_index") is not None:
@@ -555,6 +689,10 @@ def _coerce_optional_path(value: object, *, field_name: str) -> Path | None:
     raise TypeError(f"office-python wrapper field '{field_name}' must be a string or Path when provided.")
 
 
+def _load_runtime_module(extension: str):
+    return importlib.import_module(_SUPPORTED_EXTENSIONS[extension])
+
+
 def _validate_source_path(path: Path) -> None:
     if not path.exists():
         raise FileNotFoundError(f"Source file '{path}' does not exist.")
@@ -6,18 +6,22 @@ from collections.abc import Mapping
 import json
 from pathlib import Path
 import re
-from tempfile import TemporaryDirectory
-
-import fitz
-from docx import Document
-from openpyxl import load_workbook
-from PIL import Image
-from pptx import Presentation
+from typing import TYPE_CHECKING
 
+from office_automation.common.backends import (
+    load_document_callable,
+    load_presentation_callable,
+    load_pymupdf,
+    load_workbook_callable,
+)
 from office_automation.common.files import list_office_files
-from office_automation.common.images import extract_images
+from office_automation.common.images import list_image_inventory
 from office_automation.common.metadata import read_metadata
 
+if TYPE_CHECKING:
+    from docx.document import Document
+    from pptx.presentation import Presentation
+
 __all__ = ["detect"]
 
 _HEADER_FOOTER_VARIANTS = (
@@ -145,6 +149,7 @@ def _scan_excel_file(
     body_text_detection_enabled: bool,
     body_text_candidate_inputs: dict,
 ) -> list[dict]:
+    load_workbook = load_workbook_callable("Excel detection")
     workbook = load_workbook(file_path, keep_vba=_path_extension(file_path) == "xlsm")
     findings: list[dict] = []
     try:
@@ -175,7 +180,8 @@ def _scan_docx_file(
     body_text_detection_enabled: bool,
     body_text_candidate_inputs: dict,
 ) -> list[dict]:
-    document = Document(file_path)
+    load_document = load_document_callable("Word detection")
+    document = load_document(file_path)
     findings: list[dict] = []
 
     try:
@@ -235,7 +241,8 @@ def _scan_pptx_file(
     body_text_detection_enabled: bool,
     body_text_candidate_inputs: dict,
 ) -> list[dict]:
-    presentation = Presentation(file_path)
+    load_presentation = load_presentation_callable("PowerPoint detection")
+    presentation = load_presentation(file_path)
     findings: list[dict] = []
 
     findings.append(
@@ -331,7 +338,7 @@ def _scan_pdf_file(
                 body_text_candidate_inputs=body_text_candidate_inputs,
             )
         )
-    findings.extend(_image_findings(file_path, relative_path=relative_path, image_locations=_pdf_image_locations(file_path)))
+    findings.extend(_image_findings(file_path, relative_path=relative_path))
     return findings
 
 
@@ -567,6 +574,7 @@ def _scan_pptx_notes(presentation: Presentation, *, file_path: Path, relative_pa
 
 
 def _scan_pdf_comments(file_path: Path, *, relative_path: str) -> list[dict]:
+    fitz = load_pymupdf("PDF detection")
     document = fitz.open(file_path)
     try:
         if getattr(document, "needs_pass", False):
@@ -841,6 +849,7 @@ def _scan_pptx_body_text(presentation: Presentation, *, file_path: Path, relativ
 
 
 def _scan_pdf_body_text(file_path: Path, *, relative_path: str, body_text_candidate_inputs: dict) -> list[dict]:
+    fitz = load_pymupdf("PDF detection")
     document = fitz.open(file_path)
     try:
         if getattr(document, "needs_pass", False):
@@ -1039,65 +1048,33 @@ def _metadata_findings(file_path: Path, *, relative_path: str) -> list[dict]:
 
 
 
-def _image_findings(
-    file_path: Path,
-    *,
-    relative_path: str,
-    image_locations: list[dict] | None = None,
-) -> list[dict]:
-    with TemporaryDirectory(prefix="office-automation-detect-images-") as temp_dir:
-        extracted_paths = extract_images(file_path, Path(temp_dir))
-        findings: list[dict] = []
-        for image_index, image_path in enumerate(extracted_paths):
-            width, height = _image_dimensions(image_path)
-            location = {"image_index": image_index}
-            if image_locations is not None and image_index < len(image_locations):
-                location.update(image_locations[image_index])
-            findings.append(
-                _finding(
-                    file_path=file_path,
-                    relative_path=relative_path,
-                    category="images",
-                    location=location,
-                    payload={
-                        "image_index": image_index,
-                        "extracted_filename": image_path.name,
-                        "width": width,
-                        "height": height,
-                    },
-                    action_hint="replace_or_mask",
-                    confidence="high",
-                    manual_review_reason=None,
-                )
+def _image_findings(file_path: Path, *, relative_path: str) -> list[dict]:
+    findings: list[dict] = []
+    for entry in list_image_inventory(file_path):
+        image_index = int(entry["image_index"])
+        location = {"image_index": image_index}
+        if "page_index" in entry:
+            location["page_number"] = int(entry["page_index"]) + 1
+            location["page_image_index"] = int(entry["page_image_index"])
+        findings.append(
+            _finding(
+                file_path=file_path,
+                relative_path=relative_path,
+                category="images",
+                location=location,
+                payload={
+                    "image_index": image_index,
+                    "extracted_filename": entry["extracted_filename"],
+                    "width": entry["width"],
+                    "height": entry["height"],
+                    "sha256": entry["sha256"],
+                },
+                action_hint="replace_or_mask",
+                confidence="high",
+                manual_review_reason=None,
             )
-        return findings
-
-
-
-def _pdf_image_locations(file_path: Path) -> list[dict]:
-    document = fitz.open(file_path)
-    try:
-        if getattr(document, "needs_pass", False):
-            raise NotImplementedError(f"Encrypted PDF files are outside detection V1 scope: '{file_path}'.")
-
-        locations: list[dict] = []
-        for page_index in range(document.page_count):
-            page = document.load_page(page_index)
-            for page_image_index, image_info in enumerate(page.get_image_info(xrefs=True)):
-                xref = int(image_info["xref"])
-                extracted = document.extract_image(xref)
-                extension = str(extracted.get("ext", "")).lower().lstrip(".")
-                if extension not in {"png", "jpg", "jpeg", "gif", "bmp", "tif", "tiff"}:
-                    continue
-                locations.append(
-                    {
-                        "page_number": page_index + 1,
-                        "page_image_index": page_image_index,
-                    }
-                )
-        return locations
-    finally:
-        document.close()
+        )
+    return findings
 
 
 
@@ -1315,13 +1292,6 @@ def _docx_container_text(container) -> str | None:
 
 
 
-def _image_dimensions(path: Path) -> tuple[int | None, int | None]:
-    with Image.open(path) as image:
-        width, height = image.size
-    return width, height
-
-
-
 def _location_key(location: dict) -> str:
     return json.dumps(location, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
 
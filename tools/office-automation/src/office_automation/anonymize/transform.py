@@ -15,6 +15,14 @@ Supported policy vocabulary is intentionally explicit and wrapper-friendly:
 - image replacement requires ``replacement_path`` (or a compatible alias)
 - image masking stays Python-only by generating a solid-color replacement asset
   with Pillow and then routing through ``office_automation.common.images``
+- image findings are indexed run-wide by content hash, so identical images across
+  files share one decision and one rendered mask while every occurrence keeps
+  its own action record; a replacement asset is rendered once per target format
+  whatever the source image
+- optional top-level ``pdf_save`` accepts ``mode`` ``full`` (default) or
+  ``incremental``; incremental mode appends intermediate PDF saves and, when
+  the applied change set removed or rewrote content, finishes with a single
+  ``clean_pdf`` pass so superseded objects never survive in earlier revisions
 
 Result model established for later SG3 tasks:
 - returned value is a list of per-file dictionaries
@@ -44,22 +52,31 @@ Important V1 non-scope / conservative behaviors:
 
 from __future__ import annotations
 
+import hashlib
 import json
 import tempfile
 from collections import OrderedDict
+from io import BytesIO
 from pathlib import Path
-
-import fitz
-from docx import Document
-from openpyxl import load_workbook
-from openpyxl.comments import Comment
-from PIL import Image, ImageColor
-from pptx import Presentation
-
-from office_automation.common.images import extract_images, replace_image
+from typing import TYPE_CHECKING
+
+from office_automation.common.backends import (
+    load_document_callable,
+    load_excel_comment_class,
+    load_pillow,
+    load_presentation_callable,
+    load_pymupdf,
+    load_workbook_callable,
+)
+from office_automation.common.images import list_image_inventory, render_image_bytes, replace_image
 from office_automation.common.metadata import clear_metadata, read_metadata
 
-__all__ = ["transform"]
+if TYPE_CHECKING:
+    import fitz
+    from docx.document import Document
+    from pptx.presentation import Presentation
+
+__all__ = ["clean_pdf", "transform"]
 
 _SUPPORTED_EXTENSIONS = {"xlsx", "xlsm", "docx", "pptx", "pdf"}
 _STRUCTURAL_CATEGORIES = {"comments", "notes", "headers", "footers"}
@@ -70,6 +87,21 @@ _ALLOWED_POLICY_ACTIONS = {"remove", "clear", "replace", "skip"}
 _ALLOWED_METADATA_ACTIONS = {"clear", "remove", "skip", "report_only"}
 _ALLOWED_IMAGE_ACTIONS = {"replace", "mask", "remove", "skip", "report_only"}
 _DEFAULT_IMAGE_MASK_COLOR = "#000000"
+_ALLOWED_PDF_SAVE_MODES = {"full", "incremental"}
+_DEFAULT_PDF_SAVE_MODE = "full"
+_PDF_CLEAN_GARBAGE_LEVEL = 1
+_PDF_OBJECT_REMOVAL_ACTIONS = {"remove", "clear", "replace", "mask"}
+_MASK_SAVE_FORMATS = {
+    "png": "PNG",
+    "jpg": "JPEG",
+    "jpeg": "JPEG",
+    "gif": "GIF",
+    "bmp": "BMP",
+    "tif": "TIFF",
+    "tiff": "TIFF",
+}
+_MASK_RENDER_CACHE_LIMIT = 64
+_MASK_RENDER_CACHE: OrderedDict[tuple[int, int, str, str], bytes] = OrderedDict()
 _EXCLUDED_IMAGE_CONTAINER_MARKERS = (
     "attachment",
     "embedded",
@@ -98,9 +130,72 @@ _EXCEL_HEADER_FOOTER_ATTRS = {
 
 
 class _FileMutationState:
-    def __init__(self, file_path: Path) -> None:
+    def __init__(self, file_path: Path, *, incremental_pdf_save: bool = False) -> None:
         self.file_path = file_path
         self.changed = False
+        self.incremental_pdf_save = incremental_pdf_save
+
+
+class _ImageInventorySnapshot:
+    """Image inventory read once per file; replacing one slot never reorders or resizes the others."""
+
+    def __init__(self, file_path: Path) -> None:
+        self.file_path = file_path
+        self._entries: list[dict] | None = None
+
+    def entries(self) -> list[dict]:
+        if self._entries is None:
+            self._entries = list_image_inventory(self.file_path)
+        return self._entries
+
+
+class _ImageContentIndex:
+    """Run-wide image content-hash index built from detect's per-slot ``sha256`` payloads.
+
+    Every file and slot carrying the same bytes shares one decision and one rendered
+    mask; each occurrence still gets its own action record. Replacement renders do not
+    depend on the source image, so they are shared by replacement digest and target
+    format across every source.
+    """
+
+    def __init__(self, detected: list[dict]) -> None:
+        self._occurrences: dict[str, list[dict]] = {}
+        self._rendered: dict[tuple, bytes] = {}
+        self._replacement_digests: dict[str, str] = {}
+        self._decisions: dict[str, tuple[str, list[str]]] = {}
+        for finding in detected:
+            if str(finding.get("category") or "") not in _IMAGE_CATEGORIES:
+                continue
+            digest = (finding.get("payload") or {}).get("sha256")
+            image_index = _finding_image_index(finding)
+            if not digest or image_index is None:
+                continue
+            self._occurrences.setdefault(str(digest), []).append(
+                {"image_index": image_index, "relative_path": finding.get("relative_path")}
+            )
+
+    def occurrence_count(self, digest: str) -> int:
+        return max(len(self._occurrences.get(digest, [])), 1)
+
+    def rendered(self, render_key: tuple, render) -> tuple[bytes, bool]:
+        cached = self._rendered.get(render_key)
+        if cached is not None:
+            return cached, True
+        rendered = render()
+        self._rendered[render_key] = rendered
+        return rendered, False
+
+    def replacement_digest(self, replacement_path: Path) -> str:
+        key = str(replacement_path)
+        if key not in self._replacement_digests:
+            self._replacement_digests[key] = hashlib.sha256(Path(replacement_path).read_bytes()).hexdigest()
+        return self._replacement_digests[key]
+
+    def decision(self, digest: str, decide) -> tuple[str, list[str]]:
+        if digest not in self._decisions:
+            self._decisions[digest] = decide()
+        effective_action, warnings = self._decisions[digest]
+        return effective_action, list(warnings)
 
 
 class _ResultCollector:
@@ -150,6 +245,16 @@ class _ImagePlan:
         self.policy_error = policy_error
 
 
+class _PdfSavePlan:
+    def __init__(self, *, mode: str = _DEFAULT_PDF_SAVE_MODE, warning: str | None = None) -> None:
+        self.mode = mode
+        self.warning = warning
+
+    @property
+    def incremental(self) -> bool:
+        return self.mode == "incremental"
+
+
 class _BodyTextPlan:
     def __init__(
         self,
@@ -177,6 +282,7 @@ class _BodyTextPlan:
 def transform(detected: list[dict], policy: dict) -> list[dict]:
     """Apply structural anonymization policy to detected findings."""
     grouped = _group_findings(detected)
+    content_index = _ImageContentIndex(detected)
     results: list[dict] = []
     for file_result, findings in grouped:
         collector = _ResultCollector(file_result)
@@ -214,7 +320,7 @@ def transform(detected: list[dict], policy: dict) -> list[dict]:
             continue
 
         try:
-            _transform_file(file_path, extension, findings, policy, collector)
+            _transform_file(file_path, extension, findings, policy, collector, content_index=content_index)
         except Exception as exc:  # pragma: no cover - exercised by future fault-injection tests
             collector.add_warning(f"Fatal transform failure for '{file_path}': {exc}")
             if not file_result["actions"]:
@@ -243,7 +349,70 @@ def transform(detected: list[dict], policy: dict) -> list[dict]:
 
 
 
-def _transform_file(file_path: Path, extension: str, findings: list[dict], policy: dict, collector: _ResultCollector) -> None:
+def clean_pdf(file_path: str | Path) -> None:
+    """Rewrite a PDF once so superseded revisions and unreferenced objects are dropped.
+
+    This is the cheap full-clean pass paired with ``pdf_save.mode="incremental"``:
+    unused-object collection only, without stream de-duplication or recompression.
+    """
+    path = Path(file_path)
+    fitz = load_pymupdf("PDF transforms")
+    document = fitz.open(path)
+    try:
+        if getattr(document, "needs_pass", False):
+            raise NotImplementedError(f"Encrypted PDF files are outside transform V1 scope: '{path}'.")
+        temp_path = _temporary_output_path(path)
+        try:
+            document.save(temp_path, garbage=_PDF_CLEAN_GARBAGE_LEVEL)
+            document.close()
+            temp_path.replace(path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+    finally:
+        if not document.is_closed:
+            document.close()
+
+
+
+def _transform_file(
+    file_path: Path,
+    extension: str,
+    findings: list[dict],
+    policy: dict,
+    collector: _ResultCollector,
+    *,
+    content_index: _ImageContentIndex | None = None,
+) -> None:
+    pdf_save_plan = _pdf_save_plan_for_policy(policy) if extension == "pdf" else _PdfSavePlan()
+    if pdf_save_plan.warning:
+        collector.add_warning(pdf_save_plan.warning)
+    try:
+        _transform_file_findings(
+            file_path,
+            extension,
+            findings,
+            policy,
+            collector,
+            pdf_save_plan=pdf_save_plan,
+            content_index=content_index,
+        )
+    finally:
+        if pdf_save_plan.incremental:
+            _finalize_incremental_pdf_saves(file_path, collector)
+
+
+
+def _transform_file_findings(
+    file_path: Path,
+    extension: str,
+    findings: list[dict],
+    policy: dict,
+    collector: _ResultCollector,
+    *,
+    pdf_save_plan: _PdfSavePlan,
+    content_index: _ImageContentIndex | None = None,
+) -> None:
     pre_save_findings = [
         finding
         for finding in findings
@@ -257,6 +426,7 @@ def _transform_file(file_path: Path, extension: str, findings: list[dict], polic
 
     if pre_save_findings:
         if extension in {"xlsx", "xlsm"}:
+            load_workbook = load_workbook_callable("Excel transforms")
             workbook = load_workbook(file_path, keep_vba=extension == "xlsm")
             state = _FileMutationState(file_path)
             try:
@@ -267,46 +437,102 @@ def _transform_file(file_path: Path, extension: str, findings: list[dict], polic
             finally:
                 _close_excel_workbook(workbook)
         elif extension == "docx":
-            document = Document(file_path)
+            load_document = load_document_callable("Word transforms")
+            document = load_document(file_path)
             state = _FileMutationState(file_path)
             for finding in pre_save_findings:
                 _apply_docx_finding(document, finding, policy, collector, state)
             if state.changed:
                 _save_docx_document(document, file_path)
         elif extension == "pptx":
-            presentation = Presentation(file_path)
+            load_presentation = load_presentation_callable("PowerPoint transforms")
+            presentation = load_presentation(file_path)
             state = _FileMutationState(file_path)
             for finding in pre_save_findings:
                 _apply_pptx_finding(presentation, finding, policy, collector, state)
             if state.changed:
                 _save_presentation(presentation, file_path)
         elif extension == "pdf":
+            fitz = load_pymupdf("PDF transforms")
             document = fitz.open(file_path)
             try:
                 if getattr(document, "needs_pass", False):
                     raise NotImplementedError(f"Encrypted PDF files are outside transform V1 scope: '{file_path}'.")
-                state = _FileMutationState(file_path)
+                state = _FileMutationState(file_path, incremental_pdf_save=pdf_save_plan.incremental)
                 for finding in pre_save_findings:
                     _apply_pdf_finding(document, finding, policy, collector, state)
                 if state.changed:
-                    _save_pdf_document(document, file_path)
+                    _save_pdf_document(document, file_path, incremental=state.incremental_pdf_save)
             finally:
                 document.close()
         else:
             raise ValueError(f"Unsupported extension '{extension}' for '{file_path}'.")
 
+    image_inventory = _ImageInventorySnapshot(file_path)
     for finding in post_save_findings:
         category = str(finding.get("category") or "")
         if category == "metadata":
-            _apply_metadata_finding(file_path, finding, policy, collector)
+            _apply_metadata_finding(file_path, finding, policy, collector, incremental_pdf_save=pdf_save_plan.incremental)
             continue
         if category == "images":
-            _apply_image_finding(file_path, extension, finding, policy, collector)
+            _apply_image_finding(
+                file_path,
+                extension,
+                finding,
+                policy,
+                collector,
+                image_inventory=image_inventory,
+                content_index=content_index,
+                incremental_pdf_save=pdf_save_plan.incremental,
+            )
             continue
         collector.add_action(_deferred_scope_action(finding))
 
 
 
+def _finalize_incremental_pdf_saves(file_path: Path, collector: _ResultCollector) -> None:
+    requires_object_removal = _pdf_change_set_requires_object_removal(collector.file_result["actions"])
+    save_details = {
+        "clean_pass_applied": False,
+        "mode": "incremental",
+        "requires_object_removal": requires_object_removal,
+    }
+    if requires_object_removal and file_path.exists():
+        try:
+            clean_pdf(file_path)
+        except Exception as exc:
+            collector.add_warning(
+                f"Incremental PDF saves could not be finalized by a clean pass for '{file_path}': {exc}. "
+                "Superseded objects may remain in earlier revisions."
+            )
+            collector.file_result["manual_review_items"].append(
+                {
+                    "finding_id": None,
+                    "category": None,
+                    "location": {},
+                    "requested_action": "clean",
+                    "reason": (
+                        "PDF clean pass failed after incremental saves, so removed or rewritten content may still be "
+                        "recoverable from earlier file revisions."
+                    ),
+                }
+            )
+        else:
+            save_details["clean_pass_applied"] = True
+    collector.file_result["pdf_save"] = save_details
+
+
+
+def _pdf_change_set_requires_object_removal(actions: list[dict]) -> bool:
+    # Appended revisions keep every superseded object readable, so any applied
+    # removal or rewrite needs a full clean pass to meet anonymization guarantees.
+    return any(
+        action.get("status") == "applied" and action.get("applied_action") in _PDF_OBJECT_REMOVAL_ACTIONS
+        for action in actions
+    )
+
+
+
 def _apply_excel_finding(workbook, finding: dict, policy: dict, collector: _ResultCollector, state: _FileMutationState) -> None:
     category = str(finding.get("category") or "")
     if category == "body_text":
@@ -336,7 +562,8 @@ def _apply_excel_finding(workbook, finding: dict, policy: dict, collector: _Resu
             return
 
         replacement_text = plan.replacement_text or ""
-        cell.comment = Comment(replacement_text, " ")
+        comment_class = load_excel_comment_class("Excel transforms")
+        cell.comment = comment_class(replacement_text, " ")
         state.changed = True
         collector.add_action(
             _base_action(
@@ -1178,7 +1405,14 @@ def _string_set(value: object) -> set[str]:
 
 
 
-def _apply_metadata_finding(file_path: Path, finding: dict, policy: dict, collector: _ResultCollector) -> None:
+def _apply_metadata_finding(
+    file_path: Path,
+    finding: dict,
+    policy: dict,
+    collector: _ResultCollector,
+    *,
+    incremental_pdf_save: bool = False,
+) -> None:
     category = str(finding.get("category") or "")
     plan = _metadata_plan_for_finding(policy)
     if action := _precomputed_action_if_needed(finding, category, plan, handled_categories=_METADATA_CATEGORIES):
@@ -1207,7 +1441,7 @@ def _apply_metadata_finding(file_path: Path, finding: dict, policy: dict, collec
         return
 
     try:
-        clear_metadata(file_path)
+        clear_metadata(file_path, incremental=incremental_pdf_save)
     except NotImplementedError as exc:
         collector.add_action(
             _base_action(
@@ -1297,7 +1531,17 @@ def _apply_metadata_finding(file_path: Path, finding: dict, policy: dict, collec
 
 
 
-def _apply_image_finding(file_path: Path, extension: str, finding: dict, policy: dict, collector: _ResultCollector) -> None:
+def _apply_image_finding(
+    file_path: Path,
+    extension: str,
+    finding: dict,
+    policy: dict,
+    collector: _ResultCollector,
+    *,
+    image_inventory: _ImageInventorySnapshot | None = None,
+    content_index: _ImageContentIndex | None = None,
+    incremental_pdf_save: bool = False,
+) -> None:
     category = str(finding.get("category") or "")
     plan = _image_plan_for_finding(policy)
     if action := _precomputed_action_if_needed(finding, category, plan, handled_categories=_IMAGE_CATEGORIES):
@@ -1334,7 +1578,7 @@ def _apply_image_finding(file_path: Path, extension: str, finding: dict, policy:
         return
 
     try:
-        before_context = _image_before_context(file_path, image_index=image_index)
+        before_context = _image_before_context(file_path, image_index=image_index, image_inventory=image_inventory)
     except IndexError as exc:
         collector.add_action(
             _base_action(
@@ -1375,33 +1619,51 @@ def _apply_image_finding(file_path: Path, extension: str, finding: dict, policy:
         return
 
     requested_action = plan.requested_action
-    effective_action = requested_action
-    warnings: list[str] = []
+    digest = str(before_context.get("sha256") or "")
+    if content_index is not None and digest:
+        effective_action, warnings = content_index.decision(digest, lambda: _image_decision(plan))
+    else:
+        effective_action, warnings = _image_decision(plan)
     details = {
         "before": before_context,
         "container_extension": extension,
         "image_index": image_index,
     }
+    if digest:
+        details["content_sha256"] = digest
+        if content_index is not None:
+            details["content_occurrence_count"] = content_index.occurrence_count(digest)
+    target_extension = "png" if extension == "pdf" else str(before_context["extension"])
 
     try:
-        if requested_action == "replace":
-            replace_image(file_path, image_index, plan.replacement_path)
+        if effective_action == "replace":
+            # The replacement is encoded as-is (no resize), so its render depends only on the
+            # replacement bytes and the target format, never on the source image.
+            replacement_key = (
+                content_index.replacement_digest(plan.replacement_path) if content_index is not None else "",
+                effective_action,
+                target_extension,
+            )
+            replacement_bytes, render_reused = _rendered_image_replacement(
+                content_index,
+                replacement_key,
+                lambda: render_image_bytes(plan.replacement_path, target_extension=target_extension),
+            )
+            replace_image(file_path, image_index, replacement_bytes, incremental=incremental_pdf_save)
             details["replacement_path"] = str(plan.replacement_path)
         else:
-            if requested_action == "remove":
-                effective_action = "mask"
-                warnings.append(
-                    "Requested image removal was downgraded to masking because this V1 runtime does not claim a universally safe remove path."
-                )
-            with tempfile.TemporaryDirectory(prefix="office-automation-transform-mask-") as temp_dir:
-                mask_path = _create_mask_image_asset(
-                    Path(temp_dir),
-                    image_index=image_index,
+            mask_bytes, render_reused = _rendered_image_replacement(
+                content_index,
+                (digest, effective_action, target_extension, plan.mask_color),
+                lambda: _render_mask_bytes(
                     size=(before_context["width"], before_context["height"]),
                     color=plan.mask_color,
-                )
-                replace_image(file_path, image_index, mask_path)
-                details["mask_color"] = plan.mask_color
+                    target_extension=target_extension,
+                ),
+            )
+            replace_image(file_path, image_index, mask_bytes, incremental=incremental_pdf_save)
+            details["mask_color"] = plan.mask_color
+        details["render_reused"] = render_reused
     except NotImplementedError as exc:
         manual_review_reason = str(exc)
         if requested_action == "remove":
@@ -1619,6 +1881,27 @@ def _image_plan_for_finding(policy: dict) -> _ImagePlan:
 
 
 
+def _pdf_save_plan_for_policy(policy: dict) -> _PdfSavePlan:
+    save_policy = policy.get("pdf_save")
+    if save_policy is None:
+        return _PdfSavePlan()
+    if not isinstance(save_policy, dict):
+        return _PdfSavePlan(
+            warning="Policy entry 'pdf_save' must be a dict; PDF changes were saved with a full rewrite.",
+        )
+
+    mode = str(save_policy.get("mode", _DEFAULT_PDF_SAVE_MODE)).strip().lower() or _DEFAULT_PDF_SAVE_MODE
+    if mode not in _ALLOWED_PDF_SAVE_MODES:
+        return _PdfSavePlan(
+            warning=(
+                f"Unsupported pdf_save mode '{mode}'. Supported modes: full, incremental. "
+                "PDF changes were saved with a full rewrite."
+            ),
+        )
+    return _PdfSavePlan(mode=mode)
+
+
+
 def _replacement_text_from_policy(category_policy: dict) -> str | None:
     for key in ("replacement_text", "replacement", "text"):
         value = category_policy.get(key)
@@ -1758,32 +2041,63 @@ def _finding_image_index(finding: dict) -> int | None:
 
 
 
-def _image_before_context(file_path: Path, *, image_index: int) -> dict:
-    with tempfile.TemporaryDirectory(prefix="office-automation-transform-images-") as temp_dir:
-        extracted_paths = extract_images(file_path, Path(temp_dir))
-        if image_index >= len(extracted_paths):
-            raise IndexError(
-                f"Image index {image_index} is out of range for '{file_path}'. Available image count: {len(extracted_paths)}."
-            )
-        image_path = extracted_paths[image_index]
-        width, height = _image_dimensions_for_path(image_path)
-        return {
-            "extracted_filename": image_path.name,
-            "height": height,
-            "width": width,
-        }
+def _image_before_context(
+    file_path: Path,
+    *,
+    image_index: int,
+    image_inventory: _ImageInventorySnapshot | None = None,
+) -> dict:
+    inventory = image_inventory.entries() if image_inventory is not None else list_image_inventory(file_path)
+    if image_index >= len(inventory):
+        raise IndexError(
+            f"Image index {image_index} is out of range for '{file_path}'. Available image count: {len(inventory)}."
+        )
+    entry = inventory[image_index]
+    return {
+        "extension": entry["extension"],
+        "extracted_filename": entry["extracted_filename"],
+        "height": entry["height"],
+        "sha256": entry["sha256"],
+        "width": entry["width"],
+    }
+
 
 
+def _image_decision(plan: _ImagePlan) -> tuple[str, list[str]]:
+    if plan.requested_action == "remove":
+        return "mask", [
+            "Requested image removal was downgraded to masking because this V1 runtime does not claim a universally safe remove path."
+        ]
+    return plan.requested_action, []
+
 
-def _create_mask_image_asset(directory: Path, *, image_index: int, size: tuple[int, int], color: str) -> Path:
+
+def _rendered_image_replacement(content_index: _ImageContentIndex | None, render_key: tuple, render) -> tuple[bytes, bool]:
+    if content_index is None or not render_key[0]:
+        return render(), False
+    return content_index.rendered(render_key, render)
+
+
+
+def _render_mask_bytes(*, size: tuple[int | None, int | None], color: str, target_extension: str) -> bytes:
     width = int(size[0]) if size[0] else 1
     height = int(size[1]) if size[1] else 1
-    width = max(width, 1)
-    height = max(height, 1)
-    rgb = ImageColor.getrgb(color)
-    path = directory / f"image-mask-{image_index:04d}.png"
-    Image.new("RGB", (width, height), rgb).save(path, format="PNG")
-    return path
+    cache_key = (max(width, 1), max(height, 1), color, target_extension)
+    cached = _MASK_RENDER_CACHE.get(cache_key)
+    if cached is not None:
+        _MASK_RENDER_CACHE.move_to_end(cache_key)
+        return cached
+
+    PIL = load_pillow("image masking")
+    Image, ImageColor = PIL.Image, PIL.ImageColor
+    mask = Image.new("RGB", cache_key[:2], ImageColor.getrgb(color))
+    buffer = BytesIO()
+    mask.save(buffer, format=_MASK_SAVE_FORMATS.get(target_extension, "PNG"))
+    rendered = buffer.getvalue()
+    _MASK_RENDER_CACHE[cache_key] = rendered
+    while len(_MASK_RENDER_CACHE) > _MASK_RENDER_CACHE_LIMIT:
+        _MASK_RENDER_CACHE.popitem(last=False)
+    return rendered
 
 
 
@@ -1820,18 +2134,12 @@ def _iter_string_values(value):
 
 
 
-def _image_dimensions_for_path(path: Path) -> tuple[int, int]:
-    with Image.open(path) as image:
-        width, height = image.size
-    return width, height
-
-
-
 def _normalize_mask_color(value) -> str:
     if isinstance(value, str):
         color = value.strip()
         if not color:
             raise ValueError("Image mask color must not be empty.")
+        ImageColor = load_pillow("image masking").ImageColor
         rgb = ImageColor.getrgb(color)
         return "#" + "".join(f"{channel:02x}" for channel in rgb)
     if isinstance(value, (list, tuple)) and len(value) in {3, 4}:
@@ -1876,7 +2184,11 @@ def _save_presentation(presentation: Presentation, path: Path) -> None:
 
 
 
-def _save_pdf_document(document: fitz.Document, path: Path) -> None:
+def _save_pdf_document(document: fitz.Document, path: Path, *, incremental: bool = False) -> None:
+    if incremental and document.can_save_incrementally():
+        document.save(path, incremental=True, encryption=load_pymupdf("PDF transforms").PDF_ENCRYPT_KEEP)
+        return
+
     temp_path = _temporary_output_path(path)
     try:
         document.save(temp_path, garbage=4)
@@ -0,0 +1,76 @@
+"""Lazy loaders for the optional format backends.
+
+Modules call these at the point they touch a format, so importing them never
+pays for every backend. ``purpose`` names the calling feature in the
+``ModuleNotFoundError`` raised when a backend is missing.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "load_document_callable",
+    "load_excel_comment_class",
+    "load_presentation_callable",
+    "load_pillow",
+    "load_pymupdf",
+    "load_workbook_callable",
+]
+
+_PDF_EXTRA_HINT = "Install the office-automation 'pdf' dependencies."
+_OFFICE_EDIT_HINT = "Install the office-edit dependencies."
+_ANONYMIZE_EXTRA_HINT = "Install the office-automation 'anonymize' dependencies."
+
+
+def load_pymupdf(purpose: str):
+    """Return the ``fitz`` (PyMuPDF) module."""
+    try:
+        import fitz
+    except ModuleNotFoundError as exc:  # pragma: no cover - depends on environment.
+        raise ModuleNotFoundError(f"PyMuPDF is required for {purpose}. {_PDF_EXTRA_HINT}") from exc
+    return fitz
+
+
+def load_workbook_callable(purpose: str):
+    """Return ``openpyxl.load_workbook``."""
+    try:
+        from openpyxl import load_workbook
+    except ModuleNotFoundError as exc:  # pragma: no cover - depends on environment.
+        raise ModuleNotFoundError(f"openpyxl is required for {purpose}. {_OFFICE_EDIT_HINT}") from exc
+    return load_workbook
+
+
+def load_excel_comment_class(purpose: str):
+    """Return ``openpyxl.comments.Comment``."""
+    try:
+        from openpyxl.comments import Comment
+    except ModuleNotFoundError as exc:  # pragma: no cover - depends on environment.
+        raise ModuleNotFoundError(f"openpyxl is required for {purpose}. {_OFFICE_EDIT_HINT}") from exc
+    return Comment
+
+
+def load_document_callable(purpose: str):
+    """Return ``docx.Document``."""
+    try:
+        from docx import Document as load_document
+    except ModuleNotFoundError as exc:  # pragma: no cover - depends on environment.
+        raise ModuleNotFoundError(f"python-docx is required for {purpose}. {_OFFICE_EDIT_HINT}") from exc
+    return load_document
+
+
+def load_presentation_callable(purpose: str):
+    """Return ``pptx.Presentation``."""
+    try:
+        from pptx import Presentation as load_presentation
+    except ModuleNotFoundError as exc:  # pragma: no cover - depends on environment.
+        raise ModuleNotFoundError(f"python-pptx is required for {purpose}. {_OFFICE_EDIT_HINT}") from exc
+    return load_presentation
+
+
+def load_pillow(purpose: str):
+    """Return the ``PIL`` package with its ``Image`` and ``ImageColor`` modules imported."""
+    try:
+        import PIL.Image
+        import PIL.ImageColor
+    except ModuleNotFoundError as exc:  # pragma: no cover - depends on environment.
+        raise ModuleNotFoundError(f"Pillow is required for {purpose}. {_ANONYMIZE_EXTRA_HINT}") from exc
+    return PIL
@@ -0,0 +1,382 @@
+"""Optional local worker daemon that keeps the Office runtime imports warm.
+
+Wrappers stay plain in-process callables; this module only adds a Unix socket
+front door for them. Each request runs in a child forked from a forkserver that
+has already imported the heavy format libraries, so a call pays for a fork
+instead of a fresh interpreter, and a stuck request can be killed on timeout
+without touching the others.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+import importlib
+import json
+import multiprocessing
+from os import PathLike
+import os
+from pathlib import Path
+import signal
+import socket
+import sys
+import threading
+
+__all__ = [
+    "DaemonRequestError",
+    "DaemonUnavailable",
+    "call",
+    "call_or_run",
+    "default_socket_path",
+    "main",
+    "serve",
+]
+
+SOCKET_ENV_VAR = "OFFICE_AUTOMATION_DAEMON_SOCKET"
+_DEFAULT_WORKERS = 4
+_DEFAULT_REQUEST_TIMEOUT = 300.0
+# Extra seconds the client waits past the request timeout for the daemon's own timeout reply.
+_CLIENT_TIMEOUT_GRACE = 5.0
+_MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+_ACCEPT_POLL_SECONDS = 0.5
+_DEFAULT_PRELOAD = (
+    "openpyxl",
+    "docx",
+    "pptx",
+    "fitz",
+    "pdfplumber",
+    "PIL.Image",
+    "office_automation.excel_ops",
+    "office_automation.word_ops",
+    "office_automation.powerpoint_ops",
+    "office_automation.pdf_ops",
+    "office_automation.anonymize.detect",
+    "office_automation.anonymize.transform",
+    "office_automation.anonymize.validate",
+)
+
+
+class DaemonUnavailable(ConnectionError):
+    """Raised by the client when no daemon is listening on the socket."""
+
+
+class DaemonRequestError(RuntimeError):
+    """Raised by the client when the daemon could not produce a handler result."""
+
+    def __init__(self, error_type: str, message: str) -> None:
+        super().__init__(message)
+        self.error_type = error_type
+
+
+def default_socket_path() -> Path:
+    """Return the per-user socket path, honouring ``OFFICE_AUTOMATION_DAEMON_SOCKET``."""
+    override = os.environ.get(SOCKET_ENV_VAR)
+    if override:
+        return Path(override)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "office-automation" / "daemon.sock"
+    return Path("/tmp") / f"office-automation-{os.getuid()}" / "daemon.sock"
+
+
+def call(
+    handler: str,
+    request: Mapping,
+    *,
+    socket_path: str | PathLike[str] | None = None,
+    timeout: float | None = None,
+) -> object:
+    """Run ``handler`` on ``request`` in the daemon and return its JSON-decoded result.
+
+    Raises DaemonUnavailable when nothing is listening, and DaemonRequestError when
+    the daemon answered with an error (unknown handler, handler exception, timeout).
+    """
+    target = Path(socket_path) if socket_path is not None else default_socket_path()
+    # Relative paths in the request must resolve against the caller's cwd, not the daemon's.
+    envelope = {"handler": handler, "request": request, "cwd": os.getcwd()}
+    if timeout is not None:
+        envelope["timeout"] = timeout
+    payload = json.dumps(envelope, ensure_ascii=False, default=str).encode("utf-8") + b"\n"
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            client.connect(str(target))
+        except (FileNotFoundError, ConnectionRefusedError) as exc:
+            raise DaemonUnavailable(f"No office-automation daemon is listening on '{target}'.") from exc
+        client.settimeout(None if timeout is None else timeout + _CLIENT_TIMEOUT_GRACE)
+        client.sendall(payload)
+        client.shutdown(socket.SHUT_WR)
+        reply = _read_message(client)
+    finally:
+        client.close()
+
+    if reply is None:
+        raise DaemonRequestError("ConnectionError", f"The daemon on '{target}' closed the connection without a reply.")
+    response = json.loads(reply)
+    if not response.get("ok"):
+        error = response.get("error") or {}
+        raise DaemonRequestError(str(error.get("type", "RuntimeError")), str(error.get("message", "")))
+    return response["result"]
+
+
+def call_or_run(
+    handler: str,
+    request: Mapping,
+    fallback: Callable[[Mapping], object],
+    *,
+    socket_path: str | PathLike[str] | None = None,
+    timeout: float | None = None,
+) -> object:
+    """Send ``request`` to the daemon, or run ``fallback(request)`` in-process if none is listening."""
+    try:
+        return call(handler, request, socket_path=socket_path, timeout=timeout)
+    except DaemonUnavailable:
+        return fallback(request)
+
+
+def serve(
+    socket_path: str | PathLike[str],
+    handlers: Mapping[str, str],
+    *,
+    max_workers: int = _DEFAULT_WORKERS,
+    request_timeout: float = _DEFAULT_REQUEST_TIMEOUT,
+    preload: Sequence[str] = _DEFAULT_PRELOAD,
+    stop_event: threading.Event | None = None,
+) -> None:
+    """Serve ``handlers`` (``{name: "module:function"}``) on a Unix socket until stopped.
+
+    At most ``max_workers`` requests run at once, each in its own forked child that
+    is killed once ``request_timeout`` seconds (or the smaller per-request
+    ``timeout``) have passed. Blocks until ``stop_event`` is set or SIGTERM/SIGINT.
+    """
+    if max_workers < 1:
+        raise ValueError("Daemon max_workers must be at least 1.")
+    if request_timeout <= 0:
+        raise ValueError("Daemon request_timeout must be positive.")
+    handler_specs = {name: _validate_handler_spec(name, spec) for name, spec in handlers.items()}
+    if not handler_specs:
+        raise ValueError("Daemon requires at least one handler.")
+
+    target = Path(socket_path)
+    _prepare_socket_directory(target.parent)
+    _remove_stale_socket(target)
+
+    context = multiprocessing.get_context("forkserver")
+    modules = {spec.partition(":")[0] for spec in handler_specs.values()}
+    context.set_forkserver_preload([*preload, *sorted(modules)])
+
+    stop = stop_event or threading.Event()
+    if stop_event is None and threading.current_thread() is threading.main_thread():
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda *_: stop.set())
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        listener.bind(str(target))
+        os.chmod(target, 0o600)
+        listener.listen(max_workers * 4)
+        listener.settimeout(_ACCEPT_POLL_SECONDS)
+        # Only accept while a worker slot is free, so overflow waits in the listen backlog.
+        slots = threading.BoundedSemaphore(max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="office-daemon") as pool:
+            while not stop.is_set():
+                if not slots.acquire(timeout=_ACCEPT_POLL_SECONDS):
+                    continue
+                try:
+                    connection, _ = listener.accept()
+                except socket.timeout:
+                    slots.release()
+                    continue
+                connection.settimeout(None)
+                future = pool.submit(_serve_connection, connection, context, handler_specs, request_timeout)
+                future.add_done_callback(lambda _: slots.release())
+    finally:
+        listener.close()
+        target.unlink(missing_ok=True)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m office_automation.common.daemon",
+        description="Serve office-automation wrapper handlers over a local Unix socket.",
+    )
+    parser.add_argument("--socket", type=Path, default=None, help="socket path (default: per-user runtime dir)")
+    parser.add_argument(
+        "--handler",
+        action="append",
+        default=[],
+        metavar="NAME=MODULE:FUNCTION",
+        required=True,
+        help="expose MODULE:FUNCTION as NAME; repeatable",
+    )
+    parser.add_argument(
+        "--pythonpath",
+        action="append",
+        default=[],
+        type=Path,
+        metavar="DIR",
+        help="directory to prepend to sys.path before importing handlers; repeatable",
+    )
+    parser.add_argument("--workers", type=int, default=_DEFAULT_WORKERS)
+    parser.add_argument("--timeout", type=float, default=_DEFAULT_REQUEST_TIMEOUT, help="per-request seconds")
+    args = parser.parse_args(argv)
+
+    for directory in reversed(args.pythonpath):
+        resolved = str(directory.resolve())
+        if resolved not in sys.path:
+            sys.path.insert(0, resolved)
+
+    handlers: dict[str, str] = {}
+    for item in args.handler:
+        name, separator, spec = item.partition("=")
+        if not separator or not name:
+            parser.error(f"--handler expects NAME=MODULE:FUNCTION, got '{item}'.")
+        handlers[name] = spec
+
+    serve(
+        args.socket if args.socket is not None else default_socket_path(),
+        handlers,
+        max_workers=args.workers,
+        request_timeout=args.timeout,
+    )
+
+
+
+def _validate_handler_spec(name: str, spec: str) -> str:
+    module_name, separator, attribute = spec.partition(":")
+    if not separator or not module_name or not attribute:
+        raise ValueError(f"Daemon handler '{name}' must be 'module:function', got '{spec}'.")
+    handler = getattr(importlib.import_module(module_name), attribute, None)
+    if not callable(handler):
+        raise ValueError(f"Daemon handler '{name}' does not resolve to a callable: '{spec}'.")
+    return spec
+
+
+def _prepare_socket_directory(directory: Path) -> None:
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    stat_result = directory.stat()
+    if stat_result.st_uid != os.getuid():
+        raise PermissionError(f"Daemon socket directory '{directory}' is owned by another user.")
+    if stat_result.st_mode & 0o077:
+        os.chmod(directory, 0o700)
+
+
+def _remove_stale_socket(target: Path) -> None:
+    if not target.exists():
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(target))
+    except ConnectionRefusedError:
+        target.unlink()
+        return
+    finally:
+        probe.close()
+    raise RuntimeError(f"An office-automation daemon is already listening on '{target}'.")
+
+
+def _serve_connection(connection: socket.socket, context, handler_specs: Mapping[str, str], request_timeout: float) -> None:
+    with connection:
+        try:
+            response = _dispatch(_read_message(connection), context, handler_specs, request_timeout)
+        except Exception as exc:
+            response = _error_response(exc.__class__.__name__, str(exc))
+        try:
+            connection.sendall(response.encode("utf-8") + b"\n")
+        except OSError:
+            pass  # client went away; nothing left to report to
+
+
+def _dispatch(message: bytes | None, context, handler_specs: Mapping[str, str], request_timeout: float) -> str:
+    if message is None:
+        return _error_response("ValueError", "Daemon request was empty.")
+    envelope = json.loads(message)
+    if not isinstance(envelope, dict):
+        return _error_response("TypeError", "Daemon request must be a JSON object.")
+    handler = envelope.get("handler")
+    if handler not in handler_specs:
+        return _error_response("LookupError", f"Unknown daemon handler '{handler}'.")
+
+    timeout = request_timeout
+    requested_timeout = envelope.get("timeout")
+    if isinstance(requested_timeout, (int, float)) and not isinstance(requested_timeout, bool) and requested_timeout > 0:
+        timeout = min(timeout, float(requested_timeout))
+
+    cwd = envelope.get("cwd")
+    reader, writer = context.Pipe(duplex=False)
+    # Not daemonic: handlers may start their own process pools (candidate_scan, run_batch),
+    # which multiprocessing forbids in daemonic children. The finally block reaps it instead.
+    child = context.Process(
+        target=_run_handler,
+        args=(handler_specs[handler], envelope.get("request"), writer, cwd if isinstance(cwd, str) else None),
+    )
+    child.start()
+    writer.close()
+    try:
+        if not reader.poll(timeout):
+            return _error_response("TimeoutError", f"Daemon handler '{handler}' exceeded {timeout:g} seconds.")
+        try:
+            return reader.recv()
+        except EOFError:
+            return _error_response("RuntimeError", f"Daemon handler '{handler}' exited with code {child.exitcode}.")
+    finally:
+        reader.close()
+        _kill_process_group(child.pid)
+        if child.is_alive():
+            child.kill()
+        child.join()
+
+
+def _kill_process_group(pgid: int | None) -> None:
+    if pgid is None:
+        return
+    try:
+        os.killpg(pgid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass  # group already gone, or the child never got as far as setpgrp
+
+
+def _run_handler(spec: str, request: object, writer, cwd: str | None = None) -> None:
+    # Own process group, so a timeout kill also reaches any pool workers the handler started.
+    os.setpgrp()
+    try:
+        if cwd is not None:
+            os.chdir(cwd)
+        module_name, _, attribute = spec.partition(":")
+        result = getattr(importlib.import_module(module_name), attribute)(request)
+        response = json.dumps({"ok": True, "result": result}, ensure_ascii=False, default=str)
+    except Exception as exc:
+        response = _error_response(exc.__class__.__name__, str(exc))
+    writer.send(response)
+    writer.close()
+
+
+def _read_message(connection: socket.socket) -> bytes | None:
+    chunks: list[bytes] = []
+    size = 0
+    while True:
+        chunk = connection.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > _MAX_MESSAGE_BYTES:
+            raise ValueError(f"Daemon message exceeds {_MAX_MESSAGE_BYTES} bytes.")
+        if chunk.endswith(b"\n"):
+            break
+    message = b"".join(chunks).strip()
+    return message or None
+
+
+def _error_response(error_type: str, message: str) -> str:
+    return json.dumps({"ok": False, "error": {"type": error_type, "message": message}}, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    # Re-enter through the package module so forkserver children unpickle
+    # _run_handler by its importable name rather than as __main__._run_handler.
+    from office_automation.common import daemon as _daemon
+
+    _daemon.main()
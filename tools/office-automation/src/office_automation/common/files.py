@@ -4,14 +4,22 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from os import PathLike
+import os
 from pathlib import Path
 import shutil
 
-__all__ = ["copy_original", "list_office_files"]
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+__all__ = ["clone_file", "copy_original", "list_office_files"]
 
 _SUPPORTED_EXTENSIONS = frozenset({"xlsx", "xlsm", "docx", "pptx", "pdf"})
 _SUPPORTED_EXTENSIONS_TEXT = ", ".join(sorted(_SUPPORTED_EXTENSIONS))
 _COPY_SUFFIX = "-copy"
+# linux/fs.h FICLONE = _IOW(0x94, 9, int): share extents copy-on-write (btrfs, XFS, ...).
+_FICLONE = 0x40049409
 
 
 def copy_original(src: str | PathLike[str], dest_dir: str | PathLike[str]) -> Path:
@@ -24,10 +32,29 @@ def copy_original(src: str | PathLike[str], dest_dir: str | PathLike[str]) -> Pa
     _ensure_directory(destination_directory, label="Destination directory")
 
     target = _resolve_copy_target(source, destination_directory)
-    shutil.copy2(source, target)
+    clone_file(source, target)
+    shutil.copystat(source, target)
     return target
 
 
+def clone_file(src: str | PathLike[str], dest: str | PathLike[str]) -> str:
+    """Create dest with src's bytes using the cheapest copy the filesystem offers.
+
+    Tries a copy-on-write reflink first, then an in-kernel ``copy_file_range``,
+    then a plain copy, and returns which one was used: ``"reflink"``,
+    ``"copy_file_range"`` or ``"copy"``. dest must not exist yet; metadata is
+    not copied.
+    """
+    source = _coerce_path(src)
+    target = _coerce_path(dest)
+    with source.open("rb") as reader, target.open("xb") as writer:
+        method = _clone_descriptor(reader.fileno(), writer.fileno())
+    if method is None:
+        shutil.copyfile(source, target)
+        method = "copy"
+    return method
+
+
 def list_office_files(
     folder: str | PathLike[str],
     extensions: Iterable[str] | None = None,
@@ -54,6 +81,29 @@ def _coerce_path(value: str | PathLike[str]) -> Path:
 
 
 
+def _clone_descriptor(src_fd: int, dst_fd: int) -> str | None:
+    if fcntl is not None:
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            return "reflink"
+        except OSError:
+            pass
+    if not hasattr(os, "copy_file_range"):
+        return None
+    size = os.fstat(src_fd).st_size
+    offset = 0
+    try:
+        while offset < size:
+            copied = os.copy_file_range(src_fd, dst_fd, size - offset, offset, offset)
+            if copied == 0:
+                break
+            offset += copied
+    except OSError:
+        return None
+    return "copy_file_range" if offset == size else None
+
+
+
 def _normalize_extension(extension: str, *, context: str) -> str:
     if not isinstance(extension, str):
         raise TypeError(f"{context} values must be strings.")
@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+import hashlib
 from io import BytesIO
 from os import PathLike
 from pathlib import Path
 import shutil
+import struct
+from typing import TYPE_CHECKING
 import zipfile
 
-import fitz
-from PIL import Image, UnidentifiedImageError
+from office_automation.common.backends import load_pillow, load_pymupdf
 
-__all__ = ["extract_images", "replace_image"]
+if TYPE_CHECKING:
+    from PIL import Image
+
+__all__ = ["extract_images", "list_image_inventory", "render_image_bytes", "replace_image"]
 
 _SUPPORTED_EXTENSIONS = frozenset({"xlsx", "xlsm", "docx", "pptx", "pdf"})
 _SUPPORTED_EXTENSIONS_TEXT = ", ".join(sorted(_SUPPORTED_EXTENSIONS))
@@ -31,6 +37,10 @@ _PILLOW_SAVE_FORMATS = {
     "tif": "TIFF",
     "tiff": "TIFF",
 }
+_JPEG_SOF_MARKERS = frozenset({0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF})
+_JPEG_STANDALONE_MARKERS = frozenset({0x01, *range(0xD0, 0xDA)})
+_INVENTORY_CACHE_LIMIT = 32
+_INVENTORY_CACHE: OrderedDict[tuple, list[dict[str, object]]] = OrderedDict()
 
 
 def extract_images(file_path: str | PathLike[str] | Path, output_dir: str | PathLike[str] | Path) -> list[Path]:
@@ -57,27 +67,84 @@ def extract_images(file_path: str | PathLike[str] | Path, output_dir: str | Path
     return extracted_paths
 
 
+def list_image_inventory(file_path: str | PathLike[str] | Path) -> list[dict[str, object]]:
+    """List image slots in memory, using the same index contract as ``extract_images``.
+
+    Each entry carries the slot locator (``archive_name`` for Office packages, page and xref
+    for PDFs), ``extension``, probed ``format``, ``byte_size``, ``sha256``, ``width``, ``height``
+    and the ``extracted_filename`` that ``extract_images`` would have written. Dimensions come
+    from image header bytes; nothing is written to disk. Results are memoized per file
+    identity (path, inode, size, mtime), so detect and transform share one listing.
+    """
+    source = _validate_source_path(file_path, label="Image source file")
+    cache_key = _inventory_cache_key(source)
+    cached = _INVENTORY_CACHE.get(cache_key)
+    if cached is None:
+        if _path_extension(source) == "pdf":
+            slots = _list_pdf_image_slots(source)
+        else:
+            slots = _iter_office_image_slots(source)
+        xref_probes: dict[int, tuple] = {}
+        cached = [
+            _inventory_entry(source, image_index, slot, xref_probes=xref_probes)
+            for image_index, slot in enumerate(slots)
+        ]
+        _INVENTORY_CACHE[cache_key] = cached
+        while len(_INVENTORY_CACHE) > _INVENTORY_CACHE_LIMIT:
+            _INVENTORY_CACHE.popitem(last=False)
+    else:
+        _INVENTORY_CACHE.move_to_end(cache_key)
+    return [dict(entry) for entry in cached]
+
+
 def replace_image(
     file_path: str | PathLike[str] | Path,
     image_index: int,
-    replacement: str | PathLike[str] | Path,
+    replacement: str | PathLike[str] | Path | bytes | Image.Image,
+    *,
+    incremental: bool = False,
 ) -> None:
-    """Replace a previously indexed image slot in place."""
+    """Replace a previously indexed image slot in place.
+
+    ``replacement`` may be an image file path, encoded image bytes, or a PIL image. Encoded
+    bytes that already match the slot's raster format are written without re-encoding.
+
+    ``incremental`` only applies to PDFs: the change is appended as a new revision
+    instead of a full garbage-collected rewrite, so the caller owns the later clean pass.
+    """
     source = _validate_source_path(file_path, label="Image source file")
     normalized_index = _validate_image_index(image_index)
     extension = _path_extension(source)
 
     if extension == "pdf":
-        slot = _resolve_image_slot(_list_pdf_image_slots(source), image_index=normalized_index, path=source)
-        replacement_image = _load_replacement_image(replacement)
-        _replace_pdf_image(source, normalized_index, slot, replacement_image)
+        _replace_pdf_image(source, normalized_index, replacement, incremental=incremental)
         return
     slot = _resolve_image_slot(_list_office_image_slots(source), image_index=normalized_index, path=source)
     replacement_image = _load_replacement_image(replacement)
     _replace_office_image(source, normalized_index, slot, replacement_image)
 
 
+def render_image_bytes(
+    replacement: str | PathLike[str] | Path | bytes | Image.Image,
+    *,
+    target_extension: str,
+) -> bytes:
+    """Encode a replacement image for a slot of ``target_extension`` (PDF slots take ``png``).
+
+    Passing the result back to ``replace_image`` writes it verbatim, so callers can render a
+    shared replacement once and reuse it for every slot that needs the same bytes.
+    """
+    normalized_extension = _normalize_image_extension(target_extension)
+    if normalized_extension not in _PILLOW_SAVE_FORMATS:
+        raise NotImplementedError(f"Replacement rendering does not support raster type '{normalized_extension}'.")
+    return _render_replacement_bytes(_load_replacement_image(replacement), target_extension=normalized_extension)
+
+
 def _list_office_image_slots(path: Path) -> list[dict[str, object]]:
+    return list(_iter_office_image_slots(path))
+
+
+def _iter_office_image_slots(path: Path):
     extension = _path_extension(path)
     media_prefix = _OFFICE_MEDIA_PREFIX[extension]
     try:
@@ -91,45 +158,207 @@ def _list_office_image_slots(path: Path) -> list[dict[str, object]]:
                 ),
                 key=_archive_name_sort_key,
             )
-            return [
-                {
+            for media_name in media_names:
+                yield {
                     "archive_name": media_name,
                     "extension": _normalize_image_extension(Path(media_name).suffix),
                     "bytes": archive.read(media_name),
                 }
-                for media_name in media_names
-            ]
     except zipfile.BadZipFile as exc:
         raise ValueError(f"Office file '{path}' is not a valid Open XML package.") from exc
 
 
 def _list_pdf_image_slots(path: Path) -> list[dict[str, object]]:
+    fitz = load_pymupdf("PDF image operations")
     document = fitz.open(path)
     try:
         _reject_encrypted_pdf(document, path)
-        slots: list[dict[str, object]] = []
-        for page_index in range(document.page_count):
-            page = document.load_page(page_index)
-            for page_image_index, image_info in enumerate(page.get_image_info(xrefs=True)):
-                xref = int(image_info["xref"])
-                extracted = document.extract_image(xref)
-                extension = _normalize_image_extension(f".{extracted.get('ext', '')}")
-                if extension not in _RASTER_EXTENSIONS:
-                    continue
-                slots.append(
-                    {
-                        "page_index": page_index,
-                        "page_image_index": page_image_index,
-                        "xref": xref,
-                        "extension": extension,
-                        "bytes": extracted["image"],
-                    }
-                )
-        return slots
+        catalog = _PdfImageCatalog(document)
+        return [
+            {**slot, "bytes": catalog.image_bytes(int(slot["xref"]))}
+            for slot in catalog.slots()
+        ]
     finally:
         document.close()
 
 
+class _PdfImageCatalog:
+    """Per-document xref cache shared by slot listing, location mapping and replacement.
+
+    ``extract_image`` runs at most once per xref, however many pages reference it, and only
+    when a slot listing or byte read first needs that xref.
+    """
+
+    def __init__(self, document) -> None:
+        self.document = document
+        self._extracted: dict[int, dict] = {}
+        self._slots: list[dict[str, object]] | None = None
+        self._occurrences: dict[int, int] | None = None
+
+    def slots(self) -> list[dict[str, object]]:
+        if self._slots is None:
+            slots: list[dict[str, object]] = []
+            for page_index in range(self.document.page_count):
+                page = self.document.load_page(page_index)
+                for page_image_index, image_info in enumerate(page.get_image_info(xrefs=True)):
+                    xref = int(image_info["xref"])
+                    extension = self.extension(xref)
+                    if extension not in _RASTER_EXTENSIONS:
+                        continue
+                    slots.append(
+                        {
+                            "page_index": page_index,
+                            "page_image_index": page_image_index,
+                            "xref": xref,
+                            "extension": extension,
+                        }
+                    )
+            self._slots = slots
+        return self._slots
+
+    def occurrence_count(self, xref: int) -> int:
+        if self._occurrences is None:
+            occurrences: dict[int, int] = {}
+            for slot in self.slots():
+                slot_xref = int(slot["xref"])
+                occurrences[slot_xref] = occurrences.get(slot_xref, 0) + 1
+            self._occurrences = occurrences
+        return self._occurrences.get(xref, 0)
+
+    def extension(self, xref: int) -> str:
+        return _normalize_image_extension(f".{self._extract(xref).get('ext', '')}")
+
+    def image_bytes(self, xref: int) -> bytes:
+        return self._extract(xref)["image"]
+
+    def _extract(self, xref: int) -> dict:
+        extracted = self._extracted.get(xref)
+        if extracted is None:
+            if xref <= 0:
+                extracted = {}
+            else:
+                extracted = self.document.extract_image(xref) or {}
+            self._extracted[xref] = extracted
+        return extracted
+
+
+def _inventory_entry(
+    path: Path,
+    image_index: int,
+    slot: dict[str, object],
+    *,
+    xref_probes: dict[int, tuple],
+) -> dict[str, object]:
+    payload = slot["bytes"]
+    xref = slot.get("xref")
+    probed = xref_probes.get(xref) if xref is not None else None
+    if probed is None:
+        probed = (*_probe_image_header(payload), hashlib.sha256(payload).hexdigest())
+        if xref is not None:
+            xref_probes[xref] = probed
+    image_format, width, height, digest = probed
+    entry = {key: value for key, value in slot.items() if key != "bytes"}
+    entry.update(
+        {
+            "image_index": image_index,
+            "format": image_format,
+            "byte_size": len(payload),
+            "sha256": digest,
+            "width": width,
+            "height": height,
+            "extracted_filename": f"{path.stem}-image-{image_index:04d}.{slot['extension']}",
+        }
+    )
+    return entry
+
+
+def _inventory_cache_key(path: Path) -> tuple:
+    stat = path.stat()
+    return (str(path.resolve()), stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def _probe_image_header(payload: bytes) -> tuple[str | None, int | None, int | None]:
+    """Return ``(format, width, height)`` from header bytes, falling back to a lazy Pillow open."""
+    try:
+        if payload.startswith(b"\x89PNG\r\n\x1a\n") and payload[12:16] == b"IHDR":
+            width, height = struct.unpack(">II", payload[16:24])
+            return "PNG", width, height
+        if payload[:6] in {b"GIF87a", b"GIF89a"}:
+            width, height = struct.unpack("<HH", payload[6:10])
+            return "GIF", width, height
+        if payload.startswith(b"BM"):
+            (header_size,) = struct.unpack("<I", payload[14:18])
+            if header_size == 12:
+                width, height = struct.unpack("<HH", payload[18:22])
+            else:
+                width, height = struct.unpack("<ii", payload[18:26])
+            return "BMP", abs(width), abs(height)
+        if payload.startswith(b"\xff\xd8"):
+            dimensions = _probe_jpeg_dimensions(payload)
+            if dimensions is not None:
+                return "JPEG", dimensions[0], dimensions[1]
+        if payload[:4] in {b"II*\x00", b"MM\x00*"}:
+            dimensions = _probe_tiff_dimensions(payload)
+            if dimensions is not None:
+                return "TIFF", dimensions[0], dimensions[1]
+    except struct.error:
+        pass
+
+    PIL = load_pillow("image operations")
+    Image, UnidentifiedImageError = PIL.Image, PIL.UnidentifiedImageError
+    try:
+        with Image.open(BytesIO(payload)) as image:
+            width, height = image.size
+            return image.format, width, height
+    except (UnidentifiedImageError, OSError):
+        return None, None, None
+
+
+def _probe_jpeg_dimensions(payload: bytes) -> tuple[int, int] | None:
+    offset = 2
+    length = len(payload)
+    while offset + 4 <= length:
+        if payload[offset] != 0xFF:
+            return None
+        marker = payload[offset + 1]
+        if marker == 0xFF:
+            offset += 1
+            continue
+        if marker in _JPEG_STANDALONE_MARKERS:
+            offset += 2
+            continue
+        (segment_length,) = struct.unpack(">H", payload[offset + 2 : offset + 4])
+        if marker in _JPEG_SOF_MARKERS:
+            height, width = struct.unpack(">HH", payload[offset + 5 : offset + 9])
+            return width, height
+        if marker == 0xDA:
+            return None
+        offset += 2 + segment_length
+    return None
+
+
+def _probe_tiff_dimensions(payload: bytes) -> tuple[int, int] | None:
+    byte_order = "<" if payload[:2] == b"II" else ">"
+    (ifd_offset,) = struct.unpack(f"{byte_order}I", payload[4:8])
+    (entry_count,) = struct.unpack(f"{byte_order}H", payload[ifd_offset : ifd_offset + 2])
+    values: dict[int, int] = {}
+    for entry_index in range(entry_count):
+        entry_offset = ifd_offset + 2 + entry_index * 12
+        tag, value_type = struct.unpack(f"{byte_order}HH", payload[entry_offset : entry_offset + 4])
+        if tag not in {256, 257}:
+            continue
+        if value_type == 3:
+            (value,) = struct.unpack(f"{byte_order}H", payload[entry_offset + 8 : entry_offset + 10])
+        elif value_type == 4:
+            (value,) = struct.unpack(f"{byte_order}I", payload[entry_offset + 8 : entry_offset + 12])
+        else:
+            return None
+        values[tag] = value
+    if 256 in values and 257 in values:
+        return values[256], values[257]
+    return None
+
+
 def _replace_office_image(
     path: Path,
     image_index: int,
@@ -149,29 +378,37 @@ def _replace_office_image(
 def _replace_pdf_image(
     path: Path,
     image_index: int,
-    slot: dict[str, object],
-    replacement_image: dict[str, object],
+    replacement: str | PathLike[str] | Path | bytes | Image.Image,
+    *,
+    incremental: bool = False,
 ) -> None:
-    slots = _list_pdf_image_slots(path)
-    xref = int(slot["xref"])
-    occurrence_count = sum(1 for candidate in slots if int(candidate["xref"]) == xref)
-    if occurrence_count > 1:
-        raise NotImplementedError(
-            "PDF image replacement only supports uniquely addressed raster image objects. "
-            f"Image slot {image_index} in '{path}' shares xref {xref} with {occurrence_count} occurrences."
-        )
-
+    fitz = load_pymupdf("PDF image operations")
     document = fitz.open(path)
     temp_output = _temporary_output_path(path)
     try:
         _reject_encrypted_pdf(document, path)
-        page = document.load_page(int(slot["page_index"]))
-        page.replace_image(xref, stream=_render_replacement_bytes(replacement_image, target_extension="png"))
-        document.save(temp_output, garbage=4, deflate=True)
-    except Exception as exc:  # pragma: no cover - PyMuPDF failures vary by file and image type.
-        if temp_output.exists():
-            temp_output.unlink()
-        raise ValueError(f"Failed to replace PDF image slot {image_index} in '{path}': {exc}") from exc
+        catalog = _PdfImageCatalog(document)
+        slot = _resolve_image_slot(catalog.slots(), image_index=image_index, path=path)
+        xref = int(slot["xref"])
+        occurrence_count = catalog.occurrence_count(xref)
+        if occurrence_count > 1:
+            raise NotImplementedError(
+                "PDF image replacement only supports uniquely addressed raster image objects. "
+                f"Image slot {image_index} in '{path}' shares xref {xref} with {occurrence_count} occurrences."
+            )
+        replacement_image = _load_replacement_image(replacement)
+
+        try:
+            page = document.load_page(int(slot["page_index"]))
+            page.replace_image(xref, stream=_render_replacement_bytes(replacement_image, target_extension="png"))
+            if incremental and document.can_save_incrementally():
+                document.save(path, incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP)
+                return
+            document.save(temp_output, garbage=4, deflate=True)
+        except Exception as exc:  # pragma: no cover - PyMuPDF failures vary by file and image type.
+            if temp_output.exists():
+                temp_output.unlink()
+            raise ValueError(f"Failed to replace PDF image slot {image_index} in '{path}': {exc}") from exc
     finally:
         if not document.is_closed:
             document.close()
@@ -210,8 +447,29 @@ def _resolve_image_slot(slots: list[dict[str, object]], *, image_index: int, pat
     return slots[image_index]
 
 
-def _load_replacement_image(path_value: str | PathLike[str] | Path) -> dict[str, object]:
-    path = _coerce_path(path_value)
+def _load_replacement_image(value: str | PathLike[str] | Path | bytes | Image.Image) -> dict[str, object]:
+    PIL = load_pillow("image operations")
+    Image, UnidentifiedImageError = PIL.Image, PIL.UnidentifiedImageError
+    if isinstance(value, Image.Image):
+        return {
+            "path": None,
+            "image": value,
+            "encoded": None,
+        }
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        payload = bytes(value)
+        try:
+            with Image.open(BytesIO(payload)) as image:
+                image.load()
+                return {
+                    "path": None,
+                    "image": image.copy(),
+                    "encoded": (image.format, payload),
+                }
+        except (UnidentifiedImageError, OSError) as exc:
+            raise ValueError("Replacement image bytes are not a readable image.") from exc
+
+    path = _coerce_path(value)
     if not path.exists():
         raise FileNotFoundError(f"Replacement image '{path}' does not exist.")
     if path.is_symlink() or not path.is_file():
@@ -223,6 +481,7 @@ def _load_replacement_image(path_value: str | PathLike[str] | Path) -> dict[str,
             return {
                 "path": path,
                 "image": image.copy(),
+                "encoded": None,
             }
     except (UnidentifiedImageError, OSError) as exc:
         raise ValueError(f"Replacement image '{path}' is not a readable image file.") from exc
@@ -231,6 +490,10 @@ def _load_replacement_image(path_value: str | PathLike[str] | Path) -> dict[str,
 def _render_replacement_bytes(replacement_image: dict[str, object], *, target_extension: str) -> bytes:
     image = replacement_image["image"]
     save_format = _PILLOW_SAVE_FORMATS[target_extension]
+    encoded = replacement_image.get("encoded")
+    if encoded is not None and encoded[0] == save_format:
+        return encoded[1]
+
     prepared = image
     if save_format == "JPEG" and prepared.mode not in {"RGB", "L"}:
         prepared = prepared.convert("RGB")
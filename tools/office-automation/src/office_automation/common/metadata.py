@@ -5,14 +5,19 @@ from __future__ import annotations
 from os import PathLike
 from pathlib import Path
 import shutil
+from typing import TYPE_CHECKING
 import xml.etree.ElementTree as ET
 import zipfile
 
-import fitz
-from docx import Document
-from openpyxl import load_workbook
-from openpyxl.workbook import Workbook
-from pptx import Presentation
+from office_automation.common.backends import (
+    load_document_callable,
+    load_presentation_callable,
+    load_pymupdf,
+    load_workbook_callable,
+)
+
+if TYPE_CHECKING:
+    from openpyxl.workbook import Workbook
 
 __all__ = ["clear_metadata", "read_metadata"]
 
@@ -150,8 +155,12 @@ def read_metadata(file_path: str | PathLike[str] | Path) -> dict:
     }
 
 
-def clear_metadata(file_path: str | PathLike[str] | Path) -> None:
-    """Clear supported metadata in place for a supported Office or PDF file."""
+def clear_metadata(file_path: str | PathLike[str] | Path, *, incremental: bool = False) -> None:
+    """Clear supported metadata in place for a supported Office or PDF file.
+
+    ``incremental`` only applies to PDFs and appends the cleared Info dictionary as a
+    new revision; the previous values stay recoverable until a full clean save.
+    """
     source = _validate_source_path(file_path, label="Metadata source file")
     extension = _path_extension(source)
 
@@ -164,7 +173,7 @@ def clear_metadata(file_path: str | PathLike[str] | Path) -> None:
     if extension == "pptx":
         _clear_pptx_metadata(source)
         return
-    _clear_pdf_metadata(source)
+    _clear_pdf_metadata(source, incremental=incremental)
 
 
 def _read_excel_metadata(path: Path) -> dict[str, str | None]:
@@ -195,7 +204,8 @@ def _read_excel_metadata(path: Path) -> dict[str, str | None]:
 
 
 def _read_docx_metadata(path: Path) -> dict[str, str | None]:
-    document = Document(path)
+    load_document = load_document_callable("Word metadata")
+    document = load_document(path)
     properties = document.core_properties
     fields = {
         "title": _normalize_metadata_value(properties.title),
@@ -218,7 +228,8 @@ def _read_docx_metadata(path: Path) -> dict[str, str | None]:
 
 
 def _read_pptx_metadata(path: Path) -> dict[str, str | None]:
-    presentation = Presentation(path)
+    load_presentation = load_presentation_callable("PowerPoint metadata")
+    presentation = load_presentation(path)
     properties = presentation.core_properties
     fields = {
         "title": _normalize_metadata_value(properties.title),
@@ -241,6 +252,7 @@ def _read_pptx_metadata(path: Path) -> dict[str, str | None]:
 
 
 def _read_pdf_metadata(path: Path) -> dict[str, str | None]:
+    fitz = load_pymupdf("PDF metadata")
     document = fitz.open(path)
     try:
         _reject_encrypted_pdf(document, path)
@@ -270,7 +282,8 @@ def _clear_excel_metadata(path: Path) -> None:
 
 
 def _clear_docx_metadata(path: Path) -> None:
-    document = Document(path)
+    load_document = load_document_callable("Word metadata")
+    document = load_document(path)
     try:
         _blank_string_properties(
             document.core_properties,
@@ -284,7 +297,8 @@ def _clear_docx_metadata(path: Path) -> None:
 
 
 def _clear_pptx_metadata(path: Path) -> None:
-    presentation = Presentation(path)
+    load_presentation = load_presentation_callable("PowerPoint metadata")
+    presentation = load_presentation(path)
     try:
         _blank_string_properties(
             presentation.core_properties,
@@ -297,12 +311,16 @@ def _clear_pptx_metadata(path: Path) -> None:
     _strip_office_core_xml_fields(path)
 
 
-def _clear_pdf_metadata(path: Path) -> None:
+def _clear_pdf_metadata(path: Path, *, incremental: bool = False) -> None:
+    fitz = load_pymupdf("PDF metadata")
     document = fitz.open(path)
     temp_output = _temporary_output_path(path)
     try:
         _reject_encrypted_pdf(document, path)
         document.set_metadata({})
+        if incremental and document.can_save_incrementally():
+            document.save(path, incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP)
+            return
         document.save(temp_output, garbage=4, deflate=True)
     except Exception as exc:  # pragma: no cover - library-specific failures vary by file.
         if temp_output.exists():
@@ -386,6 +404,7 @@ def _strip_core_xml_payload(payload: bytes, *, source: Path) -> bytes:
 
 
 def _load_excel_workbook(path: Path) -> Workbook:
+    load_workbook = load_workbook_callable("Excel metadata")
     try:
         return load_workbook(path, keep_vba=_path_extension(path) == "xlsm")
     except Exception as exc:  # pragma: no cover - library-specific failures vary by file.
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator, Mapping
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
+from itertools import islice
 import math
 from os import PathLike
 from pathlib import Path
@@ -12,18 +13,22 @@ from uuid import uuid4
 
 from openpyxl import load_workbook
 from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
-from openpyxl.utils.cell import coordinate_to_tuple
+from openpyxl.utils.cell import coordinate_to_tuple, get_column_letter, range_boundaries
 from openpyxl.workbook import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
 
-__all__ = ["read", "edit"]
+__all__ = ["read", "iter_rows", "edit", "create_workbook"]
 
 _SUPPORTED_EXTENSIONS = frozenset({"xlsx", "xlsm"})
 _UNSUPPORTED_LEGACY_EXTENSIONS = frozenset({"xls", "xlsb"})
 _SUPPORTED_EXTENSIONS_TEXT = ", ".join(sorted(_SUPPORTED_EXTENSIONS))
 _SUPPORTED_OPERATIONS = frozenset(
-    {"set_cell", "clear_cell", "rename_sheet", "add_sheet", "delete_sheet"}
+    {"set_cell", "set_range", "append_rows", "clear_cell", "rename_sheet", "add_sheet", "delete_sheet"}
 )
+_MAX_ROW = 1_048_576
+_MAX_COLUMN = 16_384
+_READ_LAYOUTS = frozenset({"cells", "columns"})
+_DEFAULT_ROW_BATCH_SIZE = 1000
 _UNSUPPORTED_MACRO_KEYS = frozenset(
     {
         "macro",
@@ -43,24 +48,108 @@ _UNSUPPORTED_MACRO_KEYS = frozenset(
 )
 
 
-def read(file_path: str | Path) -> dict:
-    """Read an xlsx/xlsm workbook and return structured data."""
+def read(
+    file_path: str | Path,
+    *,
+    sheet: str | None = None,
+    cell_range: str | None = None,
+    row_offset: int = 0,
+    row_limit: int | None = None,
+    layout: str = "cells",
+) -> dict:
+    """Read an xlsx/xlsm workbook and return structured data.
+
+    Without options every populated cell of every sheet is returned from a
+    fully loaded workbook. Passing any option switches to openpyxl's read-only
+    streaming loader and returns a bounded window instead:
+
+    - ``sheet``: only serialize this worksheet.
+    - ``cell_range``: A1-style window such as ``"B2:F500"``, ``"A:C"`` or ``"10:20"``.
+    - ``row_offset`` / ``row_limit``: page through the window's rows; the sheet
+      result carries ``next_row_offset`` while rows remain.
+    - ``layout="columns"``: the window's first row becomes ``header`` and the
+      following rows are returned as one value array per column.
+
+    Bounded reads do not report ``merged_ranges`` (read-only worksheets do not
+    parse them). They stream the whole sheet once and never trust the stored
+    ``<dimension>`` tag: rows past a stale tag are still returned, and
+    ``max_row``/``max_column`` cover every populated cell.
+    """
     source = _validate_source_path(file_path)
-    workbook = _load_excel_workbook(source)
+    window = _validate_read_window(
+        sheet=sheet,
+        cell_range=cell_range,
+        row_offset=row_offset,
+        row_limit=row_limit,
+        layout=layout,
+    )
+    workbook = _load_excel_workbook(source, read_only=window is not None)
     try:
         worksheets = list(workbook.worksheets)
+        sheet_names = [worksheet.title for worksheet in worksheets]
+        if window is None:
+            serialized_sheets = [_serialize_sheet(worksheet) for worksheet in worksheets]
+        else:
+            if window["sheet"] is not None and window["sheet"] not in sheet_names:
+                raise ValueError(f"Excel read option 'sheet' references missing sheet '{window['sheet']}'.")
+            serialized_sheets = [
+                _serialize_sheet_window(worksheet, window)
+                for worksheet in worksheets
+                if window["sheet"] in (None, worksheet.title)
+            ]
         return {
             "file_path": str(source),
             "extension": _path_extension(source),
             "sheet_count": len(worksheets),
-            "sheet_names": [sheet.title for sheet in worksheets],
-            "sheets": [_serialize_sheet(sheet) for sheet in worksheets],
+            "sheet_names": sheet_names,
+            "sheets": serialized_sheets,
         }
     finally:
         _close_workbook(workbook)
 
 
 
+def iter_rows(
+    file_path: str | Path,
+    *,
+    sheet: str | None = None,
+    values_only: bool = True,
+    batch_size: int = _DEFAULT_ROW_BATCH_SIZE,
+) -> Iterator[list]:
+    """Stream a worksheet's rows in batches of at most ``batch_size`` rows.
+
+    The workbook is parsed with openpyxl's read-only loader, so memory stays
+    bounded by one batch regardless of sheet size. ``sheet`` defaults to the
+    first worksheet. With ``values_only`` each row is a list of cell values;
+    otherwise it is the row's populated cells in the same dict form as
+    ``read()``. Values are normalized exactly as ``read()`` does. Arguments
+    are validated before the first batch is requested.
+    """
+    source = _validate_source_path(file_path)
+    if sheet is not None and (not isinstance(sheet, str) or not sheet.strip()):
+        raise ValueError("Excel iter_rows option 'sheet' must be a non-empty string when provided.")
+    if not isinstance(values_only, bool):
+        raise TypeError("Excel iter_rows option 'values_only' must be a boolean.")
+    if isinstance(batch_size, bool) or not isinstance(batch_size, int):
+        raise TypeError("Excel iter_rows option 'batch_size' must be an integer.")
+    if batch_size < 1:
+        raise ValueError("Excel iter_rows option 'batch_size' must be >= 1.")
+
+    workbook = _load_excel_workbook(source, read_only=True)
+    try:
+        sheet_names = [worksheet.title for worksheet in workbook.worksheets]
+        if not sheet_names:
+            raise ValueError(f"Excel workbook '{source}' has no worksheets.")
+        sheet_name = sheet_names[0] if sheet is None else sheet.strip()
+        if sheet_name not in sheet_names:
+            raise ValueError(f"Excel iter_rows option 'sheet' references missing sheet '{sheet_name}'.")
+    except Exception:
+        _close_workbook(workbook)
+        raise
+    return _iter_row_batches(workbook, workbook[sheet_name], values_only=values_only, batch_size=batch_size)
+
+
+
 def edit(file_path: str | Path, instructions: dict) -> Path:
     """Apply xlsx/xlsm workbook edits and return the saved output path."""
     source = _validate_source_path(file_path)
@@ -82,6 +171,38 @@ def edit(file_path: str | Path, instructions: dict) -> Path:
 
 
 
+def create_workbook(output_path: str | Path, sheets: Mapping[str, Iterable[Iterable]]) -> Path:
+    """Write a new xlsx workbook from ``{sheet name: rows}`` and return its path.
+
+    Uses openpyxl's write-only workbook, so rows (which may come from a
+    generator) are serialized as they are consumed and memory stays bounded
+    for large generated reports. Values are validated like ``set_cell``
+    values. ``output_path`` must be a new ``.xlsx`` path.
+    """
+    path = _coerce_path(output_path)
+    if _path_extension(path) != "xlsx":
+        raise ValueError("Excel create_workbook output_path must use the '.xlsx' extension.")
+    if path.exists():
+        raise FileExistsError(f"Excel output path '{path}' already exists.")
+    if not isinstance(sheets, Mapping) or not sheets:
+        raise ValueError("Excel create_workbook 'sheets' must be a non-empty mapping of sheet name to rows.")
+
+    workbook = Workbook(write_only=True)
+    for sheet_name, rows in sheets.items():
+        if not isinstance(sheet_name, str) or not sheet_name.strip():
+            raise ValueError("Excel create_workbook sheet names must be non-empty strings.")
+        sheet = workbook.create_sheet(title=sheet_name.strip())
+        for row_number, row in enumerate(rows, start=1):
+            values = list(row)
+            _validate_value_row(values, context=f"Excel create_workbook sheet '{sheet_name}' row {row_number}")
+            sheet.append(values)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _save_workbook_atomically(workbook, path)
+    return path
+
+
+
 def _coerce_path(value: str | PathLike[str]) -> Path:
     return Path(value)
 
@@ -187,8 +308,10 @@ def _prepare_edit_target(source: Path, output_path: Path, *, copy_before_edit: b
 
 
 
-def _load_excel_workbook(path: Path) -> Workbook:
+def _load_excel_workbook(path: Path, *, read_only: bool = False) -> Workbook:
     try:
+        if read_only:
+            return load_workbook(path, read_only=True)
         return load_workbook(path, keep_vba=_path_extension(path) == "xlsm")
     except Exception as exc:  # pragma: no cover - library-specific failures vary by file.
         raise ValueError(f"Failed to load Excel workbook '{path}': {exc}") from exc
@@ -232,6 +355,189 @@ def _collect_populated_cells(sheet: Worksheet) -> list[dict]:
 
 
 
+def _validate_read_window(
+    *,
+    sheet: str | None,
+    cell_range: str | None,
+    row_offset: int,
+    row_limit: int | None,
+    layout: str,
+) -> dict | None:
+    if sheet is None and cell_range is None and row_offset == 0 and row_limit is None and layout == "cells":
+        return None
+
+    if sheet is not None and (not isinstance(sheet, str) or not sheet.strip()):
+        raise ValueError("Excel read option 'sheet' must be a non-empty string when provided.")
+
+    bounds = (None, None, None, None)
+    if cell_range is not None:
+        if not isinstance(cell_range, str) or not cell_range.strip():
+            raise ValueError("Excel read option 'cell_range' must be a non-empty A1 range when provided.")
+        try:
+            bounds = range_boundaries(cell_range.strip().upper())
+        except Exception as exc:
+            raise ValueError(f"Excel read option 'cell_range' has invalid range '{cell_range}'.") from exc
+
+    if isinstance(row_offset, bool) or not isinstance(row_offset, int):
+        raise TypeError("Excel read option 'row_offset' must be an integer.")
+    if row_offset < 0:
+        raise ValueError("Excel read option 'row_offset' must be >= 0.")
+    if row_limit is not None:
+        if isinstance(row_limit, bool) or not isinstance(row_limit, int):
+            raise TypeError("Excel read option 'row_limit' must be an integer when provided.")
+        if row_limit < 1:
+            raise ValueError("Excel read option 'row_limit' must be >= 1.")
+    if layout not in _READ_LAYOUTS:
+        raise ValueError(
+            f"Excel read option 'layout' must be one of: {', '.join(sorted(_READ_LAYOUTS))}; got {layout!r}."
+        )
+
+    min_col, min_row, max_col, max_row = bounds
+    return {
+        "sheet": sheet.strip() if sheet is not None else None,
+        "cell_range": cell_range.strip().upper() if cell_range is not None else None,
+        "min_row": min_row or 1,
+        "max_row": max_row,
+        "min_col": min_col or 1,
+        "max_col": max_col,
+        "row_offset": row_offset,
+        "row_limit": row_limit,
+        "layout": layout,
+    }
+
+
+
+def _serialize_sheet_window(sheet, window: dict) -> dict:
+    declared_rows = sheet.max_row or 0
+    declared_columns = sheet.max_column or 0
+    min_row = window["min_row"]
+    max_row = window["max_row"]
+    row_offset = window["row_offset"]
+    row_limit = window["row_limit"]
+    header: list | None = None
+    page: list[tuple] = []
+    has_more = False
+    data_rows = data_columns = 0
+    window_rows = 0
+    for row_index, values in enumerate(_iter_sheet_values(sheet), start=1):
+        populated = [column for column, value in enumerate(values, start=1) if value is not None]
+        if populated:
+            data_rows = row_index
+            data_columns = max(data_columns, populated[-1])
+        if row_index < min_row or (max_row is not None and row_index > max_row):
+            continue
+        values = _window_values(values, window["min_col"], window["max_col"])
+        if window["layout"] == "columns" and header is None:
+            header = [_normalize_cell_value(value) for value in values]
+            continue
+        if window_rows >= row_offset:
+            if row_limit is None or len(page) < row_limit:
+                page.append(values)
+            else:
+                has_more = True
+        window_rows += 1
+
+    result = {
+        "name": sheet.title,
+        "max_row": max(declared_rows, data_rows, 1),
+        "max_column": max(declared_columns, data_columns, 1),
+        "cell_range": window["cell_range"],
+        "layout": window["layout"],
+    }
+    first_row = min_row + row_offset
+    if window["layout"] == "columns":
+        header = header if header is not None else []
+        first_row += 1
+    result["row_offset"] = row_offset
+    result["row_count"] = len(page)
+    result["next_row_offset"] = row_offset + len(page) if has_more else None
+
+    min_col = window["min_col"]
+    if window["layout"] == "columns":
+        width = max([len(header), *(len(values) for values in page)])
+        header.extend([None] * (width - len(header)))
+        result["first_row"] = first_row
+        result["column_letters"] = [get_column_letter(min_col + offset) for offset in range(width)]
+        result["header"] = header
+        result["columns"] = [
+            [_normalize_cell_value(values[offset]) if offset < len(values) else None for values in page]
+            for offset in range(width)
+        ]
+        return result
+
+    populated_cells: list[dict] = []
+    for row_index, values in enumerate(page, start=first_row):
+        for column_index, value in enumerate(values, start=min_col):
+            if value is None:
+                continue
+            populated_cells.append(
+                {
+                    "cell": f"{get_column_letter(column_index)}{row_index}",
+                    "row": row_index,
+                    "column": column_index,
+                    "value": _normalize_cell_value(value),
+                }
+            )
+    result["populated_cells"] = populated_cells
+    return result
+
+
+
+def _iter_sheet_values(sheet) -> Iterator[tuple]:
+    """Yield every row of a read-only worksheet as values, ignoring its stored ``<dimension>``.
+
+    openpyxl's read-only worksheet bounds ``iter_rows`` by the ``<dimension>``
+    tag, so a stale tag silently drops rows and columns. The tag is reset
+    before iterating and only used to pad rows to the declared width, which
+    keeps rows rectangular for workbooks whose tag is correct.
+    """
+    declared_columns = sheet.max_column or 0
+    sheet.reset_dimensions()
+    for values in sheet.iter_rows(values_only=True):
+        if len(values) < declared_columns:
+            values = (*values, *([None] * (declared_columns - len(values))))
+        yield values
+
+
+
+def _window_values(values: tuple, min_col: int, max_col: int | None) -> tuple:
+    if max_col is None:
+        return tuple(values[min_col - 1 :])
+    window = tuple(values[min_col - 1 : max_col])
+    return (*window, *([None] * (max_col - min_col + 1 - len(window))))
+
+
+
+def _iter_row_batches(workbook: Workbook, sheet, *, values_only: bool, batch_size: int) -> Iterator[list]:
+    try:
+        rows = _iter_sheet_values(sheet)
+        row_number = 1
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                return
+            if values_only:
+                yield [[_normalize_cell_value(value) for value in values] for values in batch]
+            else:
+                yield [
+                    [
+                        {
+                            "cell": f"{get_column_letter(column_index)}{row_index}",
+                            "row": row_index,
+                            "column": column_index,
+                            "value": _normalize_cell_value(value),
+                        }
+                        for column_index, value in enumerate(values, start=1)
+                        if value is not None
+                    ]
+                    for row_index, values in enumerate(batch, start=row_number)
+                ]
+            row_number += len(batch)
+    finally:
+        _close_workbook(workbook)
+
+
+
 def _normalize_cell_value(value):
     if isinstance(value, datetime):
         return value.isoformat()
@@ -333,6 +639,27 @@ def _validate_operation(operation: dict, *, index: int) -> dict:
             )
         return {"op": op_name, "sheet": sheet_name, "cell": cell, "value": value}
 
+    if op_name == "set_range":
+        sheet_name = _require_non_empty_string(operation, field="sheet", index=index)
+        start_cell = _validate_cell_coordinate(
+            _require_non_empty_string(operation, field="start_cell", index=index), index=index
+        )
+        values = _validate_value_matrix(operation, field="values", index=index)
+        start_row, start_column = coordinate_to_tuple(start_cell)
+        width = max(len(row) for row in values)
+        if start_row + len(values) - 1 > _MAX_ROW or start_column + width - 1 > _MAX_COLUMN:
+            raise ValueError(
+                f"Excel operation #{index} field 'values' does not fit in the worksheet from '{start_cell}'."
+            )
+        return {"op": op_name, "sheet": sheet_name, "start_cell": start_cell, "values": values}
+
+    if op_name == "append_rows":
+        sheet_name = _require_non_empty_string(operation, field="sheet", index=index)
+        rows = _validate_value_matrix(operation, field="rows", index=index)
+        if max(len(row) for row in rows) > _MAX_COLUMN:
+            raise ValueError(f"Excel operation #{index} field 'rows' is wider than the worksheet.")
+        return {"op": op_name, "sheet": sheet_name, "rows": rows}
+
     if op_name == "clear_cell":
         sheet_name = _require_non_empty_string(operation, field="sheet", index=index)
         cell = _validate_cell_coordinate(_require_non_empty_string(operation, field="cell", index=index), index=index)
@@ -359,6 +686,27 @@ def _validate_operation(operation: dict, *, index: int) -> dict:
 
 
 
+def _validate_value_matrix(operation: dict, *, field: str, index: int) -> list[list]:
+    matrix = operation.get(field)
+    if not isinstance(matrix, list) or not matrix:
+        raise ValueError(f"Excel operation #{index} field '{field}' must be a non-empty list of rows.")
+    for row_number, row in enumerate(matrix, start=1):
+        if not isinstance(row, list):
+            raise TypeError(f"Excel operation #{index} field '{field}' row {row_number} must be a list.")
+        _validate_value_row(row, context=f"Excel operation #{index} field '{field}' row {row_number}")
+    return matrix
+
+
+
+def _validate_value_row(values: list, *, context: str) -> None:
+    for column_number, value in enumerate(values, start=1):
+        validation_error = _cell_value_validation_error(value)
+        if validation_error is not None:
+            error_message = validation_error.args[0]
+            raise type(validation_error)(f"{context} column {column_number} is invalid: {error_message}")
+
+
+
 def _require_non_empty_string(operation: dict, *, field: str, index: int) -> str:
     value = operation.get(field)
     if not isinstance(value, str) or not value.strip():
@@ -384,6 +732,25 @@ def _apply_operation(workbook: Workbook, operation: dict, *, index: int) -> None
         sheet[operation["cell"]] = operation["value"]
         return
 
+    if op_name == "set_range":
+        # Values were validated as a block; write them without per-cell coordinate parsing.
+        sheet = _get_sheet(workbook, operation["sheet"], index=index)
+        start_row, start_column = coordinate_to_tuple(operation["start_cell"])
+        for row_number, values in enumerate(operation["values"], start=start_row):
+            for column_number, value in enumerate(values, start=start_column):
+                sheet.cell(row=row_number, column=column_number).value = value
+        return
+
+    if op_name == "append_rows":
+        sheet = _get_sheet(workbook, operation["sheet"], index=index)
+        if sheet.max_row + len(operation["rows"]) > _MAX_ROW:
+            raise ValueError(
+                f"Excel operation #{index} would append past the worksheet's last row ({_MAX_ROW})."
+            )
+        for values in operation["rows"]:
+            sheet.append(values)
+        return
+
     if op_name == "clear_cell":
         sheet = _get_sheet(workbook, operation["sheet"], index=index)
         sheet[operation["cell"]] = None
@@ -437,7 +804,11 @@ def _save_workbook(workbook: Workbook, *, source: Path, save_path: Path) -> None
     if source_resolved == save_resolved:
         workbook.save(save_path)
         return
+    _save_workbook_atomically(workbook, save_path)
+
+
 
+def _save_workbook_atomically(workbook: Workbook, save_path: Path) -> None:
     temporary_path = save_path.with_name(
         f".{save_path.stem}.tmp-{uuid4().hex}{save_path.suffix}"
     )
@@ -16,7 +16,9 @@ edits emit Python warnings so SG2 can map them to wrapper-visible partial-succes
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Iterator, Sequence
+import contextlib
+import itertools
 from os import PathLike
 from pathlib import Path
 import shutil
@@ -62,16 +64,7 @@ def read(file_path: str | PathLike[str] | Path) -> dict:
     plumber_document = None
     try:
         _reject_encrypted_document(document, source)
-        try:
-            plumber_document = pdfplumber.open(source)
-        except Exception as exc:  # pragma: no cover - depends on library-specific failures.
-            plumber_document = None
-            extraction_warning = (
-                f"pdfplumber could not open '{source.name}' ({exc.__class__.__name__}); "
-                "falling back to PyMuPDF extraction only."
-            )
-        else:
-            extraction_warning = None
+        plumber_document, extraction_warning = _open_plumber_document(pdfplumber, source)
 
         pages: list[dict] = []
         warning_messages: list[str] = []
@@ -154,6 +147,16 @@ def edit(file_path: str | PathLike[str] | Path, instructions: dict) -> Path:
     return output_path
 
 
+def _open_plumber_document(pdfplumber, source: Path) -> tuple[object | None, str | None]:
+    try:
+        return pdfplumber.open(source), None
+    except Exception as exc:  # pragma: no cover - depends on library-specific failures.
+        return None, (
+            f"pdfplumber could not open '{source.name}' ({exc.__class__.__name__}); "
+            "falling back to PyMuPDF extraction only."
+        )
+
+
 def _read_page(*, document, page_index: int, plumber_document) -> dict:
     page = document.load_page(page_index)
     plumber_text = ""
@@ -461,33 +464,42 @@ def _apply_annotate_text_change(document, operation: dict, caveat_messages: list
 
 def _apply_rebuild_operation(source: Path, output_path: Path, operation: dict) -> None:
     canvas_cls, pdfmetrics = _load_reportlab()
-    pages = _normalize_rebuild_pages(source, operation)
+    font_name = str(operation.get("font_name", _DEFAULT_REBUILD_FONT_NAME))
+    font_size = _require_positive_number(operation, "font_size", default=11.0)
+    margin = _require_positive_number(operation, "margin", default=_DEFAULT_MARGIN)
+    measurer = _TextMeasurer(font_name=font_name, font_size=font_size, pdfmetrics=pdfmetrics)
     temp_output = _temporary_output_path(output_path)
     overflow_pages: list[int] = []
 
-    pdf_canvas = canvas_cls(str(temp_output), pagesize=(pages[0]["width"], pages[0]["height"]))
-    try:
-        for page_index, page_data in enumerate(pages):
-            pdf_canvas.setPageSize((page_data["width"], page_data["height"]))
-            overflowed = _draw_rebuilt_page(
-                pdf_canvas,
-                text=page_data["text"],
-                width=page_data["width"],
-                height=page_data["height"],
-                font_name=str(operation.get("font_name", _DEFAULT_REBUILD_FONT_NAME)),
-                font_size=_require_positive_number(operation, "font_size", default=11.0),
-                margin=_require_positive_number(operation, "margin", default=_DEFAULT_MARGIN),
-                pdfmetrics=pdfmetrics,
-            )
-            if overflowed:
-                overflow_pages.append(page_index + 1)
-            if page_index != len(pages) - 1:
-                pdf_canvas.showPage()
-        pdf_canvas.save()
-    except Exception:
-        if temp_output.exists():
-            temp_output.unlink()
-        raise
+    # Pages are streamed: only the page being drawn is held in memory.
+    with contextlib.closing(_normalize_rebuild_pages(source, operation)) as pages:
+        first_page = next(pages, None)
+        if first_page is None:
+            raise ValueError(f"PDF rebuild_text_pdf found no pages to rebuild in '{source.name}'.")
+
+        pdf_canvas = canvas_cls(str(temp_output), pagesize=(first_page["width"], first_page["height"]))
+        try:
+            for page_index, page_data in enumerate(itertools.chain([first_page], pages)):
+                if page_index:
+                    pdf_canvas.showPage()
+                pdf_canvas.setPageSize((page_data["width"], page_data["height"]))
+                overflowed = _draw_rebuilt_page(
+                    pdf_canvas,
+                    text=page_data["text"],
+                    width=page_data["width"],
+                    height=page_data["height"],
+                    font_name=font_name,
+                    font_size=font_size,
+                    margin=margin,
+                    measurer=measurer,
+                )
+                if overflowed:
+                    overflow_pages.append(page_index + 1)
+            pdf_canvas.save()
+        except Exception:
+            if temp_output.exists():
+                temp_output.unlink()
+            raise
 
     _replace_file(temp_output, output_path)
     if overflow_pages:
@@ -499,8 +511,13 @@ def _apply_rebuild_operation(source: Path, output_path: Path, operation: dict) -
         )
 
 
-def _normalize_rebuild_pages(source: Path, operation: dict) -> list[dict]:
-    source_pages = read(source)["pages"]
+def _normalize_rebuild_pages(source: Path, operation: dict) -> Iterator[dict]:
+    """Validate the rebuild request and return a lazy stream of normalized pages.
+
+    The source PDF is only opened when the request leaves something out: page
+    sizes are looked up for entries without width/height, and full dual-engine
+    extraction runs only when no replacement text is supplied at all.
+    """
     requested_pages = operation.get("pages")
     page_texts = operation.get("page_texts")
     single_text = operation.get("text")
@@ -508,52 +525,71 @@ def _normalize_rebuild_pages(source: Path, operation: dict) -> list[dict]:
     if requested_pages is not None:
         if not isinstance(requested_pages, list) or not requested_pages:
             raise ValueError("PDF rebuild_text_pdf operation field 'pages' must be a non-empty list.")
-        return _normalize_rebuild_page_entries(requested_pages, fallback_pages=source_pages)
+        return _iter_rebuild_page_entries(requested_pages, source=source)
 
     if page_texts is not None:
         if not isinstance(page_texts, list) or not page_texts:
             raise ValueError("PDF rebuild_text_pdf operation field 'page_texts' must be a non-empty list.")
-        return _normalize_rebuild_page_entries(page_texts, fallback_pages=source_pages)
+        return _iter_rebuild_page_entries(page_texts, source=source)
 
     if single_text is not None:
-        return _normalize_rebuild_page_entries([single_text], fallback_pages=source_pages)
+        return _iter_rebuild_page_entries([single_text], source=source)
 
-    return [
-        {
-            "text": page["text"],
-            "width": float(page["width"]),
-            "height": float(page["height"]),
-        }
-        for page in source_pages
-    ]
+    return _iter_source_pages(source)
 
 
-def _normalize_rebuild_page_entries(entries: list, *, fallback_pages: list[dict]) -> list[dict]:
-    normalized_pages: list[dict] = []
+def _iter_rebuild_page_entries(entries: list, *, source: Path) -> Iterator[dict]:
+    fallback_sizes: list[tuple[float, float]] | None = None
     for index, entry in enumerate(entries):
-        fallback_page = fallback_pages[index] if index < len(fallback_pages) else None
-        default_width = float(fallback_page["width"]) if fallback_page is not None else _DEFAULT_PAGE_WIDTH
-        default_height = float(fallback_page["height"]) if fallback_page is not None else _DEFAULT_PAGE_HEIGHT
-
         if isinstance(entry, str):
-            normalized_pages.append(
-                {
-                    "text": entry,
-                    "width": default_width,
-                    "height": default_height,
-                }
-            )
-            continue
-
-        if not isinstance(entry, dict):
+            entry = {"text": entry}
+        elif not isinstance(entry, dict):
             raise TypeError("PDF rebuild_text_pdf pages must be strings or dict objects.")
 
-        text = str(entry.get("text", ""))
-        width = _coerce_positive_float(entry.get("width", default_width), context="PDF rebuild page width")
-        height = _coerce_positive_float(entry.get("height", default_height), context="PDF rebuild page height")
-        normalized_pages.append({"text": text, "width": width, "height": height})
+        default_width = _DEFAULT_PAGE_WIDTH
+        default_height = _DEFAULT_PAGE_HEIGHT
+        if "width" not in entry or "height" not in entry:
+            if fallback_sizes is None:
+                fallback_sizes = _source_page_sizes(source)
+            if index < len(fallback_sizes):
+                default_width, default_height = fallback_sizes[index]
+
+        yield {
+            "text": str(entry.get("text", "")),
+            "width": _coerce_positive_float(entry.get("width", default_width), context="PDF rebuild page width"),
+            "height": _coerce_positive_float(entry.get("height", default_height), context="PDF rebuild page height"),
+        }
 
-    return normalized_pages
+
+def _source_page_sizes(source: Path) -> list[tuple[float, float]]:
+    fitz = _load_pymupdf()
+    document = fitz.open(source)
+    try:
+        _reject_encrypted_document(document, source)
+        return [(float(page.rect.width), float(page.rect.height)) for page in document]
+    finally:
+        document.close()
+
+
+def _iter_source_pages(source: Path) -> Iterator[dict]:
+    fitz = _load_pymupdf()
+    pdfplumber = _load_pdfplumber()
+
+    document = fitz.open(source)
+    plumber_document = None
+    try:
+        _reject_encrypted_document(document, source)
+        plumber_document, _ = _open_plumber_document(pdfplumber, source)
+        for page_index in range(document.page_count):
+            page = _read_page(document=document, page_index=page_index, plumber_document=plumber_document)
+            if plumber_document is not None:
+                # pdfplumber keeps every parsed page's layout objects alive otherwise.
+                plumber_document.pages[page_index].close()
+            yield {"text": page["text"], "width": float(page["width"]), "height": float(page["height"])}
+    finally:
+        if plumber_document is not None:
+            plumber_document.close()
+        document.close()
 
 
 def _draw_rebuilt_page(
@@ -565,7 +601,7 @@ def _draw_rebuilt_page(
     font_name: str,
     font_size: float,
     margin: float,
-    pdfmetrics,
+    measurer: _TextMeasurer,
 ) -> bool:
     max_width = max(width - (margin * 2), 1)
     line_height = font_size * 1.25
@@ -578,7 +614,7 @@ def _draw_rebuilt_page(
 
     paragraphs = text.splitlines() or [""]
     for paragraph in paragraphs:
-        wrapped_lines = _wrap_text(paragraph, max_width=max_width, font_name=font_name, font_size=font_size, pdfmetrics=pdfmetrics)
+        wrapped_lines = _wrap_text(paragraph, max_width=max_width, measurer=measurer)
         if not wrapped_lines:
             wrapped_lines = [""]
         for line in wrapped_lines:
@@ -600,10 +636,40 @@ def _draw_rebuilt_page(
     return overflowed
 
 
-def _wrap_text(text: str, *, max_width: float, font_name: str, font_size: float, pdfmetrics) -> list[str]:
+class _TextMeasurer:
+    """String widths for one font and size, summed from cached per-character advances.
+
+    ReportLab's ``stringWidth`` is the sum of glyph advances scaled by
+    ``0.001 * font_size``, so widths can be accumulated word by word instead
+    of re-measuring an ever-growing line.
+    """
+
+    def __init__(self, *, font_name: str, font_size: float, pdfmetrics) -> None:
+        self._font_name = font_name
+        self._font_size = font_size
+        self._pdfmetrics = pdfmetrics
+        self._advances: dict[str, float] = {}
+
+    def units(self, text: str) -> float:
+        """Width of text in 1/1000 em."""
+        advances = self._advances
+        total = 0.0
+        for character in text:
+            advance = advances.get(character)
+            if advance is None:
+                advance = advances[character] = self._pdfmetrics.stringWidth(character, self._font_name, 1000)
+            total += advance
+        return total
+
+    def fits(self, units: float, max_width: float) -> bool:
+        return units * 0.001 * self._font_size <= max_width
+
+
+def _wrap_text(text: str, *, max_width: float, measurer: _TextMeasurer) -> list[str]:
     if not text:
         return [""]
 
+    space_units = measurer.units(" ")
     wrapped_lines: list[str] = []
     for source_line in text.split("\n"):
         words = source_line.split()
@@ -611,34 +677,40 @@ def _wrap_text(text: str, *, max_width: float, font_name: str, font_size: float,
             wrapped_lines.append("")
             continue
 
-        current = words[0]
+        line_words = [words[0]]
+        line_units = measurer.units(words[0])
         for word in words[1:]:
-            candidate = f"{current} {word}"
-            if pdfmetrics.stringWidth(candidate, font_name, font_size) <= max_width:
-                current = candidate
+            word_units = measurer.units(word)
+            candidate_units = line_units + space_units + word_units
+            if measurer.fits(candidate_units, max_width):
+                line_words.append(word)
+                line_units = candidate_units
                 continue
-            wrapped_lines.extend(_split_long_token(current, max_width=max_width, font_name=font_name, font_size=font_size, pdfmetrics=pdfmetrics))
-            current = word
-        wrapped_lines.extend(_split_long_token(current, max_width=max_width, font_name=font_name, font_size=font_size, pdfmetrics=pdfmetrics))
+            wrapped_lines.extend(_split_long_token(" ".join(line_words), line_units, max_width=max_width, measurer=measurer))
+            line_words = [word]
+            line_units = word_units
+        wrapped_lines.extend(_split_long_token(" ".join(line_words), line_units, max_width=max_width, measurer=measurer))
 
     return wrapped_lines
 
 
-def _split_long_token(text: str, *, max_width: float, font_name: str, font_size: float, pdfmetrics) -> list[str]:
-    if pdfmetrics.stringWidth(text, font_name, font_size) <= max_width:
+def _split_long_token(text: str, text_units: float, *, max_width: float, measurer: _TextMeasurer) -> list[str]:
+    if measurer.fits(text_units, max_width):
         return [text]
 
     chunks: list[str] = []
-    current = ""
-    for character in text:
-        candidate = f"{current}{character}"
-        if current and pdfmetrics.stringWidth(candidate, font_name, font_size) > max_width:
-            chunks.append(current)
-            current = character
+    chunk_start = 0
+    chunk_units = 0.0
+    for index, character in enumerate(text):
+        character_units = measurer.units(character)
+        if index > chunk_start and not measurer.fits(chunk_units + character_units, max_width):
+            chunks.append(text[chunk_start:index])
+            chunk_start = index
+            chunk_units = character_units
         else:
-            current = candidate
-    if current:
-        chunks.append(current)
+            chunk_units += character_units
+    if chunk_start < len(text):
+        chunks.append(text[chunk_start:])
     return chunks
 
 
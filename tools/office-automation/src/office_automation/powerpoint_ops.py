@@ -52,6 +52,7 @@ from __future__ import annotations
 
 from collections.abc import Iterable, Sequence
 from copy import deepcopy
+from functools import lru_cache
 from os import PathLike
 from pathlib import Path
 import re
@@ -81,27 +82,54 @@ _PPT_NAMESPACES = {
 }
 _SLIDE_XML_PATTERN = re.compile(r"^ppt/slides/slide(\d+)\.xml$")
 _SLIDE_RELS_PATTERN = re.compile(r"^ppt/slides/_rels/slide(\d+)\.xml\.rels$")
+_READ_FIELDS = frozenset({"title_text", "shape_count", "text_shapes", "tables", "table_cells"})
+_ANIMATION_MARKERS = (b"<p:timing",)
+_SMARTART_MARKERS = (b":dgm", b"drawingml/2006/diagram")
+_SLIDE_SCAN_CHUNK_SIZE = 256 * 1024
+_FEATURE_PROFILE_CACHE_SIZE = 32
+_FEATURE_WARNING_TEMPLATES = {
+    "animation": "Slide {slide_number} contains animation timing data; advanced animation rewriting is unsupported in V1.",
+    "smartart_markup": "Slide {slide_number} appears to contain SmartArt/diagram content; SmartArt-specific editing is unsupported in V1.",
+    "smartart_relationship": "Slide {slide_number} has SmartArt/diagram relationships; SmartArt-specific editing is unsupported in V1.",
+}
 
 
-def read(file_path: str | Path) -> dict:
-    """Read a `pptx` presentation and return SG2-oriented structure data."""
+def read(
+    file_path: str | Path,
+    *,
+    slides: Iterable[int] | None = None,
+    fields: Iterable[str] | None = None,
+) -> dict:
+    """Read a `pptx` presentation and return SG2-oriented structure data.
+
+    ``slides`` restricts the result to the given 1-based slide numbers (for
+    example ``[47]`` or ``range(40, 51)``). ``fields`` projects each slide onto
+    any of ``title_text``, ``shape_count``, ``text_shapes``, ``tables`` and
+    ``table_cells`` (per-cell records, which also imply ``tables``). Slides
+    and fields that are not selected are never serialized. ``slide_count``
+    always reports the whole deck.
+    """
     presentation_path = _validate_presentation_path(file_path)
+    selected_fields = _validate_read_fields(fields)
     presentation = Presentation(str(presentation_path))
+    slide_count = len(presentation.slides)
+    slide_numbers = _validate_slide_selection(slides, slide_count=slide_count)
 
     presentation_warnings = _collect_presentation_feature_warnings(presentation_path)
-    slides: list[dict] = []
+    serialized_slides: list[dict] = []
     warning_messages = list(presentation_warnings)
 
-    for slide_index, slide in enumerate(presentation.slides):
-        slide_data = _serialize_slide(slide, slide_index)
-        slides.append(slide_data)
+    for slide_number in slide_numbers:
+        slide_index = slide_number - 1
+        slide_data = _serialize_slide(presentation.slides[slide_index], slide_index, fields=selected_fields)
+        serialized_slides.append(slide_data)
         warning_messages.extend(slide_data["warnings"])
 
     return {
         "format": _SUPPORTED_EXTENSION_TEXT,
         "file_path": str(presentation_path),
-        "slide_count": len(presentation.slides),
-        "slides": slides,
+        "slide_count": slide_count,
+        "slides": serialized_slides,
         "warnings": _deduplicate_messages(warning_messages),
     }
 
@@ -129,12 +157,14 @@ def edit(file_path: str | Path, instructions: dict) -> Path:
     return output_path
 
 
-def _serialize_slide(slide, slide_index: int) -> dict:
+def _serialize_slide(slide, slide_index: int, *, fields: frozenset[str] = _READ_FIELDS) -> dict:
     title_shape = slide.shapes.title
     title_text = None
-    if title_shape is not None and getattr(title_shape, "has_text_frame", False):
+    if "title_text" in fields and title_shape is not None and getattr(title_shape, "has_text_frame", False):
         title_text = _extract_text_frame_text(title_shape.text_frame)
 
+    want_text_shapes = "text_shapes" in fields
+    want_tables = "tables" in fields or "table_cells" in fields
     text_shapes: list[dict] = []
     tables: list[dict] = []
     slide_warnings: list[str] = []
@@ -147,7 +177,7 @@ def _serialize_slide(slide, slide_index: int) -> dict:
             )
             continue
 
-        if getattr(shape, "has_text_frame", False):
+        if want_text_shapes and getattr(shape, "has_text_frame", False):
             text_shapes.append(
                 {
                     "shape_index": shape_index,
@@ -159,31 +189,65 @@ def _serialize_slide(slide, slide_index: int) -> dict:
                 }
             )
 
-        if getattr(shape, "has_table", False):
+        if want_tables and getattr(shape, "has_table", False):
             table = shape.table
-            tables.append(
-                {
-                    "table_index": table_index,
-                    "shape_index": shape_index,
-                    "shape_id": shape.shape_id,
-                    "shape_name": shape.name,
-                    "row_count": len(table.rows),
-                    "column_count": len(table.columns),
-                    "rows": _table_rows_as_matrix(table),
-                    "cells": _table_cells_as_records(table),
-                }
-            )
+            table_entry = {
+                "table_index": table_index,
+                "shape_index": shape_index,
+                "shape_id": shape.shape_id,
+                "shape_name": shape.name,
+                "row_count": len(table.rows),
+                "column_count": len(table.columns),
+                "rows": _table_rows_as_matrix(table),
+            }
+            if "table_cells" in fields:
+                table_entry["cells"] = _table_cells_as_records(table)
+            tables.append(table_entry)
             table_index += 1
 
-    return {
-        "slide_index": slide_index,
-        "slide_number": slide_index + 1,
-        "title_text": title_text,
-        "shape_count": len(slide.shapes),
-        "text_shapes": text_shapes,
-        "tables": tables,
-        "warnings": _deduplicate_messages(slide_warnings),
-    }
+    slide_data: dict = {"slide_index": slide_index, "slide_number": slide_index + 1}
+    if "title_text" in fields:
+        slide_data["title_text"] = title_text
+    if "shape_count" in fields:
+        slide_data["shape_count"] = len(slide.shapes)
+    if want_text_shapes:
+        slide_data["text_shapes"] = text_shapes
+    if want_tables:
+        slide_data["tables"] = tables
+    slide_data["warnings"] = _deduplicate_messages(slide_warnings)
+    return slide_data
+
+
+def _validate_read_fields(fields: Iterable[str] | None) -> frozenset[str]:
+    if fields is None:
+        return _READ_FIELDS
+    if isinstance(fields, str) or not isinstance(fields, Iterable):
+        raise TypeError("PowerPoint read option 'fields' must be an iterable of field names.")
+    selected = frozenset(fields)
+    unknown = sorted(str(field) for field in selected - _READ_FIELDS)
+    if unknown:
+        raise ValueError(
+            f"PowerPoint read option 'fields' has unknown field(s): {', '.join(unknown)}. "
+            f"Supported fields: {', '.join(sorted(_READ_FIELDS))}."
+        )
+    return selected
+
+
+def _validate_slide_selection(slides: Iterable[int] | None, *, slide_count: int) -> list[int]:
+    if slides is None:
+        return list(range(1, slide_count + 1))
+    if isinstance(slides, (str, bytes)) or not isinstance(slides, Iterable):
+        raise TypeError("PowerPoint read option 'slides' must be an iterable of 1-based slide numbers.")
+    slide_numbers: set[int] = set()
+    for slide_number in slides:
+        if isinstance(slide_number, bool) or not isinstance(slide_number, int):
+            raise TypeError("PowerPoint read option 'slides' must contain integers.")
+        if not 1 <= slide_number <= slide_count:
+            raise ValueError(
+                f"PowerPoint read option 'slides' references slide {slide_number}; the deck has {slide_count} slide(s)."
+            )
+        slide_numbers.add(slide_number)
+    return sorted(slide_numbers)
 
 
 def _table_rows_as_matrix(table) -> list[list[str]]:
@@ -208,37 +272,70 @@ def _table_cells_as_records(table) -> list[dict]:
 
 
 def _collect_presentation_feature_warnings(presentation_path: Path) -> list[str]:
-    warning_messages: list[str] = []
-    with ZipFile(presentation_path) as archive:
+    warning_messages = [
+        _FEATURE_WARNING_TEMPLATES[feature].format(slide_number=slide_number)
+        for slide_number, feature in _presentation_feature_profile(presentation_path)
+    ]
+    return _deduplicate_messages(warning_messages)
+
+
+def _presentation_feature_profile(presentation_path: Path) -> tuple[tuple[int, str], ...]:
+    """Return ``(slide_number, feature)`` findings, memoized per (path, size, mtime).
+
+    read() and edit() both consult the profile, so a read -> edit -> read
+    sequence on one deck scans its slide parts once.
+    """
+    stat_result = presentation_path.stat()
+    return _scan_presentation_features(
+        str(presentation_path.resolve()), stat_result.st_size, stat_result.st_mtime_ns
+    )
+
+
+@lru_cache(maxsize=_FEATURE_PROFILE_CACHE_SIZE)
+def _scan_presentation_features(path: str, size: int, mtime_ns: int) -> tuple[tuple[int, str], ...]:
+    # size and mtime_ns only key the cache so a rewritten deck is rescanned.
+    findings: list[tuple[int, str]] = []
+    with ZipFile(path) as archive:
         for name in archive.namelist():
             slide_match = _SLIDE_XML_PATTERN.match(name)
             if slide_match:
                 slide_number = int(slide_match.group(1))
-                xml_bytes = archive.read(name)
-                if b"<p:timing" in xml_bytes:
-                    warning_messages.append(
-                        f"Slide {slide_number} contains animation timing data; advanced animation rewriting is unsupported in V1."
-                    )
-                if b":dgm" in xml_bytes or b"drawingml/2006/diagram" in xml_bytes:
-                    warning_messages.append(
-                        f"Slide {slide_number} appears to contain SmartArt/diagram content; SmartArt-specific editing is unsupported in V1."
-                    )
+                with archive.open(name) as stream:
+                    found = _stream_find_markers(stream, _ANIMATION_MARKERS + _SMARTART_MARKERS)
+                if found.intersection(_ANIMATION_MARKERS):
+                    findings.append((slide_number, "animation"))
+                if found.intersection(_SMARTART_MARKERS):
+                    findings.append((slide_number, "smartart_markup"))
                 continue
 
             rels_match = _SLIDE_RELS_PATTERN.match(name)
             if rels_match:
                 slide_number = int(rels_match.group(1))
-                xml_root = ET.fromstring(archive.read(name))
+                with archive.open(name) as stream:
+                    xml_root = ET.parse(stream).getroot()
                 for relationship in xml_root.findall("rel:Relationship", _PPT_NAMESPACES):
                     relationship_type = relationship.attrib.get("Type", "").lower()
                     target = relationship.attrib.get("Target", "").lower()
                     if "diagram" in relationship_type or "smartart" in relationship_type or "diagram" in target:
-                        warning_messages.append(
-                            f"Slide {slide_number} has SmartArt/diagram relationships; SmartArt-specific editing is unsupported in V1."
-                        )
+                        findings.append((slide_number, "smartart_relationship"))
                         break
 
-    return _deduplicate_messages(warning_messages)
+    return tuple(findings)
+
+
+def _stream_find_markers(stream, markers: tuple[bytes, ...]) -> set[bytes]:
+    """Return which byte markers occur in stream, reading it in chunks and stopping once all are found."""
+    overlap = max(len(marker) for marker in markers) - 1
+    found: set[bytes] = set()
+    tail = b""
+    while len(found) < len(markers):
+        chunk = stream.read(_SLIDE_SCAN_CHUNK_SIZE)
+        if not chunk:
+            break
+        window = tail + chunk
+        found.update(marker for marker in markers if marker not in found and marker in window)
+        tail = window[-overlap:]
+    return found
 
 
 def _normalize_edit_request(
@@ -15,9 +15,11 @@ full-fidelity Word surgery remain outside SG2 V1 scope.
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
 from os import PathLike
 from pathlib import Path
+import re
 import shutil
 import warnings
 import xml.etree.ElementTree as ET
@@ -49,45 +51,107 @@ _TRACK_CHANGE_LOCAL_NAMES = {
     "moveToRangeEnd",
     "moveToRangeStart",
 }
-
-
-def read(file_path: str | PathLike[str] | Path) -> dict:
-    """Read a `.docx` file and return ordered body paragraph/table data."""
+_READ_FIELDS = frozenset({"metadata", "paragraphs", "tables", "body"})
+_TEXT_BOX_LOCAL_NAME = "txbxContent"
+# Byte-level prefilter: a start tag (any or no prefix) for one of the local names above.
+# It may match inside comments or CDATA, so candidate parts are confirmed with iterparse.
+_FEATURE_TAG_PREFILTER = re.compile(
+    rb"<(?:[A-Za-z_][\w.-]*:)?(?:ins|del|moveFrom(?:RangeEnd|RangeStart)?|moveTo(?:RangeEnd|RangeStart)?|txbxContent)[\s/>]"
+)
+_PREFILTER_CHUNK_SIZE = 1024 * 1024
+_PREFILTER_OVERLAP = 64
+_FEATURE_SCAN_CACHE_SIZE = 32
+
+
+def read(
+    file_path: str | PathLike[str] | Path,
+    *,
+    body_range: Sequence[int] | None = None,
+    paragraph_range: Sequence[int] | None = None,
+    fields: Iterable[str] | None = None,
+) -> dict:
+    """Read a `.docx` file and return ordered body paragraph/table data.
+
+    Optional selection keeps targeted reads on long documents cheap:
+
+    - ``body_range=(start, stop)``: only body blocks with ``start <= body_index < stop``.
+    - ``paragraph_range=(start, stop)``: only paragraphs with ``start <= paragraph_index < stop``
+      (tables are not selected by this window).
+    - ``fields``: any of ``metadata``, ``paragraphs``, ``tables``, ``body``; other
+      sections are omitted from the result and never computed.
+
+    Indices in the result stay document-global, and the body walk stops once
+    the window has been passed.
+    """
     source = _validate_source_path(file_path)
+    window = _validate_read_window(body_range=body_range, paragraph_range=paragraph_range)
+    selected_fields = _validate_read_fields(fields)
     load_document = _load_document_callable()
     document = load_document(source)
     feature_warnings = _scan_document_feature_warnings(source)
 
+    want_paragraphs = "paragraphs" in selected_fields
+    want_tables = "tables" in selected_fields
+    want_body = "body" in selected_fields
+
     paragraphs: list[dict] = []
     tables: list[dict] = []
     body: list[dict] = []
+    paragraph_count = 0
+    table_count = 0
 
     for body_index, block in enumerate(_iter_document_body(document)):
-        if _is_paragraph(block):
-            paragraph_index = len(paragraphs)
-            paragraph_entry = {
-                "paragraph_index": paragraph_index,
-                "body_index": body_index,
-                "text": block.text,
-                "style": _get_style_name(block),
-            }
-            paragraphs.append(paragraph_entry)
-            body.append(
-                {
-                    "body_index": body_index,
-                    "type": "paragraph",
-                    "paragraph_index": paragraph_index,
-                    "text": block.text,
-                }
-            )
+        is_paragraph = _is_paragraph(block)
+        if window is not None:
+            kind, start, stop = window
+            position = body_index if kind == "body" else paragraph_count
+            if position >= stop:
+                break
+            selected = position >= start and (kind == "body" or is_paragraph)
+        else:
+            selected = True
+
+        if is_paragraph:
+            paragraph_index = paragraph_count
+            paragraph_count += 1
+            if not selected or not (want_paragraphs or want_body):
+                continue
+            text = block.text
+            if want_paragraphs:
+                paragraphs.append(
+                    {
+                        "paragraph_index": paragraph_index,
+                        "body_index": body_index,
+                        "text": text,
+                        "style": _get_style_name(block),
+                    }
+                )
+            if want_body:
+                body.append(
+                    {
+                        "body_index": body_index,
+                        "type": "paragraph",
+                        "paragraph_index": paragraph_index,
+                        "text": text,
+                    }
+                )
             continue
 
-        table_index = len(tables)
+        table_index = table_count
+        table_count += 1
+        if not selected or not (want_tables or want_body):
+            continue
         row_entries: list[dict] = []
+        row_count = 0
         max_column_count = 0
         for row_index, row in enumerate(block.rows):
+            cells = row.cells
+            row_count += 1
+            max_column_count = max(max_column_count, len(cells))
+            if not want_tables:
+                continue
             cell_entries: list[dict] = []
-            for column_index, cell in enumerate(row.cells):
+            for column_index, cell in enumerate(cells):
                 cell_entries.append(
                     {
                         "row_index": row_index,
@@ -96,35 +160,39 @@ def read(file_path: str | PathLike[str] | Path) -> dict:
                     }
                 )
             row_entries.append({"row_index": row_index, "cells": cell_entries})
-            max_column_count = max(max_column_count, len(cell_entries))
-
-        table_entry = {
-            "table_index": table_index,
-            "body_index": body_index,
-            "row_count": len(row_entries),
-            "column_count": max_column_count,
-            "rows": row_entries,
-        }
-        tables.append(table_entry)
-        body.append(
-            {
-                "body_index": body_index,
-                "type": "table",
-                "table_index": table_index,
-                "row_count": len(row_entries),
-                "column_count": max_column_count,
-            }
-        )
 
-    return {
-        "format": "docx",
-        "file_path": str(source),
-        "metadata": _read_core_properties(document),
-        "paragraphs": paragraphs,
-        "tables": tables,
-        "body": body,
-        "warnings": feature_warnings,
-    }
+        if want_tables:
+            tables.append(
+                {
+                    "table_index": table_index,
+                    "body_index": body_index,
+                    "row_count": row_count,
+                    "column_count": max_column_count,
+                    "rows": row_entries,
+                }
+            )
+        if want_body:
+            body.append(
+                {
+                    "body_index": body_index,
+                    "type": "table",
+                    "table_index": table_index,
+                    "row_count": row_count,
+                    "column_count": max_column_count,
+                }
+            )
+
+    result: dict = {"format": "docx", "file_path": str(source)}
+    if "metadata" in selected_fields:
+        result["metadata"] = _read_core_properties(document)
+    if want_paragraphs:
+        result["paragraphs"] = paragraphs
+    if want_tables:
+        result["tables"] = tables
+    if want_body:
+        result["body"] = body
+    result["warnings"] = feature_warnings
+    return result
 
 
 def edit(file_path: str | PathLike[str] | Path, instructions: dict) -> Path:
@@ -172,6 +240,42 @@ def edit(file_path: str | PathLike[str] | Path, instructions: dict) -> Path:
     return Path(save_path)
 
 
+def _validate_read_window(
+    *,
+    body_range: Sequence[int] | None,
+    paragraph_range: Sequence[int] | None,
+) -> tuple[str, int, int] | None:
+    if body_range is not None and paragraph_range is not None:
+        raise ValueError("Word read accepts at most one of 'body_range' and 'paragraph_range'.")
+    if body_range is None and paragraph_range is None:
+        return None
+    kind, value = ("body", body_range) if body_range is not None else ("paragraph", paragraph_range)
+    option = f"{kind}_range"
+    if isinstance(value, (str, bytes)) or not isinstance(value, Sequence) or len(value) != 2:
+        raise TypeError(f"Word read option '{option}' must be a (start, stop) pair.")
+    start, stop = value
+    if any(isinstance(bound, bool) or not isinstance(bound, int) for bound in (start, stop)):
+        raise TypeError(f"Word read option '{option}' bounds must be integers.")
+    if start < 0 or stop < start:
+        raise ValueError(f"Word read option '{option}' must satisfy 0 <= start <= stop.")
+    return kind, start, stop
+
+
+def _validate_read_fields(fields: Iterable[str] | None) -> frozenset[str]:
+    if fields is None:
+        return _READ_FIELDS
+    if isinstance(fields, str) or not isinstance(fields, Iterable):
+        raise TypeError("Word read option 'fields' must be an iterable of field names.")
+    selected = frozenset(fields)
+    unknown = sorted(str(field) for field in selected - _READ_FIELDS)
+    if unknown:
+        raise ValueError(
+            f"Word read option 'fields' has unknown field(s): {', '.join(unknown)}. "
+            f"Supported fields: {', '.join(sorted(_READ_FIELDS))}."
+        )
+    return selected
+
+
 def _load_document_callable():
     try:
         from docx import Document as load_document
@@ -417,42 +521,79 @@ def _serialize_datetime(value) -> str | None:
 
 
 def _scan_document_feature_warnings(path: Path) -> list[str]:
-    warning_messages: list[str] = []
+    """Return track-change/text-box warnings, memoized per (path, size, mtime)."""
+    try:
+        stat_result = path.stat()
+    except FileNotFoundError:
+        return []
+    return list(_scan_feature_warnings_cached(str(path.resolve()), stat_result.st_size, stat_result.st_mtime_ns))
+
+
+@lru_cache(maxsize=_FEATURE_SCAN_CACHE_SIZE)
+def _scan_feature_warnings_cached(path: str, size: int, mtime_ns: int) -> tuple[str, ...]:
+    # size and mtime_ns only key the cache so a rewritten file is rescanned.
+    found: set[str] = set()
     try:
         with zipfile.ZipFile(path) as archive:
-            has_track_changes = False
-            has_text_boxes = False
             for member_name in archive.namelist():
                 if not member_name.startswith("word/") or not member_name.endswith(".xml"):
                     continue
-                try:
-                    root = ET.fromstring(archive.read(member_name))
-                except ET.ParseError:
+                if not _member_may_contain_feature_tags(archive, member_name):
                     continue
-                for element in root.iter():
-                    local_name = _xml_local_name(element.tag)
-                    if local_name in _TRACK_CHANGE_LOCAL_NAMES:
-                        has_track_changes = True
-                    elif local_name == "txbxContent":
-                        has_text_boxes = True
-                    if has_track_changes and has_text_boxes:
-                        break
-                if has_track_changes and has_text_boxes:
+                found |= _scan_member_feature_tags(archive, member_name, skip=found)
+                if len(found) == 2:
                     break
     except (FileNotFoundError, zipfile.BadZipFile):
-        return warning_messages
+        return ()
 
-    if has_track_changes:
+    warning_messages: list[str] = []
+    if "track_changes" in found:
         warning_messages.append(
             "This document contains Word revision/track-change markup. SG2 Word V1 does "
             "not accept or reject track changes."
         )
-    if has_text_boxes:
+    if "text_boxes" in found:
         warning_messages.append(
             "This document contains Word text box content. SG2 Word V1 only supports body "
             "paragraph and table edits."
         )
-    return warning_messages
+    return tuple(warning_messages)
+
+
+def _member_may_contain_feature_tags(archive: zipfile.ZipFile, member_name: str) -> bool:
+    with archive.open(member_name) as stream:
+        tail = b""
+        while True:
+            chunk = stream.read(_PREFILTER_CHUNK_SIZE)
+            if not chunk:
+                return False
+            window = tail + chunk
+            if _FEATURE_TAG_PREFILTER.search(window):
+                return True
+            tail = window[-_PREFILTER_OVERLAP:]
+
+
+def _scan_member_feature_tags(archive: zipfile.ZipFile, member_name: str, *, skip: set[str]) -> set[str]:
+    wanted = {"track_changes", "text_boxes"} - skip
+    found: set[str] = set()
+    try:
+        with archive.open(member_name) as stream:
+            for event, element in ET.iterparse(stream, events=("start", "end")):
+                if event == "end":
+                    element.clear()  # keep memory flat on large parts
+                    continue
+                local_name = _xml_local_name(element.tag)
+                if local_name in _TRACK_CHANGE_LOCAL_NAMES:
+                    found.add("track_changes")
+                elif local_name == _TEXT_BOX_LOCAL_NAME:
+                    found.add("text_boxes")
+                else:
+                    continue
+                if wanted <= found:
+                    break
+    except ET.ParseError:
+        pass
+    return found
 
 
 def _xml_local_name(tag: str) -> str:
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import hashlib
+import json
 from pathlib import Path
+import subprocess
+import sys
 
 import fitz
 import pytest
@@ -16,6 +19,9 @@ from office_automation.anonymize import detect as detect_module
 from office_automation.anonymize.detect import detect
 
 
+_FORMAT_BACKENDS = ("fitz", "docx", "openpyxl", "pptx", "PIL")
+
+
 def _sha256(path: Path) -> str:
     return hashlib.sha256(path.read_bytes()).hexdigest()
 
@@ -209,13 +215,20 @@ def test_detect_uses_shared_metadata_and_image_helpers(tmp_path: Path, monkeypat
             "warnings": [],
         }
 
-    def fake_extract_images(file_path: str | Path, output_dir: str | Path) -> list[Path]:
+    def fake_list_image_inventory(file_path: str | Path) -> list[dict]:
         observed_image_paths.append(Path(file_path))
-        created = _create_png(Path(output_dir) / "fake-image.png", (0, 255, 0), size=(10, 20))
-        return [created]
+        return [
+            {
+                "image_index": 0,
+                "extracted_filename": "fake-image.png",
+                "width": 10,
+                "height": 20,
+                "sha256": "0" * 64,
+            }
+        ]
 
     monkeypatch.setattr(detect_module, "read_metadata", fake_read_metadata)
-    monkeypatch.setattr(detect_module, "extract_images", fake_extract_images)
+    monkeypatch.setattr(detect_module, "list_image_inventory", fake_list_image_inventory)
 
     findings = detect(tmp_path, extensions=["docx"])
 
@@ -540,3 +553,21 @@ def test_detect_emits_pdf_multi_word_hint_findings_with_bounded_excerpt(tmp_path
     assert "PDF text-layer matches remain review-first" in finding["manual_review_reason"]
     assert finding["source"] == "user_hint"
     assert finding["reason_tags"] == ["pdf_text_layer", "person_hint"]
+
+
+
+def test_detect_import_defers_format_backends() -> None:
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import json, sys\n"
+            "import office_automation.anonymize.detect\n"
+            f"print(json.dumps(sorted(name for name in {list(_FORMAT_BACKENDS)!r} if name in sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert json.loads(completed.stdout) == []
@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 
 import fitz
+import pytest
 from docx import Document
 from openpyxl import Workbook, load_workbook
 from openpyxl.comments import Comment
@@ -14,6 +15,7 @@ from office_automation.anonymize.candidate_summary import (
     build_body_text_candidate_summary,
     resolve_body_text_confirmation,
 )
+from office_automation.anonymize import transform as transform_module
 from office_automation.anonymize.detect import detect
 from office_automation.anonymize.transform import transform
 from office_automation.common.images import extract_images
@@ -418,6 +420,50 @@ def test_transform_applies_pdf_comment_replacement_and_blanks_annotation_metadat
 
 
 
+def test_transform_incremental_pdf_save_finishes_with_clean_pass_for_removed_content(tmp_path: Path) -> None:
+    source = _create_pdf_with_annotation(tmp_path / "incremental.pdf")
+    findings = _findings_for(tmp_path, source.name, categories={"comments", "metadata"})
+    policy = _policy(metadata={"enabled": True, "action": "clear"})
+    policy["pdf_save"] = {"mode": "incremental"}
+
+    results = transform(findings, policy)
+
+    assert len(results) == 1
+    result = results[0]
+    assert [action["status"] for action in result["actions"]] == ["applied"] * len(findings)
+    assert result["pdf_save"] == {
+        "clean_pass_applied": True,
+        "mode": "incremental",
+        "requires_object_removal": True,
+    }
+
+    payload = source.read_bytes()
+    assert b"Secret comment" not in payload
+    assert b"Alice" not in payload
+    document = fitz.open(source)
+    try:
+        assert list(document[0].annots() or []) == []
+    finally:
+        document.close()
+
+
+
+def test_transform_falls_back_to_full_pdf_save_for_unknown_save_mode(tmp_path: Path) -> None:
+    source = _create_pdf_with_annotation(tmp_path / "unknown-mode.pdf")
+    findings = [finding for finding in _structural_findings_for(tmp_path, source.name) if finding["category"] == "comments"]
+    policy = _policy()
+    policy["pdf_save"] = {"mode": "append_forever"}
+
+    results = transform(findings, policy)
+
+    result = results[0]
+    assert "pdf_save" not in result
+    assert result["status"] == "partial_success"
+    assert any("Unsupported pdf_save mode 'append_forever'" in warning for warning in result["warnings"])
+    assert b"Secret comment" not in source.read_bytes()
+
+
+
 def test_transform_applies_powerpoint_notes_and_preserves_manual_review_items_for_other_surfaces(tmp_path: Path) -> None:
     source = _create_pptx_with_notes(tmp_path / "deck.pptx")
     findings = _structural_findings_for(tmp_path, source.name)
@@ -479,6 +525,80 @@ def test_transform_clears_metadata_and_masks_docx_images_with_python_only_helper
 
 
 
+def test_transform_masks_images_in_memory_and_reuses_rendered_masks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    image_paths = [
+        _create_color_image(tmp_path / "inputs" / f"{name}.png", color)
+        for name, color in (("red", (255, 0, 0)), ("green", (0, 255, 0)), ("blue", (0, 0, 255)))
+    ]
+    document = Document()
+    for image_path in image_paths:
+        document.add_picture(str(image_path))
+    source = tmp_path / "many-images.docx"
+    document.save(source)
+    findings = _findings_for(tmp_path, source.name, categories={"images"})
+
+    def fail_temporary_directory(*args, **kwargs):
+        raise AssertionError("masking must not create temporary directories")
+
+    rendered_sizes: list[tuple[int, int]] = []
+    original_new = Image.new
+
+    def counting_new(mode, size, *args, **kwargs):
+        rendered_sizes.append(tuple(size))
+        return original_new(mode, size, *args, **kwargs)
+
+    transform_module._MASK_RENDER_CACHE.clear()
+    monkeypatch.setattr(transform_module.tempfile, "TemporaryDirectory", fail_temporary_directory)
+    monkeypatch.setattr(Image, "new", counting_new)
+
+    results = transform(findings, _policy(images={"enabled": True, "mode": "mask", "mask_color": "#11aa22"}))
+
+    assert [action["status"] for action in results[0]["actions"]] == ["applied", "applied", "applied"]
+    assert rendered_sizes == [_IMAGE_SIZE]
+    monkeypatch.undo()
+    extracted = extract_images(source, tmp_path / "extracted" / "docx-many-masked")
+    assert [_image_color(path) for path in extracted] == [(17, 170, 34)] * 3
+
+
+
+def test_transform_renders_each_replacement_once_across_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    logo = _create_color_image(tmp_path / "inputs" / "logo.png", (255, 0, 0))
+    photo = _create_color_image(tmp_path / "inputs" / "photo.png", (0, 0, 255))
+    replacement = _create_color_image(tmp_path / "inputs" / "replacement.png", (9, 9, 9))
+    first = _create_docx_with_metadata_and_image(tmp_path / "first.docx", logo)
+    second = _create_docx_with_metadata_and_image(tmp_path / "second.docx", logo)
+    third = _create_docx_with_metadata_and_image(tmp_path / "third.docx", photo)
+    findings = [finding for finding in detect(tmp_path) if finding["category"] == "images"]
+
+    render_calls: list[str] = []
+    original_render = transform_module.render_image_bytes
+
+    def counting_render(replacement_value, *, target_extension):
+        render_calls.append(target_extension)
+        return original_render(replacement_value, target_extension=target_extension)
+
+    monkeypatch.setattr(transform_module, "render_image_bytes", counting_render)
+
+    results = transform(findings, _policy(images={"enabled": True, "mode": "replace", "replacement_path": str(replacement)}))
+
+    actions = {Path(result["file_path"]).name: result["actions"][0] for result in results}
+    assert [action["status"] for action in actions.values()] == ["applied", "applied", "applied"]
+    # One replacement render serves every source image, not one per unique source.
+    assert render_calls == ["png"]
+    assert actions["first.docx"]["details"]["content_sha256"] == actions["second.docx"]["details"]["content_sha256"]
+    assert actions["first.docx"]["details"]["content_occurrence_count"] == 2
+    assert actions["third.docx"]["details"]["content_occurrence_count"] == 1
+    assert [actions[name]["details"]["render_reused"] for name in ("first.docx", "second.docx", "third.docx")] == [
+        False,
+        True,
+        True,
+    ]
+    for source in (first, second, third):
+        extracted = extract_images(source, tmp_path / "extracted" / source.stem)
+        assert [_image_color(path) for path in extracted] == [(9, 9, 9)]
+
+
+
 def test_transform_downgrades_remove_to_mask_for_supported_image_slots(tmp_path: Path) -> None:
     image_path = _create_color_image(tmp_path / "inputs" / "red.png", (255, 0, 0))
     source = _create_docx_with_metadata_and_image(tmp_path / "remove-image.docx", image_path)
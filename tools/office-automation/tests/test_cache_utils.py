@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import sys
+import time
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+WRAPPER_SCRIPTS = REPO_ROOT / ".codex" / "skills" / "office-anonymizer" / "scripts"
+if str(WRAPPER_SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(WRAPPER_SCRIPTS))
+
+import cache_utils
+
+
+def _manifest(base: Path) -> dict:
+    return json.loads((base / cache_utils.MANIFEST_FILENAME).read_text(encoding="utf-8"))
+
+
+def test_janitor_evicts_least_recently_used_entries_over_the_byte_quota(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    cache_dir = cache_utils.ensure_keyed_cache()
+    for key in ("aa", "bb", "cc"):
+        cache_utils.write_cache_entry(cache_dir, key * 32, {"status": "replaced"}, b"x" * 4000)
+    assert cache_utils.read_cache_entry(cache_dir, "aa" * 32) is not None  # now most recently used
+    live_run = cache_utils.mkdtemp_run()
+    (live_run / "backup.bak").write_bytes(b"y" * 8000)
+    cache_utils.record_run_usage(live_run)
+
+    usage = cache_utils.cache_usage()
+    assert usage["items"] == 4
+    assert usage["total_bytes"] > 20000
+
+    monkeypatch.setenv(cache_utils.CACHE_QUOTA_ENV_VAR, "17000")
+    removed = cache_utils.janitor_sweep()
+
+    assert sorted(path.name for path in removed) == [f"{'bb' * 32}.bin", f"{'bb' * 32}.json"]
+    assert cache_utils.read_cache_entry(cache_dir, "bb" * 32) is None
+    assert cache_utils.read_cache_entry(cache_dir, "aa" * 32) is not None
+    # Run dirs (live invocations, failed runs kept for debugging) are never evicted for quota.
+    assert live_run.is_dir()
+    base = cache_utils.resolve_cache_base()
+    assert (base.stat().st_mode & 0o777) == 0o700
+    assert ((base / cache_utils.MANIFEST_FILENAME).stat().st_mode & 0o777) == 0o600
+    assert set(_manifest(base)["items"]) == {f"image-results/{'aa' * 32}", f"image-results/{'cc' * 32}", live_run.name}
+
+
+def test_quota_eviction_keeps_unexpired_run_dirs_however_stale(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    failed_run = cache_utils.mkdtemp_run()
+    cache_utils.write_expires_at(failed_run)
+    (failed_run / "codex.log").write_bytes(b"z" * 8000)
+    cache_utils.record_run_usage(failed_run)
+    base = cache_utils.resolve_cache_base()
+    manifest = _manifest(base)
+    manifest["items"][failed_run.name]["last_used"] = time.time() - 7 * 86400
+    cache_utils._save_manifest(base, manifest)
+
+    monkeypatch.setenv(cache_utils.CACHE_QUOTA_ENV_VAR, "1000")
+    removed = cache_utils.janitor_sweep()
+
+    assert removed == []
+    assert (failed_run / "codex.log").exists()
+    assert failed_run.name in _manifest(base)["items"]
+
+
+def test_janitor_expires_runs_from_the_manifest_without_walking_the_tree(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    base = cache_utils.ensure_cache_base()
+    legacy_run = base / "oa-legacy"
+    legacy_run.mkdir()
+    (legacy_run / cache_utils._EXPIRES_AT_SENTINEL).write_text("2000-01-01T00:00:00+00:00", encoding="utf-8")
+
+    # No manifest yet: the first sweep walks the tree, so untracked dirs keep their retention.
+    assert cache_utils.janitor_sweep() == [legacy_run]
+    assert _manifest(base)["full_sweep_at"] > 0
+
+    expired_run = cache_utils.mkdtemp_run()
+    cache_utils.write_expires_at(expired_run, days=-1)
+    kept_run = cache_utils.mkdtemp_run()
+    cache_utils.write_expires_at(kept_run)
+
+    def no_walk(self):
+        raise AssertionError("janitor_sweep must consult the manifest instead of walking the tree")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(Path, "iterdir", no_walk)
+        assert cache_utils.janitor_sweep() == [expired_run]
+
+    assert not expired_run.exists()
+    assert kept_run.is_dir()
+    cache_utils.cleanup_runid(kept_run)
+    assert _manifest(base)["items"] == {}
+
+
+def test_keyed_entries_outside_the_cache_base_leave_no_manifest_behind(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    cache_dir = tmp_path / "somewhere" / "cache"
+    cache_dir.mkdir(parents=True)
+
+    cache_utils.write_cache_entry(cache_dir, "ab" * 32, {"status": "ok"}, b"payload")
+    meta, payload = cache_utils.read_cache_entry(cache_dir, "ab" * 32)
+    assert (meta["status"], payload) == ("ok", b"payload")
+
+    assert sorted(path.name for path in (tmp_path / "somewhere").iterdir()) == ["cache"]
+    assert not (tmp_path / "xdg").exists()
+
+
+def test_cache_hits_batch_manifest_touches_until_the_next_rewrite(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    cache_dir = cache_utils.ensure_keyed_cache()
+    for key in ("aa", "bb"):
+        cache_utils.write_cache_entry(cache_dir, key * 32, {"status": "replaced"}, b"x" * 4000)
+
+    saves: list[Path] = []
+    original_save = cache_utils._save_manifest
+
+    def counting_save(base: Path, manifest: dict) -> None:
+        saves.append(base)
+        original_save(base, manifest)
+
+    monkeypatch.setattr(cache_utils, "_save_manifest", counting_save)
+    monkeypatch.setattr(cache_utils, "_last_manifest_flush", time.monotonic())
+    for _ in range(50):
+        assert cache_utils.read_cache_entry(cache_dir, "aa" * 32) is not None
+    assert saves == []
+
+    # The queued touch still decides LRU order once the janitor rewrites the manifest.
+    monkeypatch.setenv(cache_utils.CACHE_QUOTA_ENV_VAR, "5000")
+    removed = cache_utils.janitor_sweep()
+    assert sorted(path.name for path in removed) == [f"{'bb' * 32}.bin", f"{'bb' * 32}.json"]
+    assert len(saves) == 1
+
+
+def test_entry_writes_batch_manifest_rewrites(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    cache_dir = cache_utils.ensure_keyed_cache()
+
+    saves: list[Path] = []
+    original_save = cache_utils._save_manifest
+
+    def counting_save(base: Path, manifest: dict) -> None:
+        saves.append(base)
+        original_save(base, manifest)
+
+    monkeypatch.setattr(cache_utils, "_save_manifest", counting_save)
+    monkeypatch.setattr(cache_utils, "_ENTRY_FLUSH_BATCH", 4)
+    monkeypatch.setattr(cache_utils, "_last_manifest_flush", time.monotonic())
+    for index in range(10):
+        cache_utils.write_cache_entry(cache_dir, f"{index:02x}" * 32, {"status": "replaced"}, b"x" * 100)
+    assert len(saves) == 2
+
+    # The tail of the batch is written before anyone reads the totals.
+    assert cache_utils.cache_usage()["items"] == 10
+    assert len(saves) == 3
+
+
+def test_store_backup_deduplicates_identical_backups_across_runs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    deck = tmp_path / "deck.pptx"
+    deck.write_bytes(b"original deck bytes" * 1000)
+    first_run = cache_utils.mkdtemp_run()
+    second_run = cache_utils.mkdtemp_run()
+
+    first = cache_utils.store_backup(deck, first_run / "backups" / "deck.pptx.pre-postpass.bak")
+    second = cache_utils.store_backup(deck, second_run / "backups" / "deck.pptx.pre-postpass.bak")
+    deck.write_bytes(b"anonymized deck bytes")
+
+    store_dir = cache_utils.ensure_keyed_cache(cache_utils.BACKUP_STORE_DIRNAME)
+    objects = sorted(store_dir.glob("*.bin"))
+    assert len(objects) == 1
+    assert first.stat().st_ino == second.stat().st_ino == objects[0].stat().st_ino
+    assert first.read_bytes() == b"original deck bytes" * 1000
+    assert (first.stat().st_mode & 0o777) == 0o600
+
+    # Hardlinked backups are charged once, to the store entry, not to each run.
+    cache_utils.record_run_usage(first_run)
+    items = _manifest(cache_utils.resolve_cache_base())["items"]
+    object_item = f"{cache_utils.BACKUP_STORE_DIRNAME}/{objects[0].stem}"
+    assert items[first_run.name]["size"] == 0
+    assert items[object_item]["size"] > 19000
+
+    # A store object is not evicted for quota while a run dir still links it.
+    monkeypatch.setenv(cache_utils.CACHE_QUOTA_ENV_VAR, "1")
+    assert cache_utils.janitor_sweep() == []
+    assert objects[0].exists()
+
+    # A successful cleanup keeps the object while another run links it, then drops it.
+    cache_utils.cleanup_runid(first_run)
+    assert second.read_bytes() == objects[0].read_bytes()
+    cache_utils.cleanup_runid(second_run)
+    assert list(store_dir.iterdir()) == []
+    assert object_item not in _manifest(cache_utils.resolve_cache_base())["items"]
+
+
+def test_store_backup_outside_the_cache_base_writes_a_plain_copy(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    deck = tmp_path / "deck.pptx"
+    deck.write_bytes(b"original deck bytes" * 1000)
+
+    backup = cache_utils.store_backup(deck, tmp_path / "user-backups" / "deck.pptx.pre-postpass.bak")
+    deck.write_bytes(b"anonymized deck bytes")
+
+    assert backup.read_bytes() == b"original deck bytes" * 1000
+    assert backup.stat().st_nlink == 1
+    assert (backup.stat().st_mode & 0o777) == 0o600
+    assert not (tmp_path / "xdg").exists()
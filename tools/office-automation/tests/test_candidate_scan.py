@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import zipfile
+
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.util import Inches
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+WRAPPER_SCRIPTS = REPO_ROOT / ".codex" / "skills" / "office-anonymizer" / "scripts"
+if str(WRAPPER_SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(WRAPPER_SCRIPTS))
+
+import cache_utils
+import candidate_scan
+
+
+def _object_model_paragraphs(shape, *, prefix: str):
+    """The python-pptx walk the XML stream must reproduce."""
+    if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+        for idx, child in enumerate(shape.shapes):
+            yield from _object_model_paragraphs(child, prefix=f"{prefix}g{idx}/")
+        return
+    shape_path = f"{prefix}{shape.shape_id}"
+    if shape.has_text_frame:
+        for para_idx, para in enumerate(shape.text_frame.paragraphs):
+            text = "".join(run.text for run in para.runs)
+            if text.strip():
+                yield shape_path, para_idx, text
+    if getattr(shape, "has_table", False):
+        for row_idx, row in enumerate(shape.table.rows):
+            for col_idx, cell in enumerate(row.cells):
+                for para_idx, para in enumerate(cell.text_frame.paragraphs):
+                    text = "".join(run.text for run in para.runs)
+                    if text.strip():
+                        yield f"{shape_path}/r{row_idx}c{col_idx}", para_idx, text
+
+
+def _create_deck(path: Path, *, extra_slide_text: str | None = None) -> Path:
+    presentation = Presentation()
+    first = presentation.slides.add_slide(presentation.slide_layouts[1])
+    first.shapes.title.text = "BS北畠部長 中瀬統括次長ご挨拶"
+    body = first.placeholders[1].text_frame
+    body.text = "三井不動産レジリース 担当 ヤマダさん"
+    body.add_paragraph()
+    body.add_paragraph().text = "部長 田中部長"
+
+    group = first.shapes.add_group_shape()
+    group.shapes.add_textbox(Inches(1), Inches(1), Inches(2), Inches(1)).text_frame.text = "鈴木課長"
+    nested = group.shapes.add_group_shape()
+    nested.shapes.add_textbox(Inches(1), Inches(2), Inches(2), Inches(1)).text_frame.text = "サトウ主任"
+    nested.shapes.add_textbox(Inches(1), Inches(3), Inches(2), Inches(1)).text_frame.text = "BF王子神谷"
+
+    second = presentation.slides.add_slide(presentation.slide_layouts[6])
+    table = second.shapes.add_table(2, 2, Inches(1), Inches(1), Inches(4), Inches(2)).table
+    table.cell(0, 0).text = "田中部長"
+    table.cell(1, 1).text = "東都建設\n北畠物産"
+    if extra_slide_text is not None:
+        extra = presentation.slides.add_slide(presentation.slide_layouts[6])
+        extra.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame.text = extra_slide_text
+    presentation.save(path)
+    return path
+
+
+def test_iter_slide_paragraphs_matches_the_python_pptx_walk(tmp_path: Path) -> None:
+    deck = _create_deck(tmp_path / "deck.pptx")
+
+    expected = [
+        [item for shape in slide.shapes for item in _object_model_paragraphs(shape, prefix="")]
+        for slide in Presentation(str(deck)).slides
+    ]
+
+    with zipfile.ZipFile(deck) as package:
+        streamed = []
+        for part_name in candidate_scan._slide_part_names(package):
+            with package.open(part_name) as slide_xml:
+                streamed.append(list(candidate_scan._iter_slide_paragraphs(slide_xml)))
+
+    assert streamed == expected
+    assert any(path.startswith("g1/g1/") for path, _, _ in streamed[0])
+    assert [path.split("/", 1)[1] for path, _, _ in streamed[1]] == ["r0c0", "r1c1", "r1c1"]
+
+
+def test_scan_pptx_fused_scanner_keeps_overlapping_categories(tmp_path: Path) -> None:
+    deck = _create_deck(tmp_path / "deck.pptx")
+
+    candidates = candidate_scan.scan_pptx(deck)
+
+    by_key = {(candidate.category, candidate.text): candidate for candidate in candidates}
+    assert set(by_key) == {
+        ("person_name", "北畠"),
+        ("person_name", "中瀬"),
+        ("person_name", "ヤマダ"),
+        ("person_name", "田中"),
+        ("person_name", "鈴木"),
+        ("person_name", "サトウ"),
+        ("company_name", "三井不動産レジリース"),
+        ("company_name", "東都建設"),
+        ("company_name", "北畠物産"),
+        ("property_code", "BS北畠部長"),
+        ("property_code", "BF王子神谷"),
+    }
+    assert [(hit.slide_number, hit.match_start, hit.match_end) for hit in by_key[("person_name", "田中")].hits] == [
+        (1, 3, 5),
+        (2, 0, 2),
+    ]
+    assert [(hit.match_start, hit.match_end) for hit in by_key[("person_name", "北畠")].hits] == [(2, 4)]
+    assert [(hit.match_start, hit.match_end) for hit in by_key[("property_code", "BS北畠部長")].hits] == [(0, 6)]
+    assert by_key[("person_name", "中瀬")].hits[0].match_start == 7
+    assert all(hit.context == "" for candidate in candidates for hit in candidate.hits)
+    assert candidate_scan.summarize_counts(candidates)["person_name"] == 6
+
+
+def test_scan_pptx_files_uses_a_process_pool_and_reuses_cached_scans(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    cache_dir = cache_utils.ensure_keyed_cache(cache_utils.CANDIDATE_SCAN_CACHE_DIRNAME)
+    decks = [
+        _create_deck(tmp_path / "a.pptx"),
+        _create_deck(tmp_path / "b.pptx"),
+        _create_deck(tmp_path / "c.pptx", extra_slide_text="高橋部長"),
+    ]
+    expected = {deck: candidate_scan.scan_pptx(deck) for deck in decks}
+
+    scanned = candidate_scan.scan_pptx_files(decks, cache_dir=cache_dir, max_workers=2)
+
+    assert scanned == expected
+    assert list(scanned) == decks
+    entries = sorted(cache_dir.iterdir())
+    assert len(entries) == 2  # identical decks share one content-hash entry
+    assert all((entry.stat().st_mode & 0o777) == 0o600 for entry in entries)
+
+    def fail_scan(path, *, with_context=False):
+        raise AssertionError(f"{path} should have been served from the cache")
+
+    monkeypatch.setattr(candidate_scan, "scan_pptx", fail_scan)
+    assert candidate_scan.scan_pptx_files(decks, cache_dir=cache_dir) == expected
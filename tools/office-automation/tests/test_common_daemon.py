@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from pathlib import Path
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import time
+
+from docx import Document
+from pptx import Presentation
+from pptx.util import Inches
+import pytest
+
+from office_automation.common import daemon
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+RUNTIME_SRC = REPO_ROOT / "tools" / "office-automation" / "src"
+WRAPPER_SCRIPTS = REPO_ROOT / ".codex" / "skills" / "office-python" / "scripts"
+ANONYMIZER_SCRIPTS = REPO_ROOT / ".codex" / "skills" / "office-anonymizer" / "scripts"
+if str(WRAPPER_SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(WRAPPER_SCRIPTS))
+
+import office_python_wrapper
+
+
+_HANDLERS_MODULE = """
+import time
+
+
+def echo(request):
+    return {"echo": request}
+
+
+def fail(request):
+    raise ValueError("handler refused " + request["reason"])
+
+
+def sleep(request):
+    time.sleep(request["seconds"])
+    return {"slept": request["seconds"]}
+
+
+def scan_decks(request):
+    import candidate_scan
+
+    scanned = candidate_scan.scan_pptx_files(request["decks"], max_workers=2)
+    return {str(path): sorted(candidate.text for candidate in candidates) for path, candidates in scanned.items()}
+"""
+
+
+@pytest.fixture(scope="module")
+def daemon_socket(tmp_path_factory: pytest.TempPathFactory):
+    root = tmp_path_factory.mktemp("daemon")
+    (root / "daemon_test_handlers.py").write_text(textwrap.dedent(_HANDLERS_MODULE), encoding="utf-8")
+    socket_path = root / "run" / "daemon.sock"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(RUNTIME_SRC), os.environ.get("PYTHONPATH")])))
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "office_automation.common.daemon",
+            "--socket",
+            str(socket_path),
+            "--pythonpath",
+            str(root),
+            "--pythonpath",
+            str(WRAPPER_SCRIPTS),
+            "--pythonpath",
+            str(ANONYMIZER_SCRIPTS),
+            "--handler",
+            "echo=daemon_test_handlers:echo",
+            "--handler",
+            "fail=daemon_test_handlers:fail",
+            "--handler",
+            "sleep=daemon_test_handlers:sleep",
+            "--handler",
+            "scan_decks=daemon_test_handlers:scan_decks",
+            "--handler",
+            "office_python.run_request=office_python_wrapper:run_request",
+            "--workers",
+            "2",
+            "--timeout",
+            "60",
+        ],
+        env=env,
+        cwd="/",
+    )
+    try:
+        deadline = time.monotonic() + 60
+        while not socket_path.exists():
+            assert process.poll() is None, "daemon exited during startup"
+            assert time.monotonic() < deadline, "daemon did not bind its socket"
+            time.sleep(0.05)
+        yield socket_path
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+    assert not socket_path.exists()
+
+
+def test_call_or_run_falls_back_in_process_without_a_daemon(tmp_path: Path) -> None:
+    with pytest.raises(daemon.DaemonUnavailable):
+        daemon.call("echo", {}, socket_path=tmp_path / "missing.sock")
+
+    result = daemon.call_or_run("echo", {"a": 1}, lambda request: {"local": request}, socket_path=tmp_path / "missing.sock")
+
+    assert result == {"local": {"a": 1}}
+
+
+def test_daemon_runs_handlers_and_reports_errors_and_timeouts(daemon_socket: Path) -> None:
+    assert (daemon_socket.stat().st_mode & 0o777) == 0o600
+    assert (daemon_socket.parent.stat().st_mode & 0o777) == 0o700
+    assert daemon.call("echo", {"path": Path("/x"), "n": 1}, socket_path=daemon_socket) == {
+        "echo": {"path": "/x", "n": 1}
+    }
+
+    with pytest.raises(daemon.DaemonRequestError, match="handler refused now") as failed:
+        daemon.call("fail", {"reason": "now"}, socket_path=daemon_socket)
+    assert failed.value.error_type == "ValueError"
+
+    with pytest.raises(daemon.DaemonRequestError) as unknown:
+        daemon.call("missing", {}, socket_path=daemon_socket)
+    assert unknown.value.error_type == "LookupError"
+
+    started = time.monotonic()
+    with pytest.raises(daemon.DaemonRequestError) as timed_out:
+        daemon.call("sleep", {"seconds": 30}, socket_path=daemon_socket, timeout=0.5)
+    assert timed_out.value.error_type == "TimeoutError"
+    assert time.monotonic() - started < 10
+    assert daemon.call("sleep", {"seconds": 0}, socket_path=daemon_socket) == {"slept": 0}
+
+
+def test_wrapper_daemon_shim_matches_in_process_results(daemon_socket: Path, tmp_path: Path) -> None:
+    document = Document()
+    document.add_paragraph("Daemon read")
+    source = tmp_path / "sample.docx"
+    document.save(source)
+    request = {"file_path": str(source), "mode": "read"}
+
+    via_daemon = office_python_wrapper.run_request_via_daemon(request, socket_path=daemon_socket)
+    in_process = office_python_wrapper.run_request_via_daemon(request, socket_path=tmp_path / "missing.sock")
+
+    assert via_daemon["status"] == 0
+    assert via_daemon == json.loads(json.dumps(in_process, default=str))
+
+
+def test_wrapper_daemon_shim_resolves_relative_paths_against_the_caller_cwd(
+    daemon_socket: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    document = Document()
+    document.add_paragraph("Relative read")
+    document.save(tmp_path / "rel.docx")
+    monkeypatch.chdir(tmp_path)
+    request = {"file_path": "rel.docx", "mode": "read"}
+
+    via_daemon = office_python_wrapper.run_request_via_daemon(request, socket_path=daemon_socket)
+
+    assert via_daemon["status"] == 0, via_daemon["message"]
+    assert via_daemon == json.loads(json.dumps(office_python_wrapper.run_request(request), default=str))
+
+
+def test_daemon_handlers_may_start_process_pools(daemon_socket: Path, tmp_path: Path) -> None:
+    decks = []
+    for name, text in (("a.pptx", "田中部長"), ("b.pptx", "鈴木課長")):
+        presentation = Presentation()
+        slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+        slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame.text = text
+        presentation.save(tmp_path / name)
+        decks.append(str(tmp_path / name))
+
+    scanned = daemon.call("scan_decks", {"decks": decks}, socket_path=daemon_socket)
+
+    assert scanned == {decks[0]: ["田中"], decks[1]: ["鈴木"]}
@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from office_automation.common.files import copy_original, list_office_files
+from office_automation.common.files import clone_file, copy_original, list_office_files
 
 
 def test_list_office_files_defaults_to_supported_extensions(tmp_path: Path) -> None:
@@ -76,6 +76,24 @@ def test_copy_original_copies_into_fresh_destination_directory(tmp_path: Path) -
     assert copied.stat().st_mtime_ns == source.stat().st_mtime_ns
 
 
+def test_clone_file_falls_back_to_a_plain_copy_and_refuses_to_overwrite(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = tmp_path / "deck.pptx"
+    source.write_bytes(os.urandom(300_000))
+
+    method = clone_file(source, tmp_path / "fast.pptx")
+    assert method in {"reflink", "copy_file_range", "copy"}
+    assert (tmp_path / "fast.pptx").read_bytes() == source.read_bytes()
+
+    monkeypatch.setattr("office_automation.common.files._clone_descriptor", lambda src_fd, dst_fd: None)
+    assert clone_file(source, tmp_path / "plain.pptx") == "copy"
+    assert (tmp_path / "plain.pptx").read_bytes() == source.read_bytes()
+
+    with pytest.raises(FileExistsError):
+        clone_file(source, tmp_path / "plain.pptx")
+
+
 def test_copy_original_uses_copy_suffix_in_same_directory(tmp_path: Path) -> None:
     source = tmp_path / "report.pdf"
     source.write_text("original")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 
 import fitz
@@ -7,7 +8,7 @@ import pytest
 from docx import Document
 from PIL import Image
 
-from office_automation.common.images import extract_images, replace_image
+from office_automation.common.images import extract_images, list_image_inventory, replace_image
 
 
 _IMAGE_SIZE = (40, 40)
@@ -73,6 +74,49 @@ def test_extract_images_from_docx_uses_deterministic_names_and_order(tmp_path: P
 
 
 
+def test_list_image_inventory_probes_headers_and_matches_extracted_images(tmp_path: Path) -> None:
+    inputs = tmp_path / "inputs"
+    inputs.mkdir()
+    formats = [
+        ("png", "PNG", (31, 17)),
+        ("jpg", "JPEG", (45, 23)),
+        ("gif", "GIF", (12, 34)),
+        ("bmp", "BMP", (8, 9)),
+        ("tif", "TIFF", (21, 5)),
+    ]
+    image_paths = []
+    for name, save_format, size in formats:
+        image_path = inputs / f"{name}-image.{name}"
+        Image.new("RGB", size, (10, 20, 30)).save(image_path, format=save_format)
+        image_paths.append(image_path)
+    source = _create_docx_with_images(tmp_path / "sample.docx", image_paths)
+
+    inventory = list_image_inventory(source)
+    extracted = extract_images(source, tmp_path / "extracted")
+
+    assert [entry["extracted_filename"] for entry in inventory] == [path.name for path in extracted]
+    assert [entry["image_index"] for entry in inventory] == list(range(len(extracted)))
+    for entry, extracted_path in zip(inventory, extracted):
+        payload = extracted_path.read_bytes()
+        with Image.open(extracted_path) as image:
+            assert (entry["width"], entry["height"]) == image.size
+            assert entry["format"] == image.format
+        assert entry["byte_size"] == len(payload)
+        assert entry["sha256"] == hashlib.sha256(payload).hexdigest()
+        assert str(entry["archive_name"]).startswith("word/media/")
+    assert sorted((entry["width"], entry["height"]) for entry in inventory) == sorted(size for _, _, size in formats)
+
+    replacement = inputs / "replacement.png"
+    Image.new("RGB", (3, 4), (0, 0, 0)).save(replacement, format="PNG")
+    target_index = next(entry["image_index"] for entry in inventory if entry["extension"] == "png")
+    replace_image(source, target_index, replacement)
+
+    refreshed = list_image_inventory(source)
+    assert (refreshed[target_index]["width"], refreshed[target_index]["height"]) == (3, 4)
+    assert refreshed[target_index]["sha256"] != inventory[target_index]["sha256"]
+
+
+
 def test_replace_image_updates_docx_media_slot_in_place(tmp_path: Path) -> None:
     red = _create_color_image(tmp_path / "inputs" / "red.png", (255, 0, 0))
     blue = _create_color_image(tmp_path / "inputs" / "blue.png", (0, 0, 255))
@@ -86,6 +130,25 @@ def test_replace_image_updates_docx_media_slot_in_place(tmp_path: Path) -> None:
 
 
 
+def test_replace_image_accepts_encoded_bytes_and_pil_images(tmp_path: Path) -> None:
+    red = _create_color_image(tmp_path / "inputs" / "red.png", (255, 0, 0))
+    blue = _create_color_image(tmp_path / "inputs" / "blue.png", (0, 0, 255))
+    source = _create_docx_with_images(tmp_path / "sample.docx", [red, blue])
+    green_bytes = _create_color_image(tmp_path / "inputs" / "green.png", (0, 255, 0)).read_bytes()
+
+    replace_image(source, 0, green_bytes)
+    replace_image(source, 1, Image.new("RGB", _IMAGE_SIZE, (255, 255, 0)))
+
+    inventory = list_image_inventory(source)
+    extracted = extract_images(source, tmp_path / "extracted" / "docx-in-memory")
+    assert inventory[0]["sha256"] == hashlib.sha256(green_bytes).hexdigest()
+    assert [_image_color(path) for path in extracted] == [(0, 255, 0), (255, 255, 0)]
+
+    with pytest.raises(ValueError, match=r"Replacement image bytes are not a readable image\."):
+        replace_image(source, 0, b"not an image")
+
+
+
 def test_extract_and_replace_pdf_images_follow_page_then_image_order(tmp_path: Path) -> None:
     red = _create_color_image(tmp_path / "inputs" / "red.png", (255, 0, 0))
     blue = _create_color_image(tmp_path / "inputs" / "blue.png", (0, 0, 255))
@@ -125,6 +188,49 @@ def test_replace_image_rejects_pdf_slots_that_share_an_image_object(tmp_path: Pa
         replace_image(source, 0, green)
 
 
+def test_pdf_image_helpers_extract_each_shared_xref_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    red = _create_color_image(tmp_path / "inputs" / "red.png", (255, 0, 0))
+    blue = _create_color_image(tmp_path / "inputs" / "blue.png", (0, 0, 255))
+    green = _create_color_image(tmp_path / "inputs" / "green.png", (0, 255, 0))
+    document = fitz.open()
+    logo_xref = 0
+    for _ in range(6):
+        page = document.new_page()
+        if logo_xref:
+            page.insert_image(fitz.Rect(36, 36, 76, 76), xref=logo_xref)
+        else:
+            logo_xref = page.insert_image(fitz.Rect(36, 36, 76, 76), filename=str(red))
+    document.new_page().insert_image(fitz.Rect(36, 36, 136, 136), filename=str(blue))
+    source = tmp_path / "logo.pdf"
+    document.save(source)
+    document.close()
+
+    extracted_xrefs: list[int] = []
+    original_extract_image = fitz.Document.extract_image
+
+    def counting_extract_image(self, xref):
+        extracted_xrefs.append(xref)
+        return original_extract_image(self, xref)
+
+    monkeypatch.setattr(fitz.Document, "extract_image", counting_extract_image)
+
+    inventory = list_image_inventory(source)
+    assert [(entry["page_index"], entry["page_image_index"]) for entry in inventory] == [
+        (page_index, 0) for page_index in range(7)
+    ]
+    assert len({entry["sha256"] for entry in inventory}) == 2
+    assert len(extracted_xrefs) == 2
+
+    extracted_xrefs.clear()
+    replace_image(source, 6, green)
+    assert len(extracted_xrefs) == 2
+    with pytest.raises(NotImplementedError, match=r"shares xref .* with 6 occurrences"):
+        replace_image(source, 0, green)
+
+    monkeypatch.undo()
+    assert _image_color(extract_images(source, tmp_path / "extracted")[6]) == (0, 255, 0)
+
+
 @pytest.mark.parametrize("callable_obj", [extract_images, replace_image])
 def test_image_helpers_validate_paths_and_replacements(tmp_path: Path, callable_obj) -> None:
     unsupported = tmp_path / "legacy.xls"
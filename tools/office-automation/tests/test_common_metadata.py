@@ -189,13 +189,13 @@ def test_clear_metadata_for_xlsm_uses_keep_vba_and_preserves_extension(
 ) -> None:
     source = _create_excel_workbook(tmp_path / "macro.xlsm")
     observed_keep_vba: list[bool | None] = []
-    original_load_workbook = metadata_module.load_workbook
+    original_load_workbook = load_workbook
 
     def recording_load_workbook(*args, **kwargs):
         observed_keep_vba.append(kwargs.get("keep_vba"))
         return original_load_workbook(*args, **kwargs)
 
-    monkeypatch.setattr(metadata_module, "load_workbook", recording_load_workbook)
+    monkeypatch.setattr(metadata_module, "load_workbook_callable", lambda purpose: recording_load_workbook)
 
     clear_metadata(source)
 
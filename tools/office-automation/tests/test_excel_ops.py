@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from datetime import datetime
 from pathlib import Path
+import re
+import zipfile
 
 import pytest
 from openpyxl import Workbook, load_workbook
 
-from office_automation.excel_ops import edit, read
+from office_automation.excel_ops import create_workbook, edit, iter_rows, read
 
 
 
@@ -29,6 +32,28 @@ def _build_workbook(path: Path) -> Path:
 
 
 
+def _build_stale_dimension_workbook(path: Path) -> Path:
+    """A 5x2 sheet whose stored ``<dimension>`` claims only ``A1``."""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Sheet"
+    for row_id in range(1, 6):
+        sheet.append([row_id, f"value-{row_id}"])
+    saved = path.with_suffix(".tmp.xlsx")
+    workbook.save(saved)
+    workbook.close()
+    with zipfile.ZipFile(saved) as source, zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as target:
+        for info in source.infolist():
+            payload = source.read(info)
+            if info.filename == "xl/worksheets/sheet1.xml":
+                payload, count = re.subn(rb'<dimension ref="[^"]*"', b'<dimension ref="A1"', payload)
+                assert count == 1
+            target.writestr(info, payload)
+    saved.unlink()
+    return path
+
+
+
 def test_read_returns_structured_workbook_summary_for_xlsx(tmp_path: Path) -> None:
     workbook_path = _build_workbook(tmp_path / "report.xlsx")
 
@@ -60,6 +85,101 @@ def test_read_returns_structured_workbook_summary_for_xlsx(tmp_path: Path) -> No
 
 
 
+def test_read_bounded_cells_window_matches_full_read_and_pages_rows(tmp_path: Path) -> None:
+    workbook_path = _build_workbook(tmp_path / "report.xlsx")
+    full = read(workbook_path)
+
+    selected = read(workbook_path, sheet="Sheet1")
+    assert selected["sheet_names"] == ["Sheet1", "Data"]
+    assert [sheet["name"] for sheet in selected["sheets"]] == ["Sheet1"]
+    assert selected["sheets"][0]["populated_cells"] == full["sheets"][0]["populated_cells"]
+    assert "merged_ranges" not in selected["sheets"][0]
+
+    first_page = read(workbook_path, sheet="Data", cell_range="A1:B2", row_limit=1)["sheets"][0]
+    assert first_page["populated_cells"] == [{"cell": "A1", "row": 1, "column": 1, "value": "name"}]
+    assert first_page["next_row_offset"] == 1
+    second_page = read(
+        workbook_path, sheet="Data", cell_range="A1:B2", row_offset=first_page["next_row_offset"], row_limit=1
+    )["sheets"][0]
+    assert [cell["cell"] for cell in second_page["populated_cells"]] == ["A2", "B2"]
+    assert second_page["next_row_offset"] is None
+
+    with pytest.raises(ValueError, match="missing sheet 'Nope'"):
+        read(workbook_path, sheet="Nope")
+    with pytest.raises(ValueError, match="invalid range"):
+        read(workbook_path, cell_range="not a range")
+    with pytest.raises(ValueError, match="'row_limit' must be >= 1"):
+        read(workbook_path, row_limit=0)
+
+
+
+def test_bounded_read_ignores_a_stale_dimension_tag(tmp_path: Path) -> None:
+    workbook_path = _build_stale_dimension_workbook(tmp_path / "stale.xlsx")
+    full_cells = read(workbook_path)["sheets"][0]["populated_cells"]
+    assert len(full_cells) == 10
+
+    selected = read(workbook_path, sheet="Sheet")["sheets"][0]
+    assert selected["populated_cells"] == full_cells
+    assert (selected["max_row"], selected["max_column"]) == (5, 2)
+    assert selected["next_row_offset"] is None
+
+    first_page = read(workbook_path, sheet="Sheet", row_limit=2)["sheets"][0]
+    assert [cell["cell"] for cell in first_page["populated_cells"]] == ["A1", "B1", "A2", "B2"]
+    assert first_page["next_row_offset"] == 2
+    last_page = read(workbook_path, sheet="Sheet", row_offset=4, row_limit=2)["sheets"][0]
+    assert [cell["cell"] for cell in last_page["populated_cells"]] == ["A5", "B5"]
+    assert last_page["next_row_offset"] is None
+
+
+
+def test_read_columnar_layout_returns_header_and_value_arrays(tmp_path: Path) -> None:
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Export"
+    sheet.append(["id", "name", "score"])
+    for row_id in range(1, 8):
+        sheet.append([row_id, f"user-{row_id}", None if row_id == 4 else row_id * 1.5])
+    workbook.save(tmp_path / "export.xlsx")
+    workbook.close()
+
+    result = read(tmp_path / "export.xlsx", layout="columns", cell_range="A1:C8", row_offset=2, row_limit=3)
+
+    export = result["sheets"][0]
+    assert export["header"] == ["id", "name", "score"]
+    assert export["column_letters"] == ["A", "B", "C"]
+    assert export["first_row"] == 4
+    assert export["columns"] == [[3, 4, 5], ["user-3", "user-4", "user-5"], [4.5, None, 7.5]]
+    assert export["next_row_offset"] == 5
+
+
+
+def test_iter_rows_streams_normalized_row_batches(tmp_path: Path) -> None:
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Export"
+    for row_id in range(1, 6):
+        sheet.append([row_id, datetime(2024, 1, row_id)])
+    workbook.create_sheet(title="Other")["B2"] = "other"
+    workbook.save(tmp_path / "export.xlsx")
+    workbook.close()
+
+    batches = list(iter_rows(tmp_path / "export.xlsx", batch_size=2))
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert batches[0] == [[1, "2024-01-01T00:00:00"], [2, "2024-01-02T00:00:00"]]
+
+    cell_batches = list(iter_rows(tmp_path / "export.xlsx", sheet="Other", values_only=False))
+    assert cell_batches == [[[], [{"cell": "B2", "row": 2, "column": 2, "value": "other"}]]]
+
+    stale_path = _build_stale_dimension_workbook(tmp_path / "stale.xlsx")
+    assert list(iter_rows(stale_path)) == [[[row_id, f"value-{row_id}"] for row_id in range(1, 6)]]
+
+    with pytest.raises(ValueError, match="missing sheet 'Nope'"):
+        iter_rows(tmp_path / "export.xlsx", sheet="Nope")
+    with pytest.raises(ValueError, match="'batch_size' must be >= 1"):
+        iter_rows(tmp_path / "export.xlsx", batch_size=0)
+
+
+
 def test_edit_applies_cell_and_sheet_operations_to_authoritative_output_path(tmp_path: Path) -> None:
     source = _build_workbook(tmp_path / "report.xlsx")
     output = tmp_path / "edited" / "report.xlsx"
@@ -101,6 +221,70 @@ def test_edit_applies_cell_and_sheet_operations_to_authoritative_output_path(tmp
 
 
 
+def test_edit_applies_bulk_set_range_and_append_rows(tmp_path: Path) -> None:
+    source = _build_workbook(tmp_path / "report.xlsx")
+    output = tmp_path / "bulk.xlsx"
+
+    edit(
+        source,
+        {
+            "output_path": str(output),
+            "operations": [
+                {"op": "set_range", "sheet": "Sheet1", "start_cell": "b3", "values": [[1, 2, 3], ["x", None]]},
+                {"op": "add_sheet", "name": "Generated"},
+                {"op": "append_rows", "sheet": "Generated", "rows": [["id", "value"], *([n, n * 2] for n in range(500))]},
+                {"op": "append_rows", "sheet": "Data", "rows": [["bob", "designer"]]},
+            ],
+        },
+    )
+
+    edited = load_workbook(output)
+    try:
+        sheet = edited["Sheet1"]
+        assert [[cell.value for cell in row] for row in sheet["B3:D4"]] == [[1, 2, 3], ["x", None, None]]
+        assert edited["Generated"].max_row == 501
+        assert [cell.value for cell in edited["Generated"][501]] == [499, 998]
+        assert [cell.value for cell in edited["Data"][3]] == ["bob", "designer"]
+    finally:
+        edited.close()
+
+    with pytest.raises(ValueError, match=r"#1 field 'values' row 2 column 3 is invalid: .*finite"):
+        edit(
+            source,
+            {
+                "output_path": str(tmp_path / "invalid.xlsx"),
+                "operations": [
+                    {"op": "set_range", "sheet": "Sheet1", "start_cell": "A1", "values": [[1], [2, 3, float("nan")]]}
+                ],
+            },
+        )
+    assert not (tmp_path / "invalid.xlsx").exists()
+
+
+
+def test_create_workbook_streams_generated_rows_with_the_write_only_writer(tmp_path: Path) -> None:
+    output = tmp_path / "generated" / "report.xlsx"
+
+    saved_path = create_workbook(
+        output,
+        {
+            "Summary": [["total", 3]],
+            "Rows": ([row_id, f"item-{row_id}", datetime(2024, 1, 1 + row_id % 28)] for row_id in range(2000)),
+        },
+    )
+
+    assert saved_path == output
+    result = read(output, sheet="Rows", layout="columns", row_offset=1998)
+    assert result["sheet_names"] == ["Summary", "Rows"]
+    assert result["sheets"][0]["columns"][1] == ["item-1999"]
+    with pytest.raises(FileExistsError):
+        create_workbook(output, {"Summary": []})
+    with pytest.raises(TypeError, match="sheet 'Bad' row 1 column 1 is invalid"):
+        create_workbook(tmp_path / "bad.xlsx", {"Bad": [[object()]]})
+    assert not (tmp_path / "bad.xlsx").exists()
+
+
+
 def test_edit_preserves_original_by_copying_before_edit(tmp_path: Path) -> None:
     source = _build_workbook(tmp_path / "original.xlsx")
     output = tmp_path / "copies" / "custom-name.xlsx"
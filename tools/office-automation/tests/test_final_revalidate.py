@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from io import BytesIO
+from pathlib import Path
+import random
+import sys
+import zipfile
+
+from pptx import Presentation
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.util import Inches
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+WRAPPER_SCRIPTS = REPO_ROOT / ".codex" / "skills" / "office-anonymizer" / "scripts"
+if str(WRAPPER_SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(WRAPPER_SCRIPTS))
+
+import final_revalidate
+
+
+def _naive_leaks(text: str, originals: list[str], replacements: list[str]) -> set[str]:
+    covered = [
+        (start, start + len(replacement))
+        for replacement in replacements
+        for start in range(len(text))
+        if text.startswith(replacement, start)
+    ]
+    return {
+        original
+        for original in originals
+        for start in range(len(text))
+        if text.startswith(original, start)
+        and not any(r_start <= start and start + len(original) <= r_end for r_start, r_end in covered)
+    }
+
+
+def test_needle_automaton_matches_a_naive_scan_with_replacement_exclusion() -> None:
+    rng = random.Random(1234)
+    for _ in range(300):
+        originals = ["".join(rng.choice("abc") for _ in range(rng.randint(1, 4))) for _ in range(rng.randint(1, 5))]
+        replacements = ["".join(rng.choice("abcx") for _ in range(rng.randint(1, 5))) for _ in range(rng.randint(0, 3))]
+        text = "".join(rng.choice("abcxy") for _ in range(rng.randint(0, 30)))
+        automaton = final_revalidate._NeedleAutomaton(originals, replacements)
+        assert set(automaton.leaks(text)) == _naive_leaks(text, originals, replacements)
+
+    automaton = final_revalidate._NeedleAutomaton(["役員", "平本"], ["A役員"])
+    assert automaton.leaks("A役員が出席") == []
+    assert automaton.leaks("A役員と役員、平本") == ["役員", "平本"]
+
+
+def test_revalidate_pptx_scans_groups_tables_notes_masters_and_metadata_in_one_pass(tmp_path: Path) -> None:
+    presentation = Presentation()
+    presentation.core_properties.author = "平本"
+    layout = presentation.slide_layouts[6]
+    footer = next(
+        (shape for shape in presentation.slide_master.placeholders if shape.placeholder_format.type == PP_PLACEHOLDER.FOOTER),
+        None,
+    )
+    assert footer is not None
+    footer.text_frame.text = "社外秘 平本"
+    slide = presentation.slides.add_slide(layout)
+    group = slide.shapes.add_group_shape()
+    nested = group.shapes.add_group_shape()
+    nested.shapes.add_textbox(Inches(1), Inches(1), Inches(2), Inches(1)).text_frame.text = "担当: 北畠"
+    table = slide.shapes.add_table(1, 2, Inches(1), Inches(3), Inches(4), Inches(1)).table
+    table.cell(0, 1).text = "A役員 / 役員会"
+    second = presentation.slides.add_slide(layout)
+    second.shapes.add_textbox(Inches(1), Inches(1), Inches(2), Inches(1)).text_frame.text = "A役員"
+    second.notes_slide.notes_text_frame.text = "北畠さんに確認"
+    pptx_path = tmp_path / "deck.pptx"
+    presentation.save(pptx_path)
+
+    hits = final_revalidate.revalidate_pptx(
+        pptx_path=pptx_path,
+        approved_originals=["北畠", "平本", "役員"],
+        approved_replacements=["A役員", "B"],
+    )
+
+    summary = [(hit.location, hit.slide_number, hit.original) for hit in hits]
+    assert summary == [
+        ("slide_body", 1, "北畠"),
+        ("slide_body", 1, "役員"),
+        ("notes", 2, "北畠"),
+        ("footers", 0, "平本"),
+        ("metadata", 0, "平本"),
+    ]
+    body_paths = [hit.shape_path for hit in hits if hit.location == "slide_body"]
+    assert body_paths[0].startswith("g0/")
+    assert body_paths[1].endswith("/r0c1")
+    assert hits[3].shape_path.startswith("ppt/slideMasters/slideMaster1.xml:")
+    assert hits[4].shape_path == "docProps/core.xml"
+
+
+def test_revalidate_pptx_scans_chart_and_smartart_parts(tmp_path: Path) -> None:
+    presentation = Presentation()
+    presentation.slides.add_slide(presentation.slide_layouts[6])
+    slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+    chart_data = CategoryChartData()
+    chart_data.categories = ["平本チーム", "B"]
+    chart_data.add_series("売上", (1, 2))
+    chart = slide.shapes.add_chart(
+        XL_CHART_TYPE.COLUMN_CLUSTERED, Inches(1), Inches(1), Inches(4), Inches(3), chart_data
+    ).chart
+    chart.has_title = True
+    chart.chart_title.text_frame.text = "A役員の実績"
+    pptx_path = tmp_path / "deck.pptx"
+    presentation.save(pptx_path)
+    with zipfile.ZipFile(pptx_path, "a") as package:
+        package.writestr(
+            "ppt/diagrams/data1.xml",
+            '<dgm:dataModel xmlns:dgm="http://schemas.openxmlformats.org/drawingml/2006/diagram" '
+            'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"><dgm:ptLst><dgm:pt modelId="1">'
+            "<dgm:t><a:p><a:r><a:t>北畠</a:t></a:r></a:p></dgm:t></dgm:pt></dgm:ptLst></dgm:dataModel>",
+        )
+
+    hits = final_revalidate.revalidate_pptx(
+        pptx_path=pptx_path,
+        approved_originals=["北畠", "平本", "役員"],
+        approved_replacements=["A役員"],
+    )
+
+    assert [(hit.location, hit.slide_number, hit.shape_path, hit.original) for hit in hits] == [
+        ("charts", 2, "ppt/charts/chart1.xml", "平本"),
+        ("diagrams", 0, "ppt/diagrams/data1.xml", "北畠"),
+    ]
+
+
+def test_raw_fragments_keep_a_mixed_content_tail_that_crosses_a_read_chunk() -> None:
+    tail = "y" * 65536 + "平本"
+    xml = f"<a><b>x</b>{tail}<c/>after</a>".encode("utf-8")
+
+    fragments = list(final_revalidate._iter_raw_fragments(BytesIO(xml)))
+
+    assert fragments == ["x", tail, "after"]
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+from io import BytesIO
+from pathlib import Path
+import sys
+
+from PIL import Image
+import pptx
+from pptx import Presentation
+from pptx.util import Inches
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+WRAPPER_SCRIPTS = REPO_ROOT / ".codex" / "skills" / "office-anonymizer" / "scripts"
+if str(WRAPPER_SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(WRAPPER_SCRIPTS))
+
+import cache_utils
+import image_codex_anonymize
+
+
+_STUB_CODEX = """#!{python}
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+args = sys.argv[1:]
+image_path = Path(args[args.index("-i") + 1])
+prompt = sys.stdin.read()
+output_path = Path(prompt.rsplit("output=", 1)[1].strip())
+
+barrier = Path(os.environ["STUB_CODEX_BARRIER"])
+(barrier / image_path.name).touch()
+deadline = time.monotonic() + 10
+while len(list(barrier.iterdir())) < int(os.environ["STUB_CODEX_EXPECTED"]):
+    if time.monotonic() > deadline:
+        sys.exit(3)
+    time.sleep(0.02)
+
+if image_path.name.startswith("img-01"):
+    shutil.copyfile(os.environ["STUB_CODEX_REPLACEMENT"], output_path)
+    print("findings=1")
+else:
+    shutil.copyfile(image_path, output_path)
+    print("findings=0")
+"""
+
+
+def _png_bytes(color: tuple[int, int, int]) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (16, 16), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _create_pptx_with_pictures(path: Path, colors: list[tuple[int, int, int]]) -> Path:
+    presentation = Presentation()
+    for color in colors:
+        slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+        slide.shapes.add_picture(BytesIO(_png_bytes(color)), Inches(1), Inches(1))
+    presentation.save(path)
+    return path
+
+
+def _install_stub_codex(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, *, expected: int) -> tuple[Path, Path]:
+    stub = tmp_path / "bin" / "codex"
+    stub.parent.mkdir()
+    stub.write_text(_STUB_CODEX.format(python=sys.executable), encoding="utf-8")
+    stub.chmod(0o700)
+    barrier = tmp_path / "barrier"
+    barrier.mkdir()
+    replacement = tmp_path / "replacement.png"
+    replacement.write_bytes(_png_bytes((0, 0, 0)))
+    monkeypatch.setenv("STUB_CODEX_BARRIER", str(barrier))
+    monkeypatch.setenv("STUB_CODEX_EXPECTED", str(expected))
+    monkeypatch.setenv("STUB_CODEX_REPLACEMENT", str(replacement))
+    return stub, barrier
+
+
+def test_anonymize_pptx_images_runs_codex_concurrently_with_deterministic_log(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pptx_path = _create_pptx_with_pictures(tmp_path / "deck.pptx", [(255, 0, 0), (0, 255, 0), (0, 0, 255)])
+    stub, _ = _install_stub_codex(tmp_path, monkeypatch, expected=3)
+    work_dir = tmp_path / "work"
+
+    outcomes = image_codex_anonymize.anonymize_pptx_images(
+        pptx_path=pptx_path,
+        approved_mapping={"Jane Example": "Person A"},
+        work_dir=work_dir,
+        retries=0,
+        timeout_sec=30,
+        max_concurrency=3,
+        codex_command=str(stub),
+    )
+
+    assert [(outcome.image_id, outcome.status) for outcome in outcomes] == [
+        ("img-01", "replaced"),
+        ("img-02", "unchanged"),
+        ("img-03", "unchanged"),
+    ]
+    log_text = (work_dir / "image_codex_log.md").read_text(encoding="utf-8")
+    log_lines = [line for line in log_text.splitlines() if line.startswith("- ")]
+    assert [line.split(" | ")[0] for line in log_lines] == ["- img-01", "- img-02", "- img-03"]
+
+    reopened = Presentation(str(pptx_path))
+    blobs = [next(iter(slide.shapes)).image.blob for slide in reopened.slides]
+    assert blobs[0] == _png_bytes((0, 0, 0))
+    assert blobs[1] == _png_bytes((0, 255, 0))
+
+
+def test_anonymize_pptx_images_enforces_budget_before_starting_codex(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pptx_path = _create_pptx_with_pictures(tmp_path / "deck.pptx", [(255, 0, 0), (0, 255, 0), (0, 0, 255)])
+    stub, barrier = _install_stub_codex(tmp_path, monkeypatch, expected=1)
+
+    with pytest.raises(image_codex_anonymize.CodexBudgetExceeded):
+        image_codex_anonymize.anonymize_pptx_images(
+            pptx_path=pptx_path,
+            approved_mapping={"Jane Example": "Person A"},
+            work_dir=tmp_path / "work",
+            max_images=2,
+            codex_command=str(stub),
+        )
+
+    assert list(barrier.iterdir()) == []
+
+
+def test_anonymize_folder_images_runs_codex_once_per_unique_image_across_decks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    decks = [
+        _create_pptx_with_pictures(tmp_path / "a.pptx", [(255, 0, 0), (0, 255, 0)]),
+        _create_pptx_with_pictures(tmp_path / "b.pptx", [(0, 255, 0), (255, 0, 0)]),
+        _create_pptx_with_pictures(tmp_path / "c.pptx", [(0, 0, 255)]),
+    ]
+    stub, barrier = _install_stub_codex(tmp_path, monkeypatch, expected=3)
+
+    with pytest.raises(image_codex_anonymize.CodexBudgetExceeded, match=r"3 unique pictures"):
+        image_codex_anonymize.anonymize_folder_images(
+            pptx_paths=decks,
+            approved_mapping={"Jane Example": "Person A"},
+            work_dir=tmp_path / "work-budget",
+            max_images=2,
+            codex_command=str(stub),
+        )
+    assert list(barrier.iterdir()) == []
+
+    # Planning reads picture inventories from the zip; only decks that gain a
+    # replaced image are loaded, one at a time.
+    loaded: list[str] = []
+    original_presentation = pptx.Presentation
+
+    def counting_presentation(path):
+        loaded.append(Path(path).name)
+        return original_presentation(path)
+
+    monkeypatch.setattr(pptx, "Presentation", counting_presentation)
+    results = image_codex_anonymize.anonymize_folder_images(
+        pptx_paths=decks,
+        approved_mapping={"Jane Example": "Person A"},
+        work_dir=tmp_path / "work",
+        retries=0,
+        max_images=3,
+        max_concurrency=3,
+        codex_command=str(stub),
+    )
+
+    assert len(list(barrier.iterdir())) == 3
+    assert {
+        Path(deck).name: [(outcome.image_id, outcome.status, outcome.slides_affected) for outcome in outcomes]
+        for deck, outcomes in results.items()
+    } == {
+        "a.pptx": [("img-01", "replaced", [1]), ("img-02", "unchanged", [2])],
+        "b.pptx": [("img-01", "replaced", [2]), ("img-02", "unchanged", [1])],
+        "c.pptx": [("img-03", "unchanged", [1])],
+    }
+    red_slides = {"a.pptx": 0, "b.pptx": 1}
+    for deck in decks[:2]:
+        reopened = Presentation(str(deck))
+        shape = next(iter(reopened.slides[red_slides[deck.name]].shapes))
+        assert shape.image.blob == _png_bytes((0, 0, 0))
+    assert loaded == ["a.pptx", "b.pptx"]
+    log_text = (tmp_path / "work" / "image_codex_log.md").read_text(encoding="utf-8")
+    assert "decks=a.pptx:1;b.pptx:2" in log_text
+
+
+def test_anonymize_pptx_images_replays_cached_outcomes_without_codex(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    stub, _ = _install_stub_codex(tmp_path, monkeypatch, expected=2)
+    cache_dir = cache_utils.ensure_keyed_cache()
+    mapping = {"Jane Example": "Person A"}
+    first_deck = _create_pptx_with_pictures(tmp_path / "first.pptx", [(255, 0, 0), (0, 255, 0)])
+
+    image_codex_anonymize.anonymize_pptx_images(
+        pptx_path=first_deck,
+        approved_mapping=mapping,
+        work_dir=tmp_path / "work-first",
+        retries=0,
+        max_concurrency=2,
+        codex_command=str(stub),
+        result_cache_dir=cache_dir,
+    )
+
+    assert (cache_dir.stat().st_mode & 0o777) == 0o700
+    assert sorted(path.suffix for path in cache_dir.iterdir()) == [".bin", ".json", ".json"]
+    assert all((path.stat().st_mode & 0o777) == 0o600 for path in cache_dir.iterdir())
+
+    second_deck = _create_pptx_with_pictures(tmp_path / "second.pptx", [(255, 0, 0), (0, 255, 0)])
+    outcomes = image_codex_anonymize.anonymize_pptx_images(
+        pptx_path=second_deck,
+        approved_mapping=mapping,
+        work_dir=tmp_path / "work-second",
+        retries=0,
+        codex_command=str(tmp_path / "missing-codex"),
+        result_cache_dir=cache_dir,
+    )
+
+    assert [(outcome.status, outcome.notes.startswith("cache hit")) for outcome in outcomes] == [
+        ("replaced", True),
+        ("unchanged", True),
+    ]
+    reopened = Presentation(str(second_deck))
+    assert next(iter(reopened.slides[0].shapes)).image.blob == _png_bytes((0, 0, 0))
+
+    with pytest.raises(FileNotFoundError):
+        image_codex_anonymize.anonymize_pptx_images(
+            pptx_path=second_deck,
+            approved_mapping={"Jane Example": "Person B"},
+            work_dir=tmp_path / "work-third",
+            retries=0,
+            codex_command=str(tmp_path / "missing-codex"),
+            result_cache_dir=cache_dir,
+        )
+
+
+def test_janitor_sweep_prunes_expired_keyed_cache_entries(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    cache_dir = cache_utils.ensure_keyed_cache()
+    cache_utils.write_cache_entry(cache_dir, "aa" * 32, {"status": "replaced"}, b"png", days=-1)
+    cache_utils.write_cache_entry(cache_dir, "bb" * 32, {"status": "unchanged"})
+
+    removed = cache_utils.janitor_sweep()
+
+    assert sorted(path.name for path in removed) == [f"{'aa' * 32}.bin", f"{'aa' * 32}.json"]
+    assert cache_dir.is_dir()
+    assert cache_utils.read_cache_entry(cache_dir, "aa" * 32) is None
+    assert cache_utils.read_cache_entry(cache_dir, "bb" * 32)[0]["status"] == "unchanged"
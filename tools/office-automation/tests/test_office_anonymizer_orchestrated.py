@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+from pptx import Presentation
+from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.util import Inches
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+WRAPPER_SCRIPTS = REPO_ROOT / ".codex" / "skills" / "office-anonymizer" / "scripts"
+if str(WRAPPER_SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(WRAPPER_SCRIPTS))
+
+import office_anonymizer_wrapper as wrapper
+import post_pass
+
+
+def _create_deck(path: Path, *, master_footer: str | None = None) -> Path:
+    presentation = Presentation()
+    if master_footer is not None:
+        footer = next(
+            shape
+            for shape in presentation.slide_master.placeholders
+            if shape.placeholder_format.type == PP_PLACEHOLDER.FOOTER
+        )
+        footer.text_frame.text = master_footer
+    slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+    slide.shapes.add_textbox(Inches(1), Inches(1), Inches(3), Inches(1)).text_frame.text = "担当 平本役員"
+    presentation.save(path)
+    return path
+
+
+def _slide_texts(path: Path) -> list[str]:
+    return [shape.text_frame.text for shape in Presentation(str(path)).slides[0].shapes]
+
+
+@pytest.mark.parametrize(
+    ("master_footer", "status_label", "expected_text"),
+    [
+        (None, "completed", "担当 A役員"),
+        ("社外秘 平本", "unresolved_leaks", "担当 A役員役員"),
+    ],
+)
+def test_run_orchestrated_revalidates_post_pass_output_before_writing_it(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    master_footer: str | None,
+    status_label: str,
+    expected_text: str,
+) -> None:
+    monkeypatch.setenv("OFFICE_ANONYMIZER_SKIP_SYNC_CHECK", "1")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    folder = tmp_path / "decks"
+    folder.mkdir()
+    deck = _create_deck(folder / "deck.pptx", master_footer=master_footer)
+
+    result = wrapper.run_orchestrated(target_folder=folder, approved_mapping={"平本": "A役員"})
+
+    assert result["status_label"] == status_label
+    # SG5 writes "A役員役員"; only a deck that passed in-memory revalidation gets
+    # the post_pass role-suffix dedupe written back.
+    assert _slide_texts(deck) == [expected_text]
+    if master_footer is not None:
+        assert result["leaks"][0]["file"] == "deck.pptx"
+        assert (Path(result["run_dir"]) / "backups" / "deck.pptx.pre-postpass.bak").is_file()
+    assert not list(folder.glob(".deck.pptx.*"))
+
+
+def test_run_orchestrated_writes_each_deck_before_loading_the_next(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("OFFICE_ANONYMIZER_SKIP_SYNC_CHECK", "1")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    folder = tmp_path / "decks"
+    folder.mkdir()
+    decks = [_create_deck(folder / name) for name in ("a.pptx", "b.pptx")]
+    events: list[tuple[str, str]] = []
+    original_post_pass = post_pass.run_post_pass
+    original_write = wrapper._write_bytes_atomically
+
+    def recording_post_pass(**kwargs):
+        events.append(("post_pass", kwargs["pptx_path"].name))
+        return original_post_pass(**kwargs)
+
+    def recording_write(path, payload):
+        events.append(("write", Path(path).name))
+        original_write(path, payload)
+
+    monkeypatch.setattr(post_pass, "run_post_pass", recording_post_pass)
+    monkeypatch.setattr(wrapper, "_write_bytes_atomically", recording_write)
+
+    result = wrapper.run_orchestrated(target_folder=folder, approved_mapping={"平本": "A役員"})
+
+    assert result["status_label"] == "completed"
+    assert events == [
+        ("post_pass", "a.pptx"),
+        ("write", "a.pptx"),
+        ("post_pass", "b.pptx"),
+        ("write", "b.pptx"),
+    ]
+    assert [_slide_texts(deck) for deck in decks] == [["担当 A役員"], ["担当 A役員"]]
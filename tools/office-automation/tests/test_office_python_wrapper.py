@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+from docx import Document
+import pytest
+
+from office_automation import word_ops
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+WRAPPER_SCRIPTS = REPO_ROOT / ".codex" / "skills" / "office-python" / "scripts"
+if str(WRAPPER_SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(WRAPPER_SCRIPTS))
+
+import office_python_wrapper
+
+
+def _create_docx(path: Path, text: str) -> Path:
+    document = Document()
+    document.add_paragraph(text)
+    document.save(path)
+    return path
+
+
+def _edit_request(path: Path, text: str) -> dict:
+    return {
+        "file_path": str(path),
+        "mode": "edit",
+        "instructions": {
+            "operations": [{"operation": "replace_paragraph_text", "paragraph_index": 0, "text": text}],
+        },
+    }
+
+
+def _paragraph_text(result: dict) -> str:
+    return result["data"]["paragraphs"][0]["text"]
+
+
+def test_run_batch_returns_run_request_results_in_request_order(tmp_path: Path) -> None:
+    first = _create_docx(tmp_path / "first.docx", "First")
+    second = _create_docx(tmp_path / "second.docx", "Second")
+    requests = [
+        {"file_path": str(first), "mode": "read"},
+        _edit_request(second, "Second updated"),
+        {"file_path": str(tmp_path / "legacy.doc"), "mode": "read"},
+        {"file_path": str(tmp_path / "second-edited.docx"), "mode": "read"},
+        {"file_path": str(first), "mode": "read"},
+        "not a mapping",
+    ]
+
+    results = office_python_wrapper.run_batch(requests, max_workers=2)
+
+    assert [result["status"] for result in results] == [0, 2, 3, 0, 0, 3]
+    assert results[0] == results[4] == office_python_wrapper.run_request(requests[0])
+    assert results[0] is not results[4]
+    assert Path(results[1]["output_path"]) == tmp_path / "second-edited.docx"
+    assert _paragraph_text(results[3]) == "Second updated"
+    assert results[5]["error"]["type"] == "TypeError"
+
+
+def test_run_batch_reuses_reads_until_the_group_edits_the_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = _create_docx(tmp_path / "sample.docx", "Original")
+    read_calls: list[Path] = []
+    original_read = word_ops.read
+
+    def counting_read(file_path, **kwargs):
+        read_calls.append(Path(file_path))
+        return original_read(file_path, **kwargs)
+
+    monkeypatch.setattr(word_ops, "read", counting_read)
+    in_place_edit = _edit_request(source, "Rewritten")
+    in_place_edit.update(output_path=str(source), copy_before_edit=False)
+    requests = [
+        {"file_path": str(source), "mode": "read"},
+        {"file_path": str(source), "mode": "read"},
+        in_place_edit,
+        {"file_path": str(source), "mode": "read"},
+    ]
+
+    results = office_python_wrapper.run_batch(requests)
+
+    assert [result["status"] for result in results] == [0, 0, 2, 0]
+    assert [_paragraph_text(results[index]) for index in (0, 1, 3)] == ["Original", "Original", "Rewritten"]
+    assert len(read_calls) == 2
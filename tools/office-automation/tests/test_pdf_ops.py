@@ -180,6 +180,64 @@ def test_edit_rebuild_text_pdf_creates_readable_text_oriented_output(tmp_path: P
     assert "Second page note" in rebuilt["pages"][1]["text"]
 
 
+def test_edit_rebuild_text_pdf_only_reads_the_source_for_missing_page_data(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = _create_text_pdf(tmp_path / "sample.pdf")
+    output_path = tmp_path / "rebuilt.pdf"
+
+    def fail_extraction(*args, **kwargs):
+        raise AssertionError("text extraction should not run when page text is supplied")
+
+    monkeypatch.setattr(pdf_ops, "read", fail_extraction)
+    monkeypatch.setattr(pdf_ops, "_load_pdfplumber", fail_extraction)
+
+    with pytest.warns(RuntimeWarning, match="text-oriented PDF"):
+        pdf_ops.edit(
+            source,
+            {
+                "operations": [
+                    {
+                        "type": "rebuild_text_pdf",
+                        "pages": [
+                            {"text": "Custom sized page", "width": 300, "height": 400},
+                            "Second page keeps the source size",
+                            "Third page falls back to letter",
+                        ],
+                    }
+                ],
+                "output_path": str(output_path),
+                "copy_before_edit": True,
+                "options": {},
+            },
+        )
+
+    document = fitz.open(output_path)
+    try:
+        assert [(page.rect.width, page.rect.height) for page in document] == [
+            (300, 400),
+            (letter[0], letter[1]),
+            (612, 792),
+        ]
+        assert "Second page keeps the source size" in document[1].get_text()
+    finally:
+        document.close()
+
+
+def test_wrap_text_accumulates_widths_and_splits_long_tokens() -> None:
+    from reportlab.pdfbase import pdfmetrics
+
+    measurer = pdf_ops._TextMeasurer(font_name="Helvetica", font_size=11, pdfmetrics=pdfmetrics)
+    text = " ".join(["lorem", "ipsum", "dolor", "x" * 120, "sit", "amet"] * 50)
+
+    lines = pdf_ops._wrap_text(text, max_width=200, measurer=measurer)
+
+    assert all(pdfmetrics.stringWidth(line, "Helvetica", 11) <= 200 for line in lines)
+    assert "".join(lines).replace(" ", "") == text.replace(" ", "")
+    assert any(set(line) == {"x"} for line in lines)  # the 120-character token was split
+    assert "lorem ipsum dolor" in lines
+
+
 @pytest.mark.parametrize("output_path", [None, "   "])
 def test_edit_requires_explicit_non_empty_output_path(tmp_path: Path, output_path: str | None) -> None:
     source = _create_text_pdf(tmp_path / "sample.pdf")
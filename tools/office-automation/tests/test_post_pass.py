@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+from pptx import Presentation
+from pptx.util import Inches
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+WRAPPER_SCRIPTS = REPO_ROOT / ".codex" / "skills" / "office-anonymizer" / "scripts"
+if str(WRAPPER_SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(WRAPPER_SCRIPTS))
+
+import post_pass
+
+
+def _manual_review_result(pptx_path: Path, items: list[tuple[int, str, int, int, int]]) -> dict:
+    return {
+        "extension": "pptx",
+        "file_path": str(pptx_path),
+        "body_text_candidates": [
+            {
+                "candidate_id": "btc::1",
+                "excerpt_samples": [{"finding_id": f"f{idx}"} for idx in range(len(items))],
+            }
+        ],
+        "manual_review_items": [
+            {
+                "finding_id": f"f{idx}",
+                "category": "body_text",
+                "location": {
+                    "slide_number": slide_number,
+                    "shape_id": shape_id,
+                    "paragraph_index": paragraph_index,
+                    "match_start": match_start,
+                    "match_end": match_end,
+                },
+            }
+            for idx, (slide_number, shape_id, paragraph_index, match_start, match_end) in enumerate(items)
+        ],
+    }
+
+
+def test_run_post_pass_applies_indexed_targets_and_cleanups_in_one_walk(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    presentation = Presentation()
+    slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+    body = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1))
+    body.text_frame.text = "平本と平本"
+    body.text_frame.add_paragraph().text = "RETA役員役員"
+    group = slide.shapes.add_group_shape()
+    member = group.shapes.add_textbox(Inches(1), Inches(2), Inches(4), Inches(1))
+    member.text_frame.text = "担当: 平本"
+    table_shape = slide.shapes.add_table(1, 2, Inches(1), Inches(3), Inches(4), Inches(1))
+    table_shape.table.cell(0, 0).text = "平本様"
+    table_shape.table.cell(0, 1).text = "北畠"
+    pptx_path = tmp_path / "deck.pptx"
+    presentation.save(pptx_path)
+
+    loaded = Presentation(str(pptx_path))
+    summary = post_pass.run_post_pass(
+        pptx_path=pptx_path,
+        sg5_transform_results=[
+            _manual_review_result(
+                pptx_path,
+                [
+                    (1, str(body.shape_id), 0, 0, 2),
+                    (1, str(body.shape_id), 0, 3, 5),
+                    (1, str(member.shape_id), 0, 4, 6),
+                    (1, str(table_shape.shape_id), 0, 0, 2),
+                    (2, str(body.shape_id), 0, 0, 2),
+                ],
+            )
+        ],
+        replacement_overrides={"btc::1": "A役員"},
+        approved_replacements=["A役員"],
+        backup_dir=tmp_path / "backups",
+        presentation=loaded,
+    )
+
+    assert summary["targeted_replacements"] == 4
+    assert summary["role_suffix_dedupes"] == 1
+    assert summary["concatenation_spacings"] == 1
+    assert (tmp_path / "backups" / "deck.pptx.pre-postpass.bak").is_file()
+    # In-memory mode leaves the file on disk untouched.
+    assert Presentation(str(pptx_path)).slides[0].shapes[0].text_frame.paragraphs[0].text == "平本と平本"
+
+    shapes = loaded.slides[0].shapes
+    assert [p.text for p in shapes[0].text_frame.paragraphs] == ["A役員とA役員", "RET A役員"]
+    assert shapes[1].shapes[0].text_frame.text == "担当: A役員"
+    # Table targets keep the historical per-cell paragraph semantics.
+    assert [shapes[2].table.cell(0, col).text for col in range(2)] == ["A役員様", "A役員"]
@@ -7,6 +7,7 @@ import pytest
 from pptx import Presentation
 from pptx.util import Inches
 
+from office_automation import powerpoint_ops
 from office_automation.powerpoint_ops import edit, read
 
 
@@ -254,6 +255,86 @@ def test_read_and_edit_surface_animation_warnings(tmp_path: Path) -> None:
     assert read(result)["slides"][0]["title_text"] == "Animated But Editable"
 
 
+def test_feature_profile_is_scanned_once_per_file_state(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    source = tmp_path / "quarterly-update.pptx"
+    _create_sample_presentation(source)
+    _inject_animation_timing(source)
+    with ZipFile(source, "a") as archive:
+        archive.writestr(
+            "ppt/slides/_rels/slide2.xml.rels",
+            (
+                '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                '<Relationship Id="rId9" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+                'relationships/diagramData" Target="../diagrams/data1.xml"/></Relationships>'
+            ),
+        )
+
+    scanned_slides: list[str] = []
+    original_find = powerpoint_ops._stream_find_markers
+
+    def recording_find(stream, markers):
+        scanned_slides.append(stream.name)
+        return original_find(stream, markers)
+
+    monkeypatch.setattr(powerpoint_ops, "_stream_find_markers", recording_find)
+
+    expected = [
+        "Slide 1 contains animation timing data; advanced animation rewriting is unsupported in V1.",
+        "Slide 2 has SmartArt/diagram relationships; SmartArt-specific editing is unsupported in V1.",
+    ]
+    assert read(source)["warnings"] == expected
+    with pytest.warns(UserWarning) as caught:
+        edit(
+            source,
+            {
+                "operations": [{"type": "replace_title_text", "slide_index": 0, "new_text": "Edited"}],
+                "output_path": tmp_path / "edited.pptx",
+            },
+        )
+    assert [str(warning.message) for warning in caught] == expected
+    assert read(source)["warnings"] == expected
+    assert scanned_slides == ["ppt/slides/slide1.xml"]
+
+    _inject_animation_timing(source)  # rewrites the archive, so the profile is rebuilt
+    read(source)
+    assert scanned_slides == ["ppt/slides/slide1.xml", "ppt/slides/slide1.xml"]
+
+
+def test_read_selects_slides_and_projects_fields(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    source = tmp_path / "deck.pptx"
+    _create_sample_presentation(source)
+    presentation = Presentation(str(source))
+    for number in range(2, 6):
+        slide = presentation.slides.add_slide(presentation.slide_layouts[5])
+        slide.shapes.title.text = f"Slide {number}"
+    presentation.save(source)
+
+    serialized: list[int] = []
+    original_serialize = powerpoint_ops._serialize_slide
+
+    def recording_serialize(slide, slide_index, *, fields):
+        serialized.append(slide_index)
+        return original_serialize(slide, slide_index, fields=fields)
+
+    monkeypatch.setattr(powerpoint_ops, "_serialize_slide", recording_serialize)
+
+    result = read(source, slides=[4, 1], fields=["title_text", "tables"])
+
+    assert result["slide_count"] == 5
+    assert serialized == [0, 3]
+    assert [slide["slide_number"] for slide in result["slides"]] == [1, 4]
+    assert result["slides"][1] == {"slide_index": 3, "slide_number": 4, "title_text": "Slide 4", "tables": [], "warnings": []}
+    table = result["slides"][0]["tables"][0]
+    assert table["rows"] == [["Metric", "Value"], ["Revenue", "100"]]
+    assert "cells" not in table
+    assert "text_shapes" not in result["slides"][0]
+
+    with pytest.raises(ValueError, match="references slide 6"):
+        read(source, slides=[6])
+    with pytest.raises(ValueError, match="unknown field"):
+        read(source, fields=["notes"])
+
+
 def _create_sample_presentation(path: Path) -> None:
     presentation = Presentation()
     slide = presentation.slides.add_slide(presentation.slide_layouts[5])
@@ -63,6 +63,34 @@ def test_read_returns_ordered_body_paragraph_and_table_data(tmp_path: Path) -> N
 
 
 
+def test_read_selects_body_windows_and_projects_fields(tmp_path: Path) -> None:
+    document = Document()
+    for index in range(6):
+        document.add_paragraph(f"Paragraph {index}")
+        if index == 2:
+            document.add_table(rows=1, cols=2).cell(0, 0).text = "Cell"
+    document.save(tmp_path / "long.docx")
+
+    window = word_ops.read(tmp_path / "long.docx", paragraph_range=(2, 4), fields=["paragraphs"])
+    assert set(window) == {"format", "file_path", "paragraphs", "warnings"}
+    assert [(item["paragraph_index"], item["body_index"], item["text"]) for item in window["paragraphs"]] == [
+        (2, 2, "Paragraph 2"),
+        (3, 4, "Paragraph 3"),
+    ]
+
+    body_window = word_ops.read(tmp_path / "long.docx", body_range=(3, 5), fields=["tables", "body"])
+    assert [item["type"] for item in body_window["body"]] == ["table", "paragraph"]
+    assert body_window["body"][1]["paragraph_index"] == 3
+    assert body_window["tables"][0]["table_index"] == 0
+    assert body_window["tables"][0]["rows"][0]["cells"][0]["text"] == "Cell"
+
+    with pytest.raises(ValueError, match="at most one"):
+        word_ops.read(tmp_path / "long.docx", body_range=(0, 1), paragraph_range=(0, 1))
+    with pytest.raises(ValueError, match="unknown field"):
+        word_ops.read(tmp_path / "long.docx", fields=["images"])
+
+
+
 def test_read_surfaces_text_box_warnings_when_markup_is_present(tmp_path: Path) -> None:
     source = _create_sample_docx(tmp_path / "sample.docx")
 
@@ -85,6 +113,55 @@ def test_read_surfaces_text_box_warnings_when_markup_is_present(tmp_path: Path)
 
 
 
+def test_feature_warning_scan_streams_candidate_parts_and_memoizes_per_file_state(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = _create_sample_docx(tmp_path / "sample.docx")
+    with zipfile.ZipFile(source, mode="a") as archive:
+        archive.writestr(
+            "word/revisions.xml",
+            (
+                '<r:root xmlns:r="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+                + "<r:p/>" * 200_000
+                + "<!-- <r:txbxContent> only in a comment --><r:ins r:id=\"1\"/></r:root>"
+            ),
+        )
+
+    parsed_members: list[str] = []
+    original_scan = word_ops._scan_member_feature_tags
+
+    def recording_scan(archive, member_name, *, skip):
+        parsed_members.append(member_name)
+        return original_scan(archive, member_name, skip=skip)
+
+    monkeypatch.setattr(word_ops, "_scan_member_feature_tags", recording_scan)
+
+    track_change_warning = (
+        "This document contains Word revision/track-change markup. SG2 Word V1 does "
+        "not accept or reject track changes."
+    )
+    assert word_ops.read(source)["warnings"] == [track_change_warning]
+    # Only the part whose bytes mention a feature tag is parsed.
+    assert parsed_members == ["word/revisions.xml"]
+
+    with pytest.warns(RuntimeWarning) as caught:
+        word_ops.edit(
+            source,
+            {
+                "operations": [{"operation": "replace_paragraph_text", "paragraph_index": 0, "text": "Updated"}],
+                "output_path": str(tmp_path / "edited.docx"),
+            },
+        )
+    assert track_change_warning in [str(warning.message) for warning in caught]
+    assert parsed_members == ["word/revisions.xml"]  # served from the memo
+
+    with zipfile.ZipFile(source, mode="a") as archive:
+        archive.writestr("word/box.xml", '<root><txbxContent/></root>')
+    assert len(word_ops.read(source)["warnings"]) == 2
+    assert parsed_members[1:] == ["word/revisions.xml", "word/box.xml"]
+
+
+
 def test_edit_honors_output_path_and_applies_supported_operations(tmp_path: Path) -> None:
     source = _create_sample_docx(tmp_path / "sample.docx")
     output_path = tmp_path / "edited" / "result.docx"